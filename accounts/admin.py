@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from unfold.admin import ModelAdmin, TabularInline
+from core.pagination import EstimatedCountPaginator
 from .models import User, Profile, Achievement, UserAchievement
 
 class ProfileInline(TabularInline):
@@ -29,11 +30,17 @@ class UserAdmin(BaseUserAdmin, ModelAdmin):
 
 @admin.register(Profile)
 class ProfileAdmin(ModelAdmin):
+    """Admin for profiles, built for millions of rows like TakenQuizAdmin."""
     list_display = ("user", "level", "quizzes_taken", "total_score")
+    list_select_related = ("user",)
+    autocomplete_fields = ("user",)
+    search_fields = ("user__username", "user__email")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 @admin.register(Achievement)
 class AchievementAdmin(ModelAdmin):
-    list_display = ("name", "badge_type")
+    list_display = ("name", "code", "badge_type")
 
 @admin.register(UserAchievement)
 class UserAchievementAdmin(ModelAdmin):
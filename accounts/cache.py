@@ -0,0 +1,64 @@
+from django.core.cache import cache
+
+from core.cache import bump_version, get_versions
+
+from .models import Achievement
+
+# Bumped by changes affecting every profile at once: Achievement edits (any
+# profile may embed a badge) and bulk statistics jobs.
+PROFILES_VERSION = "profiles"
+ACHIEVEMENT_IDS_KEY = "achievement-ids"
+
+PAYLOAD_KEY_PREFIX = "public-profile"
+# Stale versions are never read again, so let them age out.
+PAYLOAD_TIMEOUT = 60 * 60 * 24
+
+
+def profile_version_name(username):
+    """Version name bumped by changes to a user's public profile."""
+    return f"profile:{username}"
+
+
+def get_profile_versions(username):
+    """Return the (all profiles, profile) version pair a public profile depends on."""
+    name = profile_version_name(username)
+    versions = get_versions(PROFILES_VERSION, name)
+    return versions[PROFILES_VERSION], versions[name]
+
+
+def invalidate_profile(username):
+    """Invalidate validators and cached renderings of a user's profile."""
+    bump_version(profile_version_name(username))
+
+
+def _payload_key(username, versions, base_url):
+    profiles_version, profile_version = versions
+    return f"{PAYLOAD_KEY_PREFIX}:{username}:{profiles_version}:{profile_version}:{base_url}"
+
+
+def get_profile_payload(username, versions, base_url=""):
+    """Return the rendered JSON bytes of a public profile, or None on a cache miss."""
+    return cache.get(_payload_key(username, versions, base_url))
+
+
+def set_profile_payload(username, versions, payload, base_url=""):
+    """Store the rendered JSON bytes of a public profile under its versions."""
+    cache.set(_payload_key(username, versions, base_url), payload, PAYLOAD_TIMEOUT)
+
+
+def invalidate_all_profiles():
+    """Invalidate every profile, e.g. after an achievement or a bulk update changes."""
+    bump_version(PROFILES_VERSION)
+
+
+def get_achievement_ids():
+    """Map each rule code to its Achievement id, cached until an achievement changes."""
+    ids = cache.get(ACHIEVEMENT_IDS_KEY)
+    if ids is None:
+        ids = dict(Achievement.objects.filter(code__isnull=False).values_list('code', 'id'))
+        cache.set(ACHIEVEMENT_IDS_KEY, ids, None)
+    return ids
+
+
+def invalidate_achievement_ids():
+    cache.delete(ACHIEVEMENT_IDS_KEY)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='wins',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
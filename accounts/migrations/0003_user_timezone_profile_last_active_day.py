@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:16
+
+import accounts.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_profile_wins'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='last_active_day',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='timezone',
+            field=models.CharField(default='UTC', max_length=63, validators=[accounts.models.validate_timezone]),
+        ),
+    ]
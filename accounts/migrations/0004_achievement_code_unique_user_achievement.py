@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:25
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def drop_duplicate_awards(apps, schema_editor):
+    """Keep only the earliest award of each achievement per user."""
+    UserAchievement = apps.get_model('accounts', 'UserAchievement')
+    first_awards = UserAchievement.objects.values('user_id', 'achievement_id').annotate(first=Min('id'))
+    UserAchievement.objects.exclude(id__in=first_awards.values('first')).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_timezone_profile_last_active_day'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='achievement',
+            name='code',
+            field=models.SlugField(blank=True, null=True, unique=True),
+        ),
+        migrations.RunPython(drop_duplicate_awards, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='userachievement',
+            constraint=models.UniqueConstraint(fields=('user', 'achievement'), name='unique_user_achievement'),
+        ),
+    ]
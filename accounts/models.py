@@ -1,7 +1,25 @@
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractUser
+from django.core.exceptions import ValidationError
 from django.db import models
 
+
+def validate_timezone(value):
+    """Accept only IANA timezone names, e.g. "Asia/Baku"."""
+    if value not in available_timezones():
+        raise ValidationError(f"'{value}' is not a known timezone.")
+
+
+def get_zone(name):
+    """Return the tzinfo for an IANA timezone name, falling back to UTC."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
+
+
 class UserManager(BaseUserManager):
     """Custom user manager where email is the unique identifier for authentication instead of usernames."""
 
@@ -29,6 +47,8 @@ class User(AbstractUser):
     avatar = models.ImageField(upload_to='avatars/', null=True, blank=True)
     is_verified = models.BooleanField(default=False)
     bio = models.TextField(max_length=500, blank=True)
+    timezone = models.CharField(max_length=63, default="UTC", validators=[validate_timezone]) # IANA name, for day-based stats
+    token_version = models.PositiveIntegerField(default=0, editable=False) # Bumped to revoke every issued JWT
     
     
     date_joined = models.DateTimeField(auto_now_add=True) 
@@ -38,6 +58,35 @@ class User(AbstractUser):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the loaded username so a rename can invalidate the old profile
+        URL, and the credentials so changing them can revoke issued tokens.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_username = instance.__dict__.get("username")
+        instance._loaded_password = instance.__dict__.get("password")
+        instance._loaded_is_active = instance.__dict__.get("is_active")
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Revoke issued tokens when the password changes or the user is deactivated."""
+        password_changed = getattr(self, '_loaded_password', self.password) != self.password
+        deactivated = getattr(self, '_loaded_is_active', False) and not self.is_active
+        if password_changed or deactivated:
+            self.token_version += 1
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'token_version'}
+        super().save(*args, **kwargs)
+        self._loaded_password = self.password
+        self._loaded_is_active = self.is_active
+
+    @property
+    def tzinfo(self):
+        """The user's timezone as a tzinfo object."""
+        return get_zone(self.timezone)
+
     def __str__(self):
         return self.username
     
@@ -50,9 +99,11 @@ class Profile(models.Model):
     # Game Statistics
     quizzes_taken = models.PositiveIntegerField(default=0)
     total_score = models.FloatField(default=0.0)
+    wins = models.PositiveIntegerField(default=0) # Completed quizzes scored at least 50%
     win_rate = models.FloatField(default=0.0)
     current_streak = models.PositiveIntegerField(default=0)
     highest_streak = models.PositiveIntegerField(default=0)
+    last_active_day = models.DateField(null=True, blank=True) # Local day of the last completed quiz
     completion_rate = models.FloatField(default=0.0)
     time_played = models.DurationField(null=True, blank=True)
 
@@ -66,6 +117,8 @@ class Profile(models.Model):
 
 class Achievement(models.Model):
     """Model to represent achievements in the game."""
+    # Links the badge to the rule that awards it (see quizzes.achievements).
+    code = models.SlugField(max_length=50, unique=True, null=True, blank=True)
     name = models.CharField(max_length=100)
     description = models.TextField()
     badge_type = models.CharField(max_length=20) # rare, epic, uncommon
@@ -75,4 +128,9 @@ class UserAchievement(models.Model):
     """Model to link users with their earned achievements."""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='achievements')
     achievement = models.ForeignKey(Achievement, on_delete=models.CASCADE)
-    earned_at = models.DateTimeField(auto_now_add=True)
\ No newline at end of file
+    earned_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'achievement'], name='unique_user_achievement'),
+        ]
\ No newline at end of file
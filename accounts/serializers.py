@@ -58,7 +58,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
         model = User
         fields = [
             'id', 'username', 'email', 'avatar', 'is_verified', 
-            'bio', 'date_joined', 'profile', 'earned_achievements'
+            'bio', 'timezone', 'date_joined', 'profile', 'earned_achievements'
         ]
 
 
@@ -1,10 +1,39 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from .models import User, Profile
+from .models import User, Profile, Achievement, UserAchievement
+from .cache import invalidate_achievement_ids, invalidate_all_profiles, invalidate_profile
+from core.authentication import forget_user
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     """Signal to create Profile when a new User is created."""
 
     if created:
-        Profile.objects.create(user=instance)
\ No newline at end of file
+        Profile.objects.create(user=instance)
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_profile(sender, instance, **kwargs):
+    """Invalidate the public profile (including under a previous username) and cached auth records when the user changes."""
+
+    invalidate_profile(instance.username)
+    forget_user(instance.pk)
+    loaded_username = getattr(instance, '_loaded_username', None)
+    if loaded_username and loaded_username != instance.username:
+        invalidate_profile(loaded_username)
+
+
+@receiver([post_save, post_delete], sender=Profile)
+@receiver([post_save, post_delete], sender=UserAchievement)
+def invalidate_related_profile(sender, instance, **kwargs):
+    """Invalidate the public profile when its stats or badges change."""
+
+    invalidate_profile(instance.user.username)
+
+
+@receiver([post_save, post_delete], sender=Achievement)
+def invalidate_achievement_profiles(sender, instance, **kwargs):
+    """Invalidate every profile when an achievement definition changes."""
+
+    invalidate_all_profiles()
+    invalidate_achievement_ids()
@@ -1,7 +1,7 @@
 import pytest
 from django.urls import reverse
 from rest_framework import status
-from accounts.models import Achievement
+from accounts.models import Achievement, UserAchievement
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -105,7 +105,7 @@ class TestAccountViews:
         
         response = api_client.get(url)
         
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_update_my_profile_patch(self, api_client, active_user):
         """Test that a user can partially update their bio via PATCH."""
@@ -142,7 +142,7 @@ class TestAccountViews:
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
-        assert response.data['username'] == "otheruser"
+        assert response.json()['username'] == "otheruser"
 
     def test_list_achievements(self, api_client):
         """Test that anyone can list all available achievements."""
@@ -153,5 +153,74 @@ class TestAccountViews:
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) >= 1
-        assert response.data[0]['name'] == "First Win"
+        assert "First Win" in [achievement['name'] for achievement in response.data]
+
+
+
+@pytest.mark.django_db
+class TestPublicProfileConditionalGet:
+
+    def test_profile_not_modified_until_bio_changes(self, api_client, active_user, django_capture_on_commit_callbacks):
+        url = reverse('public-profile', kwargs={'username': active_user.username, 'version': 'v1'})
+        etag = api_client.get(url)['ETag']
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        with django_capture_on_commit_callbacks(execute=True):
+            active_user.bio = "Changed"
+            active_user.save()
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['bio'] == "Changed"
+
+    def test_new_badge_invalidates_profile(self, api_client, active_user, sample_achievement,
+                                           django_capture_on_commit_callbacks):
+        url = reverse('public-profile', kwargs={'username': active_user.username, 'version': 'v1'})
+        etag = api_client.get(url)['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            UserAchievement.objects.create(user=active_user, achievement=sample_achievement)
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestPublicProfileCache:
+
+    def test_hot_profile_needs_no_queries(self, api_client, active_user, django_assert_num_queries):
+        url = reverse('public-profile', kwargs={'username': active_user.username, 'version': 'v1'})
+        first = api_client.get(url)
+
+        with django_assert_num_queries(0):
+            second = api_client.get(url)
+
+        assert second.content == first.content
+
+    def test_stats_and_badges_refresh_the_payload(self, api_client, active_user, sample_achievement,
+                                                  django_capture_on_commit_callbacks):
+        url = reverse('public-profile', kwargs={'username': active_user.username, 'version': 'v1'})
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            active_user.profile.level = 4
+            active_user.profile.save()
+            UserAchievement.objects.create(user=active_user, achievement=sample_achievement)
+
+        data = api_client.get(url).json()
+        assert data['profile']['level'] == 4
+        assert [badge['achievement']['name'] for badge in data['earned_achievements']] == ["Quiz Master"]
+
+    def test_renamed_achievement_refreshes_every_payload(self, api_client, active_user, sample_achievement,
+                                                         django_capture_on_commit_callbacks):
+        url = reverse('public-profile', kwargs={'username': active_user.username, 'version': 'v1'})
+        UserAchievement.objects.create(user=active_user, achievement=sample_achievement)
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            sample_achievement.name = "Grand Master"
+            sample_achievement.save()
 
+        assert api_client.get(url).json()['earned_achievements'][0]['achievement']['name'] == "Grand Master"
@@ -1,6 +1,6 @@
 from django.urls import path
-from rest_framework_simplejwt.views import  TokenRefreshView
 from accounts.views import (CustomTokenObtainPairView,
+                             CustomTokenRefreshView,
                              RegisterView,
                                MyProfileView,
                                  PublicProfileView,
@@ -10,7 +10,7 @@ urlpatterns = [
     # Auth
     path('register/', RegisterView.as_view(), name='register'),
     path('login/', CustomTokenObtainPairView.as_view(), name='login'),
-    path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('token/refresh/', CustomTokenRefreshView.as_view(), name='token_refresh'),
     
     # My profile
     path('me/', MyProfileView.as_view(), name='my-profile'),
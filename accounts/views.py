@@ -1,12 +1,25 @@
+from django.db.models import Prefetch, prefetch_related_objects
+from django.http import HttpResponse
 from rest_framework import generics, status, permissions
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.renderers import JSONRenderer
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
-from accounts.models import User, Achievement
+from accounts.models import User, Achievement, UserAchievement
 from accounts.serializers import UserProfileSerializer, RegisterSerializer, AchievementSerializer
+from accounts.cache import get_profile_payload, get_profile_versions, set_profile_payload
+from core.conditional import ConditionalGetMixin
+from core.fast_serializers import ValuesListMixin, ValuesSerializer
 from core.permissions import IsOwnerOrReadOnly
-from rest_framework_simplejwt.views import TokenObtainPairView
+from core.throttling import AnonSlidingWindowThrottle, SlidingWindowThrottle
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+# The endpoint's own scope, plus a per-IP limit shared by all unauthenticated auth endpoints.
+AUTH_THROTTLES = (SlidingWindowThrottle, AnonSlidingWindowThrottle)
+
+# Everything UserProfileSerializer reads, in a fixed number of queries.
+PROFILE_RELATED = ('profile', Prefetch('achievements', queryset=UserAchievement.objects.select_related('achievement')))
 
 
 class RegisterView(generics.CreateAPIView):
@@ -15,6 +28,8 @@ class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     permission_classes = (AllowAny,)
     serializer_class = RegisterSerializer
+    throttle_classes = AUTH_THROTTLES
+    throttle_scope = 'register'
 
     @swagger_auto_schema(
             operation_summary="Register a new user", 
@@ -37,12 +52,20 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     User login (Login) endpoint.
     Email and password are sent to return 'access' and 'refresh' tokens.
     """
+    throttle_classes = AUTH_THROTTLES
+    throttle_scope = 'login'
+
     @swagger_auto_schema(
         operation_summary="User login (Login)",
         operation_description="Email and password are sent to return 'access' and 'refresh' tokens."
     )
     def post(self, request, *args, **kwargs):
         return super().post(request, *args, **kwargs)
+
+
+class CustomTokenRefreshView(TokenRefreshView):
+    """Exchanges a refresh token for a new access token."""
+    throttle_classes = AUTH_THROTTLES
     
 
 class MyProfileView(generics.RetrieveUpdateAPIView):
@@ -54,8 +77,16 @@ class MyProfileView(generics.RetrieveUpdateAPIView):
 
     def get_object(self):
         # For the authenticated user, return their own profile.
-        # request.user is the authenticated user instance.
-        return self.request.user
+        # request.user may be rebuilt from the auth record cache
+        # (core.authentication), which can be stale; saving it would write
+        # back an old password and token version, so updates load the row.
+        user = self.request.user
+        if self.request.method not in permissions.SAFE_METHODS:
+            user = User.objects.filter(pk=user.pk, is_active=True).first()
+            if user is None or user.token_version != self.request.user.token_version:
+                raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+        prefetch_related_objects([user], *PROFILE_RELATED)
+        return user
 
     @swagger_auto_schema(operation_summary="Get personal profile information")
     def get(self, request, *args, **kwargs):
@@ -70,27 +101,47 @@ class MyProfileView(generics.RetrieveUpdateAPIView):
         return Response(status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
-class PublicProfileView(generics.RetrieveAPIView):
+class PublicProfileView(ConditionalGetMixin, generics.RetrieveAPIView):
     """
     View for retrieving public profiles of users by username.
     For example: /api/v1/accounts/profile/user99/
+    The rendered JSON is cached per user under the profile versions, so a
+    cache hit skips the ORM and the serializer. Supports conditional GET.
     """
-    queryset = User.objects.all()
+    queryset = User.objects.select_related('profile').prefetch_related(*PROFILE_RELATED[1:])
     serializer_class = UserProfileSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     lookup_field = 'username'
 
+    def get_validator_versions(self):
+        return get_profile_versions(self.kwargs['username'])
+
+    def retrieve(self, request, *args, **kwargs):
+        username = self.kwargs['username']
+        # Avatar and badge URLs are absolute, so the host is part of the cached content.
+        base_url = request.build_absolute_uri('/')
+        versions = get_profile_versions(username)
+
+        payload = get_profile_payload(username, versions, base_url)
+        if payload is None:
+            serializer = self.get_serializer(self.get_object())
+            payload = JSONRenderer().render(serializer.data)
+            set_profile_payload(username, versions, payload, base_url)
+
+        return HttpResponse(payload, content_type='application/json')
+
     @swagger_auto_schema(operation_summary="View public profile")
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
 
-class AchievementListView(generics.ListAPIView):
+class AchievementListView(ValuesListMixin, generics.ListAPIView):
     """
     View for listing all achievements.
     """
     queryset = Achievement.objects.all()
     serializer_class = AchievementSerializer
+    values_serializer = ValuesSerializer(AchievementSerializer)
     permission_classes = [permissions.AllowAny]
 
     @swagger_auto_schema(operation_summary="List all achievements")
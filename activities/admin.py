@@ -1,3 +1,13 @@
 from django.contrib import admin
+from unfold.admin import ModelAdmin
+from .models import Activity
 
-# Register your models here.
+
+@admin.register(Activity)
+class ActivityAdmin(ModelAdmin):
+    list_display = ("user", "activity_type", "description", "created_at")
+    list_filter = ("activity_type",)
+    list_select_related = ("user",)
+    raw_id_fields = ("user",)
+    # Counting a very large table on every changelist page is too slow.
+    show_full_result_count = False
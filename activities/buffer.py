@@ -0,0 +1,134 @@
+"""
+Buffered activity writes.
+
+Activities are appended to an in-process buffer and written with one
+bulk_create per batch, so recording one costs the request no queries. A
+batch is flushed when it reaches `FLUSH_SIZE` rows, `FLUSH_INTERVAL` seconds
+after its first row was queued (by a timer thread, or when a request
+finishes with stale rows), and at process exit. A crashed worker loses at
+most one unflushed batch, which is acceptable for a feed.
+
+A batch mixes the activities of many users, and is written long after
+they were queued, so flushing never raises: rows of users deleted in the
+meantime are dropped, and if a batch still fails its rows are retried one
+by one and the failures logged.
+"""
+import atexit
+import logging
+import threading
+import time
+
+from django.db import IntegrityError, connection, transaction
+
+from accounts.models import User
+
+from .models import Activity
+
+logger = logging.getLogger(__name__)
+
+FLUSH_SIZE = 200
+FLUSH_INTERVAL = 5.0  # seconds
+BATCH_SIZE = 1000
+
+
+class ActivityBuffer:
+    """A thread-safe buffer of unsaved Activity instances."""
+
+    def __init__(self, flush_size=FLUSH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending = []
+        self._oldest = None
+        self._timer = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def extend(self, activities):
+        """Queue activities, flushing if the buffer is full."""
+        with self._lock:
+            if not self._pending:
+                self._oldest = time.monotonic()
+                self._start_timer()
+            self._pending.extend(activities)
+            full = len(self._pending) >= self.flush_size
+        if full:
+            self.flush()
+
+    def is_stale(self):
+        oldest = self._oldest
+        return bool(self._pending) and time.monotonic() - oldest >= self.flush_interval
+
+    def flush(self):
+        """Write every queued activity. Returns the number written."""
+        with self._lock:
+            pending, self._pending, self._oldest = self._pending, [], None
+            self._cancel_timer()
+        return sum(write_activities(pending[start:start + BATCH_SIZE]) for start in range(0, len(pending), BATCH_SIZE))
+
+    def clear(self):
+        """Drop queued activities without writing them."""
+        with self._lock:
+            self._pending, self._oldest = [], None
+            self._cancel_timer()
+
+    def _start_timer(self):
+        self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush_on_timer(self):
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Could not flush buffered activities")
+        finally:
+            # The timer thread's connection would otherwise stay open.
+            connection.close()
+
+
+def write_activities(activities):
+    """
+    Insert a batch of activities, skipping those of deleted users and
+    retrying the rest row by row if the batch fails. Returns the number written.
+    """
+    existing = set(User.objects.filter(id__in={a.user_id for a in activities}).values_list('id', flat=True))
+    rows = [a for a in activities if a.user_id in existing]
+    if len(rows) < len(activities):
+        logger.info("Dropped %d buffered activities of deleted users", len(activities) - len(rows))
+    if not rows:
+        return 0
+
+    try:
+        with transaction.atomic():
+            Activity.objects.bulk_create(rows)
+        return len(rows)
+    except IntegrityError:
+        logger.warning("Could not write a batch of %d activities; retrying row by row", len(rows), exc_info=True)
+
+    written = 0
+    for row in rows:
+        try:
+            with transaction.atomic():
+                row.save(force_insert=True)
+            written += 1
+        except IntegrityError:
+            logger.warning("Could not write activity %r of user %s", row.description, row.user_id, exc_info=True)
+    return written
+
+
+activity_buffer = ActivityBuffer()
+atexit.register(activity_buffer.flush)
+
+
+def record_activities(activities):
+    """Queue activities for writing once the current transaction commits."""
+    activities = list(activities)
+    if activities:
+        transaction.on_commit(lambda: activity_buffer.extend(activities))
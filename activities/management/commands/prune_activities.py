@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from activities.retention import PRUNE_BATCH_SIZE, RETENTION_DAYS, prune_activities
+
+
+class Command(BaseCommand):
+    help = "Delete activities older than the retention period. Run daily."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=RETENTION_DAYS, help="Keep this many days of activity.")
+        parser.add_argument('--batch-size', type=int, default=PRUNE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        pruned = prune_activities(days=options['days'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} activities."))
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Activity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activity_type', models.CharField(choices=[('QUIZ_COMPLETED', 'Quiz Completed'), ('ACHIEVEMENT_EARNED', 'Achievement Earned'), ('LEVEL_UP', 'Level Up')], max_length=50)),
+                ('description', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activities', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['-created_at', '-id'], name='activity_feed_idx'), models.Index(fields=['user', '-created_at', '-id'], name='activity_user_feed_idx')],
+            },
+        ),
+    ]
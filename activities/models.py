@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from accounts.models import User
 
 # Create your models here.
@@ -17,8 +18,15 @@ class Activity(models.Model):
     # For storing additional details about the activity
     description = models.CharField(max_length=255) 
     
-    # Timestamp of the activity
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Timestamp of the activity. Set when it happens, not when a buffered
+    # batch is written (see activities.buffer).
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
-        ordering = ['-created_at'] # Latest activities first
\ No newline at end of file
+        ordering = ['-created_at', '-id'] # Latest activities first
+        indexes = [
+            # Keyset pagination of the global feed and retention pruning.
+            models.Index(fields=['-created_at', '-id'], name='activity_feed_idx'),
+            # Keyset pagination of a single user's feed.
+            models.Index(fields=['user', '-created_at', '-id'], name='activity_user_feed_idx'),
+        ]
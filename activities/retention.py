@@ -0,0 +1,30 @@
+"""
+Activity retention.
+
+Feeds only ever show recent activity, so rows older than `RETENTION_DAYS`
+are deleted by the prune_activities command (run daily). Deletes go in
+short batches located through the (created_at, id) index, so pruning a
+large backlog never holds long locks or one huge transaction.
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .models import Activity
+
+RETENTION_DAYS = 90
+PRUNE_BATCH_SIZE = 5000
+
+
+def prune_activities(days=RETENTION_DAYS, batch_size=PRUNE_BATCH_SIZE, now=None):
+    """Delete activities older than `days`. Returns the number deleted."""
+    cutoff = (now or timezone.now()) - timedelta(days=days)
+    expired = Activity.objects.filter(created_at__lt=cutoff).order_by().values_list('id', flat=True)
+
+    pruned = 0
+    while True:
+        ids = list(expired[:batch_size])
+        if not ids:
+            return pruned
+        deleted, _ = Activity.objects.filter(pk__in=ids).delete()
+        pruned += deleted
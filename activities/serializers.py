@@ -0,0 +1,12 @@
+from rest_framework import serializers
+from activities.models import Activity
+
+
+class ActivitySerializer(serializers.ModelSerializer):
+    """ Serializer for a feed entry """
+
+    username = serializers.ReadOnlyField(source='user.username')
+
+    class Meta:
+        model = Activity
+        fields = ['id', 'username', 'activity_type', 'description', 'created_at']
@@ -1,16 +1,46 @@
-# signals.py
+from django.core.signals import request_finished
 from django.dispatch import receiver
+from activities.buffer import activity_buffer, record_activities
 from activities.models import Activity
-from quizzes.models import TakenQuiz
-from django.db.models.signals import post_save
-
-@receiver(post_save, sender=TakenQuiz)
-def track_quiz_activity(sender, instance, created, **kwargs):
-    """Signal to track quiz completion activity."""
-    
-    if created:
-        Activity.objects.create(
-            user=instance.student,
+from accounts.models import Achievement
+from quizzes.achievements import achievements_earned
+from quizzes.signals import quiz_completed
+
+
+@receiver(quiz_completed)
+def track_quiz_activity(sender, attempts, **kwargs):
+    """Queue a feed entry for each completed quiz."""
+
+    record_activities(
+        Activity(
+            user_id=attempt.user_id,
             activity_type=Activity.ActivityType.QUIZ_COMPLETED,
-            description=f"Completed '{instance.quiz.title}' with a score of {instance.score}%"
-        )
\ No newline at end of file
+            description=f"Completed '{attempt.quiz.title}' with a score of {attempt.score:.0f}%",
+            created_at=attempt.completed_at,
+        )
+        for attempt in attempts
+    )
+
+
+@receiver(achievements_earned)
+def track_achievement_activity(sender, awards, **kwargs):
+    """Queue a feed entry for each newly earned achievement."""
+
+    names = dict(Achievement.objects.filter(id__in={award.achievement_id for award in awards}).values_list('id', 'name'))
+    record_activities(
+        Activity(
+            user_id=award.user_id,
+            activity_type=Activity.ActivityType.ACHIEVEMENT_EARNED,
+            description=f"Earned '{names[award.achievement_id]}'",
+            created_at=award.earned_at,
+        )
+        for award in awards
+    )
+
+
+@receiver(request_finished)
+def flush_stale_activities(sender, **kwargs):
+    """Write buffered activities that have waited too long for a full batch."""
+
+    if activity_buffer.is_stale():
+        activity_buffer.flush()
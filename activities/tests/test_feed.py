@@ -0,0 +1,174 @@
+import io
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from activities.buffer import ActivityBuffer, activity_buffer
+from activities.models import Activity
+from activities.retention import prune_activities
+from quizzes.models import Quiz, TakenQuiz
+
+
+@pytest.fixture
+def users(db):
+    return [User.objects.create_user(email=f"a{i}@example.com", username=f"active{i}") for i in range(2)]
+
+
+def activity(user, description, age=timedelta(0)):
+    return Activity(
+        user=user,
+        activity_type=Activity.ActivityType.LEVEL_UP,
+        description=description,
+        created_at=timezone.now() - age,
+    )
+
+
+def url(name):
+    return reverse(name, kwargs={'version': 'v1'})
+
+
+@pytest.mark.django_db
+class TestActivityBuffer:
+
+    def test_completed_quiz_is_buffered_until_commit(self, users, django_capture_on_commit_callbacks):
+        quiz = Quiz.objects.create(title="Bio")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            TakenQuiz.objects.create(user=users[0], quiz=quiz, score=75.0, started_at=timezone.now())
+
+        # The attempt also earns "First Steps".
+        assert len(activity_buffer) == 2
+        assert not Activity.objects.exists()
+        assert activity_buffer.flush() == 2
+        completed = Activity.objects.get(activity_type=Activity.ActivityType.QUIZ_COMPLETED)
+        assert completed.description == "Completed 'Bio' with a score of 75%"
+
+    def test_flushes_a_full_batch_in_one_insert(self, users, django_assert_num_queries):
+        buffer = ActivityBuffer(flush_size=3)
+        buffer.extend([activity(users[0], "one"), activity(users[0], "two")])
+        assert not Activity.objects.exists()
+
+        # A savepoint around one user lookup and one INSERT.
+        with django_assert_num_queries(4) as captured:
+            buffer.extend([activity(users[1], "three")])
+        assert sum(query['sql'].startswith('INSERT') for query in captured.captured_queries) == 1
+
+        assert Activity.objects.count() == 3
+        assert len(buffer) == 0
+
+    def test_drops_activities_of_deleted_users(self, users):
+        gone = User.objects.create_user(email="gone@example.com", username="gone")
+        buffer = ActivityBuffer()
+        buffer.extend([activity(users[0], "kept"), activity(gone, "dropped")])
+        gone.delete()
+
+        assert buffer.flush() == 1
+        assert list(Activity.objects.values_list('description', flat=True)) == ["kept"]
+
+    def test_failed_batch_is_retried_row_by_row(self, users, caplog):
+        existing = Activity.objects.create(user=users[0], activity_type=Activity.ActivityType.LEVEL_UP, description="old")
+        clash = activity(users[1], "clash")
+        clash.pk = existing.pk
+        buffer = ActivityBuffer()
+        buffer.extend([activity(users[0], "one"), clash, activity(users[1], "two")])
+
+        assert buffer.flush() == 2
+        assert set(Activity.objects.values_list('description', flat=True)) == {"old", "one", "two"}
+        assert "Could not write activity 'clash'" in caplog.text
+
+    def test_clear_cancels_the_flush_timer(self, users):
+        buffer = ActivityBuffer(flush_interval=0.05)
+        buffer.extend([activity(users[0], "dropped")])
+        buffer.clear()
+
+        time.sleep(0.2)
+        assert not Activity.objects.exists()
+
+    def test_staleness(self, users):
+        buffer = ActivityBuffer(flush_interval=0)
+        assert not buffer.is_stale()
+
+        buffer.extend([activity(users[0], "waiting")])
+
+        assert buffer.is_stale()
+
+    def test_keeps_the_time_the_activity_happened(self, users):
+        happened = activity(users[0], "earlier", age=timedelta(minutes=3))
+
+        activity_buffer.extend([happened])
+        activity_buffer.flush()
+
+        assert Activity.objects.get().created_at == happened.created_at
+
+
+@pytest.mark.django_db(transaction=True)
+def test_flushes_on_a_timer(users):
+    buffer = ActivityBuffer(flush_interval=0.05)
+    flushed = threading.Event()
+    flush = buffer.flush
+    buffer.flush = lambda: (flush(), flushed.set())
+    buffer.extend([activity(users[0], "idle")])
+
+    assert flushed.wait(timeout=5)
+    assert Activity.objects.get().description == "idle"
+    assert len(buffer) == 0
+
+
+@pytest.mark.django_db
+class TestActivityFeeds:
+
+    def test_global_feed_pages_newest_first(self, users):
+        Activity.objects.bulk_create(
+            activity(users[i % 2], f"#{i}", age=timedelta(minutes=10 - i)) for i in range(5)
+        )
+        client = APIClient()
+
+        first = client.get(url('activity-feed'), {'page_size': 3})
+        second = client.get(first.data['next'])
+
+        assert first.status_code == status.HTTP_200_OK
+        assert [row['description'] for row in first.data['results']] == ["#4", "#3", "#2"]
+        assert first.data['results'][0]['username'] == "active0"
+        assert [row['description'] for row in second.data['results']] == ["#1", "#0"]
+
+    def test_my_feed_only_has_my_activity(self, users):
+        Activity.objects.bulk_create([activity(users[0], "mine"), activity(users[1], "theirs")])
+        client = APIClient()
+        client.force_authenticate(user=users[0])
+
+        response = client.get(url('my-activity-feed'))
+
+        assert [row['description'] for row in response.data['results']] == ["mine"]
+
+    def test_my_feed_requires_login(self, db):
+        assert APIClient().get(url('my-activity-feed')).status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestRetention:
+
+    def test_prunes_in_batches(self, users):
+        Activity.objects.bulk_create(
+            [activity(users[0], "old", age=timedelta(days=100)) for _ in range(5)]
+            + [activity(users[0], "recent", age=timedelta(days=1))]
+        )
+
+        assert prune_activities(days=90, batch_size=2) == 5
+        assert list(Activity.objects.values_list('description', flat=True)) == ["recent"]
+
+    def test_command(self, users):
+        Activity.objects.bulk_create([activity(users[0], "old", age=timedelta(days=10))])
+        output = io.StringIO()
+
+        call_command('prune_activities', '--days', '7', stdout=output)
+
+        assert "Pruned 1 activities." in output.getvalue()
+        assert not Activity.objects.exists()
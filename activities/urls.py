@@ -0,0 +1,7 @@
+from django.urls import path
+from activities.views import ActivityFeedView, MyActivityFeedView
+
+urlpatterns = [
+    path('', ActivityFeedView.as_view(), name='activity-feed'),
+    path('me/', MyActivityFeedView.as_view(), name='my-activity-feed'),
+]
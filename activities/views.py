@@ -1,3 +1,36 @@
-from django.shortcuts import render
+from rest_framework import generics, permissions
+from drf_yasg.utils import swagger_auto_schema
+from activities.models import Activity
+from activities.serializers import ActivitySerializer
+from core.fast_serializers import ValuesListMixin, ValuesSerializer
+from core.pagination import KeysetPagination
 
-# Create your views here.
+
+class ActivityFeedView(ValuesListMixin, generics.ListAPIView):
+    """
+    Global activity feed, newest first.
+    Keyset-paginated on the (created_at, id) index, so every page costs the
+    same however large the table grows.
+    """
+    queryset = Activity.objects.select_related('user')
+    serializer_class = ActivitySerializer
+    values_serializer = ValuesSerializer(ActivitySerializer)
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-created_at', '-id')
+
+    @swagger_auto_schema(operation_summary="Global activity feed")
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+class MyActivityFeedView(ActivityFeedView):
+    """The authenticated user's own activity, newest first."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return super().get_queryset().filter(user=self.request.user)
+
+    @swagger_auto_schema(operation_summary="My activity feed")
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
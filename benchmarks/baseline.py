@@ -0,0 +1,141 @@
+"""
+Stored benchmark baselines and regression checks.
+
+Results are {label: {metric: value}}. Latency percentiles should come from
+several interleaved rounds (timing.measure_rounds) reduced by `best_of()`:
+the best round per percentile, which a slow spell of the machine leaves
+alone, together with its spread, how far the median round is behind the
+best one (a single outlier round does not move it).
+
+Storing a baseline calibrates each label from that spread. A metric
+regresses when it grows past its baseline by more than its tolerance (a
+fraction: 0.25 allows 25%) and by more than its noise floor (an absolute
+amount), where
+
+    tolerance = max(threshold, min(SPREAD_MARGIN * spread / baseline value, MAX_TOLERANCE))
+    noise floor = max(NOISE_FLOORS[metric], SPREAD_MARGIN * spread)
+
+so an endpoint that is noisy by nature gets the slack it needs and a steady
+one stays tightly gated. Query counts must not grow at all. Labels and
+metrics missing from the baseline are skipped, so a benchmark can be added
+before the baseline is refreshed.
+
+The whole machine can also run slower than when the baseline was stored.
+Benchmarks measure timing.reference_workload in the same rounds, under
+REFERENCE_LABEL (or "reference, <group>" for the labels "<name>, <group>"),
+and latency baselines are scaled by how much slower their reference ran;
+never down, as a faster reference mostly means a noisy baseline run.
+
+Environment:
+  BENCH_BASELINE           baseline file (default: benchmarks/baseline.json)
+  BENCH_THRESHOLD          least allowed growth (default: 0.25)
+  BENCH_UPDATE_BASELINE=1  store the results as the new baseline instead of comparing
+"""
+import json
+import os
+import statistics
+from pathlib import Path
+
+DEFAULT_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+LATENCY_METRICS = ("p50", "p95", "p99")
+# Growth below these absolute amounts is noise, whatever the percentage.
+NOISE_FLOORS = {"p50": 0.5, "p95": 1.0, "p99": 2.0, "alloc_kib": 16.0}
+# Calibrated tolerances and floors allow this many times the spread seen when the baseline was stored.
+SPREAD_MARGIN = 3.0
+# However noisy an endpoint, a calibrated tolerance never allows more growth than this.
+MAX_TOLERANCE = 1.0
+# Label of timing.reference_workload in results, optionally followed by ", <group>".
+REFERENCE_LABEL = "reference"
+# Metrics that may not grow at all.
+EXACT_METRICS = frozenset({"queries"})
+
+
+def best_of(rounds):
+    """
+    Reduce the measure() results of several rounds to the best round per
+    latency percentile. Returns (metrics, spread): spread is the median minus
+    the best round, per percentile.
+    """
+    metrics, spread = {}, {}
+    for metric in LATENCY_METRICS:
+        values = [measured[metric] for measured in rounds]
+        metrics[metric] = min(values)
+        spread[metric] = statistics.median(values) - min(values)
+    return metrics, spread
+
+
+def calibrate(results, spreads, threshold=DEFAULT_THRESHOLD):
+    """The baseline to store for `results`: each label's metrics with its tolerance and noise floor per metric."""
+    baseline = {}
+    for label, metrics in results.items():
+        spread = spreads.get(label, {})
+        tolerance, floor = {}, {}
+        for metric, value in metrics.items():
+            if metric not in NOISE_FLOORS:
+                continue
+            slack = SPREAD_MARGIN * spread.get(metric, 0.0)
+            tolerance[metric] = max(threshold, min(slack / value, MAX_TOLERANCE) if value else 0.0)
+            floor[metric] = max(NOISE_FLOORS[metric], slack)
+        baseline[label] = {**metrics, "tolerance": tolerance, "floor": floor}
+    return baseline
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return a message for each metric in `results` that regressed against `baseline`."""
+    regressions = []
+    for label, metrics in results.items():
+        if label.startswith(REFERENCE_LABEL):
+            continue
+        stored = baseline.get(label, {})
+        speed = machine_speed(reference_label(label), results, baseline)
+        for metric, value in metrics.items():
+            base = stored.get(metric)
+            if base is None:
+                continue
+            if metric in LATENCY_METRICS:
+                base *= speed
+            if metric in EXACT_METRICS:
+                regressed = value > base
+            elif metric in NOISE_FLOORS:
+                tolerance = max(threshold, stored.get("tolerance", {}).get(metric, threshold))
+                floor = stored.get("floor", {}).get(metric, NOISE_FLOORS[metric])
+                regressed = value > base * (1 + tolerance) and value - base > floor
+            else:
+                continue
+            if regressed:
+                regressions.append(f"{label} {metric}: {value:.3f} (baseline {base:.3f})")
+    return regressions
+
+
+def reference_label(label):
+    """The label of the reference workload measured alongside `label`."""
+    _, separator, group = label.rpartition(", ")
+    return f"{REFERENCE_LABEL}, {group}" if separator else REFERENCE_LABEL
+
+
+def machine_speed(reference, results, baseline):
+    """How much slower the `reference` workload ran than in the baseline, at least 1.0."""
+    current = results.get(reference, {}).get("p50")
+    stored = baseline.get(reference, {}).get("p50")
+    if not current or not stored:
+        return 1.0
+    return max(current / stored, 1.0)
+
+
+def check(name, results, spreads=None):
+    """
+    Compare the results of benchmark `name` with its stored baseline and
+    return the regressions. Stores the results, calibrated with `spreads`
+    ({label: best_of() spread}), instead when asked to or when there is no
+    baseline yet.
+    """
+    path = Path(os.environ.get("BENCH_BASELINE", DEFAULT_PATH))
+    stored = json.loads(path.read_text()) if path.exists() else {}
+    threshold = float(os.environ.get("BENCH_THRESHOLD", DEFAULT_THRESHOLD))
+
+    if os.environ.get("BENCH_UPDATE_BASELINE") == "1" or name not in stored:
+        stored[name] = calibrate(results, spreads or {}, threshold)
+        path.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        return []
+    return compare(results, stored[name], threshold)
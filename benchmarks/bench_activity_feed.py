@@ -0,0 +1,80 @@
+"""
+Activity feed reads as the table grows, and buffered vs row-at-a-time writes.
+
+Run explicitly: pytest benchmarks/bench_activity_feed.py -s
+"""
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from activities.buffer import ActivityBuffer
+from activities.models import Activity
+from benchmarks.timing import measure, report
+
+SIZES = (10_000, 100_000, 1_000_000)
+USERS = 1_000
+ITERATIONS = 100
+WRITES = 1_000
+
+
+def make_activity(user_id, i, start):
+    return Activity(
+        user_id=user_id,
+        activity_type=Activity.ActivityType.QUIZ_COMPLETED,
+        description=f"Completed quiz {i}",
+        created_at=start + timedelta(seconds=i),
+    )
+
+
+@pytest.mark.django_db
+def test_feed_latency_by_table_size():
+    users = User.objects.bulk_create(User(email=f"u{i}@example.com", username=f"user{i}") for i in range(USERS))
+    client = APIClient()
+    client.force_authenticate(user=users[0])
+    global_url = reverse('activity-feed', kwargs={'version': 'v1'})
+    my_url = reverse('my-activity-feed', kwargs={'version': 'v1'})
+    start = timezone.now() - timedelta(days=30)
+    rows = {}
+
+    created = 0
+    for size in SIZES:
+        Activity.objects.bulk_create(
+            (make_activity(users[i % USERS].id, i, start) for i in range(created, size)), batch_size=5_000
+        )
+        created = size
+        # A cursor half way down the global feed.
+        deep = client.get(global_url, {'page_size': 100})
+        for _ in range(10):
+            deep = client.get(deep.data['next'], {'page_size': 100})
+        deep_url = deep.data['next']
+
+        rows[f"global first page, {size}"] = measure(lambda: client.get(global_url), ITERATIONS)
+        rows[f"global deep page, {size}"] = measure(lambda: client.get(deep_url), ITERATIONS)
+        rows[f"my feed, {size}"] = measure(lambda: client.get(my_url), ITERATIONS)
+
+    report("Activity feed (ms)", rows)
+
+
+@pytest.mark.django_db
+def test_buffered_vs_direct_writes():
+    user = User.objects.create(email="writer@example.com", username="writer")
+    start = timezone.now()
+    buffer = ActivityBuffer()
+
+    def direct():
+        for i in range(WRITES):
+            make_activity(user.id, i, start).save()
+
+    def buffered():
+        for i in range(WRITES):
+            buffer.extend([make_activity(user.id, i, start)])
+        buffer.flush()
+
+    report(f"Writing {WRITES} activities (ms)", {
+        "one INSERT each": measure(direct, 5),
+        "buffered bulk_create": measure(buffered, 5),
+    })
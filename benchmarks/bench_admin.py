@@ -0,0 +1,58 @@
+"""
+TakenQuiz admin changelist latency as the table grows to 5M attempts:
+unfiltered, filtered by user, and a deep page.
+
+On Postgres, run ANALYZE first so the unfiltered count is estimated.
+Seeding 5M rows takes a few minutes.
+
+Run explicitly: pytest benchmarks/bench_admin.py -s
+"""
+import random
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import User
+from benchmarks.timing import measure, report
+from quizzes.models import Quiz, TakenQuiz
+
+SIZES = (100_000, 1_000_000, 5_000_000)
+USERS = 10_000
+QUIZZES = 1_000
+ITERATIONS = 20
+
+
+@pytest.mark.django_db
+def test_takenquiz_changelist_by_size(client):
+    admin = User.objects.create_superuser(email="admin@example.com", username="admin", password="pass12345")
+    client.force_login(admin)
+    users = User.objects.bulk_create(
+        (User(email=f"u{i}@example.com", username=f"user{i}") for i in range(USERS)), batch_size=5_000
+    )
+    quizzes = Quiz.objects.bulk_create(Quiz(title=f"Quiz {i}", description="") for i in range(QUIZZES))
+    url = reverse('admin:quizzes_takenquiz_changelist')
+    picks = random.Random(42)
+    now = timezone.now()
+    rows = {}
+
+    created = 0
+    for size in SIZES:
+        TakenQuiz.objects.bulk_create(
+            (
+                TakenQuiz(user=picks.choice(users), quiz=picks.choice(quizzes), started_at=now, score=50.0)
+                for _ in range(created, size)
+            ),
+            batch_size=10_000,
+        )
+        created = size
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {TakenQuiz._meta.db_table}")
+
+        rows[f"unfiltered, {size}"] = measure(lambda: client.get(url), ITERATIONS)
+        rows[f"by user, {size}"] = measure(lambda: client.get(url, {'user__id__exact': users[0].id}), ITERATIONS)
+        rows[f"page 50, {size}"] = measure(lambda: client.get(url, {'p': 50}), ITERATIONS)
+
+    report("TakenQuiz changelist (ms)", rows)
@@ -0,0 +1,58 @@
+"""
+Autosaving answers one question at a time vs submitting them all at once,
+by quiz length. Autosave latency is per save; submit latency is per attempt.
+
+Run explicitly: pytest benchmarks/bench_autosave.py -s
+"""
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from benchmarks.timing import measure, report
+from quizzes.models import Choice, Question, Quiz, TakenQuiz
+from quizzes.views import AttemptAnswersView, TakenQuizCreateView
+
+QUESTIONS = (10, 50)
+ITERATIONS = 100
+
+
+@pytest.mark.django_db
+def test_autosave_vs_submit(monkeypatch):
+    # Measure the endpoints, not the rate limits.
+    monkeypatch.setattr(AttemptAnswersView, 'throttle_classes', [])
+    monkeypatch.setattr(TakenQuizCreateView, 'throttle_classes', [])
+    client = APIClient()
+    user = User.objects.create_user(email="bench@example.com", username="bench")
+    client.force_authenticate(user=user)
+    submit_url = reverse('quiz-submit', kwargs={'version': 'v1'})
+    rows = {}
+
+    for count in QUESTIONS:
+        quiz = Quiz.objects.create(title=f"Quiz {count}", time_limit_minutes=60)
+        questions = Question.objects.bulk_create(Question(quiz=quiz, text=f"Q{i}", order=i) for i in range(count))
+        choices = [
+            choice.id for choice in Choice.objects.bulk_create(
+                Choice(question=question, text="Right", is_correct=True) for question in questions
+            )
+        ]
+
+        start_url = reverse('quiz-start', kwargs={'version': 'v1', 'pk': quiz.id})
+        attempt_id = client.post(start_url).data['attempt_id']
+        answers_url = reverse('attempt-answers', kwargs={'version': 'v1', 'pk': attempt_id})
+        saves = iter(range(ITERATIONS))
+        rows[f"autosave, {count} questions"] = measure(
+            lambda: client.patch(answers_url, {"answers": [choices[next(saves) % count]]}, format='json'),
+            ITERATIONS,
+        )
+
+        attempts = iter(TakenQuiz.objects.bulk_create(
+            TakenQuiz(user=user, quiz=quiz, started_at=timezone.now()) for _ in range(ITERATIONS)
+        ))
+        rows[f"submit, {count} questions"] = measure(
+            lambda: client.post(submit_url, {"attempt_id": next(attempts).id, "answers": choices}, format='json'),
+            ITERATIONS,
+        )
+
+    report("Autosave vs submit (ms)", rows)
@@ -0,0 +1,59 @@
+"""
+Uploading queued attempts one submit at a time vs in one batch, by batch size.
+Latency is per upload of the whole queue.
+
+Run explicitly: pytest benchmarks/bench_batch_submit.py -s
+"""
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from benchmarks.timing import measure, report
+from quizzes.models import Category, Choice, Question, Quiz, TakenQuiz
+from quizzes.views import TakenQuizBatchCreateView, TakenQuizCreateView
+
+BATCH_SIZES = (10, 50)
+ITERATIONS = 20
+
+
+@pytest.mark.django_db
+def test_batch_vs_single_submits(monkeypatch):
+    # Measure the endpoints, not the rate limits.
+    monkeypatch.setattr(TakenQuizCreateView, 'throttle_classes', [])
+    monkeypatch.setattr(TakenQuizBatchCreateView, 'throttle_classes', [])
+    client = APIClient()
+    user = User.objects.create_user(email="bench@example.com", username="bench")
+    client.force_authenticate(user=user)
+    submit_url = reverse('quiz-submit', kwargs={'version': 'v1'})
+    batch_url = reverse('quiz-submit-batch', kwargs={'version': 'v1'})
+
+    category = Category.objects.create(name="Science", slug="science")
+    quiz = Quiz.objects.create(title="Biology", category=category, time_limit_minutes=60)
+    questions = Question.objects.bulk_create(Question(quiz=quiz, text=f"Q{i}", order=i) for i in range(20))
+    choices = [
+        choice.id for choice in Choice.objects.bulk_create(
+            Choice(question=question, text="Right", is_correct=True) for question in questions
+        )
+    ]
+
+    def queue(size):
+        return TakenQuiz.objects.bulk_create(
+            TakenQuiz(user=user, quiz=quiz, started_at=timezone.now()) for _ in range(size)
+        )
+
+    rows = {}
+    for size in BATCH_SIZES:
+        def one_by_one():
+            for attempt in queue(size):
+                client.post(submit_url, {"attempt_id": attempt.id, "answers": choices}, format='json')
+
+        def batched():
+            items = [{"attempt_id": attempt.id, "answers": choices} for attempt in queue(size)]
+            client.post(batch_url, {"attempts": items}, format='json')
+
+        rows[f"one by one, {size}"] = measure(one_by_one, ITERATIONS)
+        rows[f"batch, {size}"] = measure(batched, ITERATIONS)
+
+    report("Uploading queued attempts (ms)", rows)
@@ -0,0 +1,41 @@
+"""
+Wall time of a JSONL import of 50k questions (5k quizzes x 10 questions x 4 choices).
+
+Run explicitly: pytest benchmarks/bench_bulk_import.py -s
+"""
+import json
+import time
+
+import pytest
+
+from quizzes.bulk import import_quizzes
+from quizzes.models import Question
+
+QUIZZES = 5_000
+QUESTIONS = 10
+CHOICES = 4
+
+
+def lines():
+    for i in range(QUIZZES):
+        yield json.dumps({
+            "title": f"Imported quiz {i}",
+            "description": "Benchmark content",
+            "category": {"slug": f"category-{i % 20}", "name": f"Category {i % 20}"},
+            "questions": [
+                {"text": f"Question {q}", "choices": [
+                    {"text": f"Choice {c}", "is_correct": c == 0} for c in range(CHOICES)
+                ]}
+                for q in range(QUESTIONS)
+            ],
+        }) + "\n"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_import_wall_time():
+    start = time.perf_counter()
+    import_quizzes(lines())
+    elapsed = time.perf_counter() - start
+
+    assert Question.objects.count() == QUIZZES * QUESTIONS
+    print(f"\nImported {QUIZZES * QUESTIONS} questions in {elapsed:.2f}s")
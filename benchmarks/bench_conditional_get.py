@@ -0,0 +1,59 @@
+"""
+Bandwidth and latency saved by conditional GET on polled endpoints.
+
+Run explicitly: pytest benchmarks/bench_conditional_get.py -s
+"""
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from benchmarks.timing import measure, report
+from quizzes.models import Category, Choice, Question, Quiz, TakenQuiz
+
+ITERATIONS = 200
+
+
+@pytest.fixture
+def catalog(db):
+    user = User.objects.create_user(email="poller@example.com", username="poller", password="password123")
+    categories = [Category.objects.create(name=f"Category {i}", slug=f"category-{i}") for i in range(10)]
+    quizzes = Quiz.objects.bulk_create(
+        Quiz(title=f"Quiz {i}", description="A fairly typical description " * 3, category=categories[i % 10])
+        for i in range(50)
+    )
+    questions = Question.objects.bulk_create(
+        Question(quiz=quiz, text=f"Question {i}", order=i) for quiz in quizzes[:1] for i in range(20)
+    )
+    Choice.objects.bulk_create(
+        Choice(question=question, text=f"Choice {j}", is_correct=j == 0) for question in questions for j in range(4)
+    )
+    TakenQuiz.objects.create(user=user, quiz=quizzes[0], started_at=timezone.now(), score=80.0)
+    return {"user": user, "quiz": quizzes[0]}
+
+
+def test_conditional_get_savings(catalog):
+    client = APIClient()
+    urls = {
+        "categories": reverse('category-list', kwargs={'version': 'v1'}),
+        "quiz list": reverse('quiz-list', kwargs={'version': 'v1'}),
+        "quiz detail": reverse('quiz-detail', kwargs={'version': 'v1', 'pk': catalog["quiz"].id}),
+        "profile": reverse('public-profile', kwargs={'version': 'v1', 'username': catalog["user"].username}),
+    }
+
+    rows = {}
+    for label, url in urls.items():
+        full = client.get(url)
+        etag = full['ETag']
+        not_modified = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert not_modified.status_code == 304
+
+        # Quiz detail keeps its payload cache warm, so "full" is a cache hit there.
+        rows[f"{label} 200"] = {"bytes": float(len(full.content)), **measure(lambda: client.get(url), ITERATIONS)}
+        rows[f"{label} 304"] = {
+            "bytes": float(len(not_modified.content)),
+            **measure(lambda: client.get(url, HTTP_IF_NONE_MATCH=etag), ITERATIONS),
+        }
+
+    report("Conditional GET (body bytes, ms)", rows)
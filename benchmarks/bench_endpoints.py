@@ -0,0 +1,121 @@
+"""
+Latency, query count and peak allocations of every public endpoint, on
+seeded datasets of several sizes, checked against benchmarks/baseline.json
+(see benchmarks.baseline). Latencies are the best of ROUNDS interleaved
+rounds, next to timing.reference_workload, which lets the comparison allow
+for the machine running slower or faster than when the baseline was stored.
+Cached endpoints are measured warm and, with their cache entry invalidated
+before each request, cold.
+
+Run explicitly: pytest benchmarks/bench_endpoints.py -s
+Refresh the baseline: BENCH_UPDATE_BASELINE=1 pytest benchmarks/bench_endpoints.py -s
+"""
+import itertools
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from accounts.cache import invalidate_profile
+from benchmarks.baseline import REFERENCE_LABEL, best_of, check
+from benchmarks.timing import count_queries, measure_rounds, peak_allocations, reference_workload, report
+from core.throttling import SlidingWindowThrottle
+from quizzes.cache import invalidate_quiz
+from quizzes.models import Choice, Quiz, TakenQuiz
+from quizzes.seeding import seed_dataset
+
+# Users per dataset; each has ATTEMPTS_PER_USER attempts, over one quiz per USERS_PER_QUIZ users.
+SIZES = (1_000, 10_000)
+USERS_PER_QUIZ = 10
+ATTEMPTS_PER_USER = 5
+QUESTIONS = 10
+ROUNDS = 5
+ITERATIONS = 30  # per round
+# Register and login hash passwords, which dominates their latency.
+HASHING_ITERATIONS = 4
+PASSWORD = "strong_password_123"
+
+
+def url(name, **kwargs):
+    return reverse(name, kwargs={"version": "v1", **kwargs})
+
+
+def endpoints(player, quiz, correct_ids, counter):
+    """name -> (request callable, iterations). `counter` numbers the registered users."""
+    client, anonymous = APIClient(), APIClient()
+    client.force_authenticate(user=player)
+
+    def submit():
+        attempt = TakenQuiz.objects.create(user=player, quiz=quiz, started_at=timezone.now())
+        return client.post(url("quiz-submit"), {"attempt_id": attempt.id, "answers": correct_ids}, format="json")
+
+    def cold_quiz_detail():
+        invalidate_quiz(quiz.id)
+        return anonymous.get(url("quiz-detail", pk=quiz.id))
+
+    def cold_public_profile():
+        invalidate_profile(player.username)
+        return anonymous.get(url("public-profile", username=player.username))
+
+    def register():
+        n = next(counter)
+        return anonymous.post(url("register"), {
+            "username": f"newcomer{n}", "email": f"newcomer{n}@example.com",
+            "password": PASSWORD, "password_confirm": PASSWORD,
+        })
+
+    return {
+        "quiz-list": (lambda: anonymous.get(url("quiz-list")), ITERATIONS),
+        "quiz-detail": (lambda: anonymous.get(url("quiz-detail", pk=quiz.id)), ITERATIONS),
+        "quiz-detail (cold)": (cold_quiz_detail, ITERATIONS),
+        "quiz-start": (lambda: client.post(url("quiz-start", pk=quiz.id)), ITERATIONS),
+        "quiz-submit": (submit, ITERATIONS),
+        "quiz-history": (lambda: client.get(url("quiz-history")), ITERATIONS),
+        "my-profile": (lambda: client.get(url("my-profile")), ITERATIONS),
+        "public-profile": (lambda: anonymous.get(url("public-profile", username=player.username)), ITERATIONS),
+        "public-profile (cold)": (cold_public_profile, ITERATIONS),
+        "register": (register, HASHING_ITERATIONS),
+        "login": (lambda: anonymous.post(url("login"), {"email": player.email, "password": PASSWORD}), HASHING_ITERATIONS),
+    }
+
+
+@pytest.mark.django_db
+def test_endpoints_against_baseline(monkeypatch):
+    # Measure the endpoints, not the rate limits.
+    monkeypatch.setattr(SlidingWindowThrottle, 'allow_request', lambda self, request, view: True)
+    player = User.objects.create_user(email="player@example.com", username="player", password=PASSWORD)
+    results, spreads = {}, {}
+    counter = itertools.count()
+
+    seeded = 0
+    for size in SIZES:
+        # Each size adds to the previous dataset, under its own seed.
+        seed_dataset(
+            size - seeded, (size - seeded) // USERS_PER_QUIZ, (size - seeded) * ATTEMPTS_PER_USER,
+            questions=QUESTIONS, seed=size,
+        )
+        seeded = size
+        quiz = Quiz.objects.order_by('id').first()
+        correct_ids = list(Choice.objects.filter(question__quiz=quiz, is_correct=True).values_list('id', flat=True))
+
+        calls = endpoints(player, quiz, correct_ids, counter)
+        for name, (call, _) in calls.items():
+            response = call()
+            assert response.status_code < 400, (name, response.content)
+
+        measured = measure_rounds({**calls, REFERENCE_LABEL: (reference_workload, ITERATIONS)}, ROUNDS)
+        for name, rounds in measured.items():
+            label = f"{name}, {size}"
+            results[label], spreads[label] = best_of(rounds)
+            if name == REFERENCE_LABEL:
+                continue
+            call = calls[name][0]
+            # Another endpoint may have invalidated this one's cache (login saves the user).
+            call()
+            results[label].update(queries=count_queries(call), alloc_kib=peak_allocations(call))
+
+    report("Endpoints (ms, queries, KiB)", results)
+    regressions = check("endpoints", results, spreads)
+    assert not regressions, "Regressed against the baseline:\n" + "\n".join(regressions)
@@ -0,0 +1,50 @@
+"""
+Item analysis throughput by number of submitted attempts, for a quiz of
+20 questions with 4 choices each.
+
+Run explicitly: pytest benchmarks/bench_item_analysis.py -s
+"""
+import random
+
+import pytest
+from django.utils import timezone
+
+from accounts.models import User
+from benchmarks.timing import measure, report
+from quizzes.analysis import analyze_items
+from quizzes.models import Choice, Question, Quiz, TakenQuiz
+from quizzes.scoring import pack_choice_ids
+
+SIZES = (10_000, 100_000, 1_000_000)
+ITERATIONS = 3
+
+
+@pytest.mark.django_db
+def test_item_analysis_by_attempts():
+    quiz = Quiz.objects.create(title="Analysed")
+    questions = Question.objects.bulk_create(Question(quiz=quiz, text=f"Q{i}", order=i) for i in range(20))
+    choices = Choice.objects.bulk_create(
+        Choice(question=question, text=f"C{j}", is_correct=j == 0) for question in questions for j in range(4)
+    )
+    per_question = [[choice.id for choice in choices[i:i + 4]] for i in range(0, len(choices), 4)]
+    user = User.objects.create_user(email="bench@example.com", username="bench")
+    answers = random.Random(42)
+    now = timezone.now()
+    rows = {}
+
+    created = 0
+    for size in SIZES:
+        TakenQuiz.objects.bulk_create(
+            (
+                TakenQuiz(
+                    user=user, quiz=quiz, started_at=now, score=0.0,
+                    choice_ids=pack_choice_ids(answers.choice(options) for options in per_question),
+                )
+                for _ in range(created, size)
+            ),
+            batch_size=5_000,
+        )
+        created = size
+        rows[f"{size} attempts"] = measure(analyze_items, ITERATIONS)
+
+    report("Item analysis (ms)", rows)
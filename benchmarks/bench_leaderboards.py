@@ -0,0 +1,46 @@
+"""
+Leaderboard reads and rank refresh as the number of ranked users grows.
+
+Run explicitly: pytest benchmarks/bench_leaderboards.py -s
+"""
+import random
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from benchmarks.timing import measure, report
+from quizzes.leaderboards import ALL_TIME, refresh_ranks
+from quizzes.models import LeaderboardEntry
+
+SIZES = (1_000, 10_000, 100_000)
+ITERATIONS = 100
+
+
+@pytest.mark.django_db
+def test_leaderboard_latency_by_size():
+    client = APIClient()
+    top_url = reverse('leaderboard', kwargs={'version': 'v1', 'period': 'all-time'})
+    me_url = reverse('leaderboard-me', kwargs={'version': 'v1', 'period': 'all-time'})
+    scores = random.Random(42)
+    rows = {}
+
+    created = 0
+    for size in SIZES:
+        users = User.objects.bulk_create(
+            (User(email=f"u{i}@example.com", username=f"user{i}") for i in range(created, size)),
+            batch_size=5_000,
+        )
+        LeaderboardEntry.objects.bulk_create(
+            (LeaderboardEntry(board=ALL_TIME, user=user, score=scores.uniform(0, 10_000), quizzes=1) for user in users),
+            batch_size=5_000,
+        )
+        created = size
+        client.force_authenticate(user=users[len(users) // 2])
+
+        rows[f"refresh, {size}"] = measure(refresh_ranks, 3)
+        rows[f"top 20, {size}"] = measure(lambda: client.get(top_url), ITERATIONS)
+        rows[f"my rank, {size}"] = measure(lambda: client.get(me_url), ITERATIONS)
+
+    report("Leaderboards (ms)", rows)
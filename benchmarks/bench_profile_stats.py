@@ -0,0 +1,45 @@
+"""
+Cost of recording a completed quiz as the user's history grows: incremental
+stats vs recomputing them from the full history (as reconciliation does).
+
+Run explicitly: pytest benchmarks/bench_profile_stats.py -s
+"""
+import pytest
+from django.utils import timezone
+
+from accounts.models import User
+from benchmarks.timing import measure, report
+from quizzes.models import Category, Quiz, TakenQuiz
+from quizzes.stats import reconcile_stats
+
+HISTORY_SIZES = (10, 1_000, 10_000)
+ITERATIONS = 100
+
+
+@pytest.mark.django_db
+def test_stats_cost_by_history_length():
+    user = User.objects.create_user(email="bench@example.com", username="bench", password="pass12345")
+    categories = [Category.objects.create(name=f"Category {i}", slug=f"category-{i}") for i in range(10)]
+    quizzes = [Quiz.objects.create(title=f"Quiz {i}", category=categories[i % 10]) for i in range(50)]
+
+    def complete():
+        attempt = TakenQuiz.objects.create(user=user, quiz=quizzes[0], started_at=timezone.now())
+        attempt.score = 75.0
+        attempt.save()
+
+    rows = {}
+    created = 0
+    for size in HISTORY_SIZES:
+        TakenQuiz.objects.bulk_create(
+            (
+                TakenQuiz(user=user, quiz=quizzes[i % 50], score=float(i % 100), started_at=timezone.now())
+                for i in range(created, size)
+            ),
+            batch_size=2_000,
+        )
+        created = size
+        reconcile_stats([user.id])
+        rows[f"incremental, {size}"] = measure(complete, ITERATIONS)
+        rows[f"full recompute, {size}"] = measure(lambda: reconcile_stats([user.id]), ITERATIONS // 10)
+
+    report("Recording one completed quiz (ms)", rows)
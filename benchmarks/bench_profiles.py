@@ -0,0 +1,39 @@
+"""
+Public profile latency by number of earned badges: rendered vs cached.
+
+Run explicitly: pytest benchmarks/bench_profiles.py -s
+"""
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import Achievement, User, UserAchievement
+from benchmarks.timing import measure, report
+
+BADGES = (0, 20, 200)
+ITERATIONS = 200
+
+
+@pytest.mark.django_db
+def test_public_profile_latency():
+    client = APIClient()
+    rows = {}
+
+    for count in BADGES:
+        user = User.objects.create_user(email=f"b{count}@example.com", username=f"badges{count}")
+        achievements = Achievement.objects.bulk_create(
+            Achievement(name=f"Badge {count}-{i}", description="", badge_type="rare") for i in range(count)
+        )
+        UserAchievement.objects.bulk_create(UserAchievement(user=user, achievement=a) for a in achievements)
+        url = reverse('public-profile', kwargs={'version': 'v1', 'username': user.username})
+
+        def rendered():
+            cache.clear()
+            client.get(url)
+
+        rows[f"rendered, {count} badges"] = measure(rendered, ITERATIONS)
+        client.get(url)
+        rows[f"cached, {count} badges"] = measure(lambda: client.get(url), ITERATIONS)
+
+    report("Public profile (ms)", rows)
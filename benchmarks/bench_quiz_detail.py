@@ -0,0 +1,55 @@
+"""
+Cold vs warm latency of QuizDetailView, and warm latency in an attempt's shuffled order.
+
+Run explicitly: pytest benchmarks/bench_quiz_detail.py -s
+"""
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from benchmarks.timing import measure, report
+from quizzes.models import Category, Quiz, Question, Choice
+
+ITERATIONS = 200
+
+
+@pytest.fixture
+def quiz(db):
+    category = Category.objects.create(name="Science", slug="science")
+    quiz = Quiz.objects.create(title="Biology", description="Cells", category=category)
+    questions = Question.objects.bulk_create(
+        Question(quiz=quiz, text=f"Question {i}", order=i) for i in range(20)
+    )
+    Choice.objects.bulk_create(
+        Choice(question=question, text=f"Choice {j}", is_correct=j == 0)
+        for question in questions for j in range(4)
+    )
+    return quiz
+
+
+def test_quiz_detail_cold_vs_warm(quiz):
+    client = APIClient()
+    url = reverse('quiz-detail', kwargs={'pk': quiz.id, 'version': 'v1'})
+
+    def cold():
+        cache.clear()
+        assert client.get(url).status_code == 200
+
+    def warm():
+        assert client.get(url).status_code == 200
+
+    def shuffled():
+        assert client.get(url, {'attempt': attempt_id}).status_code == 200
+
+    cold_stats = measure(cold, ITERATIONS)
+    client.get(url)
+    warm_stats = measure(warm, ITERATIONS)
+
+    client.force_authenticate(user=User.objects.create_user(email="bench@example.com", username="bench"))
+    attempt_id = client.post(reverse('quiz-start', kwargs={'pk': quiz.id, 'version': 'v1'})).data['attempt_id']
+    shuffled_stats = measure(shuffled, ITERATIONS)
+    report("QuizDetailView (ms)", {"cold": cold_stats, "warm": warm_stats, "warm, shuffled": shuffled_stats})
+
+    assert warm_stats["p50"] < cold_stats["p50"]
@@ -0,0 +1,66 @@
+"""
+Submission scoring: per-request queries vs the cached answer key.
+
+Scores 500 submissions against a 20-question quiz both ways and reports
+latency and throughput; the warm answer key must sustain 500 submissions
+per second with room to spare.
+
+Run explicitly: pytest benchmarks/bench_scoring.py -s
+"""
+import time
+
+import pytest
+
+from benchmarks.timing import measure, report
+from quizzes.models import Choice, Question, Quiz
+from quizzes.scoring import get_answer_key
+
+SUBMISSIONS = 500
+QUESTIONS = 20
+
+
+@pytest.fixture
+def quiz(db):
+    quiz = Quiz.objects.create(title="Benchmark")
+    questions = Question.objects.bulk_create(
+        Question(quiz=quiz, text=f"Question {i}", order=i) for i in range(QUESTIONS)
+    )
+    Choice.objects.bulk_create(
+        Choice(question=question, text=f"Choice {j}", is_correct=j == 0)
+        for question in questions for j in range(4)
+    )
+    return quiz
+
+
+def score_with_queries(quiz, answers):
+    """Scoring as TakenQuizCreateView did before the answer key."""
+    correct_ids = Choice.objects.filter(question__quiz=quiz, is_correct=True).values_list('id', flat=True)
+    correct = sum(1 for choice_id in answers if choice_id in correct_ids)
+    return correct / quiz.questions.count() * 100
+
+
+def score_with_key(quiz, answers):
+    key = get_answer_key(quiz.id)
+    return key.score(key.count_correct(answers))
+
+
+def test_scoring_throughput(quiz):
+    # Every other question answered correctly.
+    answers = [
+        choice_id for question_id, choice_id in
+        Choice.objects.filter(question__quiz=quiz, is_correct=True).values_list('question_id', 'id')
+        if question_id % 2
+    ] + list(Choice.objects.filter(question__quiz=quiz, is_correct=False).values_list('id', flat=True)[:5])
+    assert score_with_queries(quiz, answers) == score_with_key(quiz, answers)
+
+    rows = {}
+    throughput = {}
+    for label, scorer in (("queries", score_with_queries), ("answer key", score_with_key)):
+        start = time.perf_counter()
+        rows[label] = measure(lambda: scorer(quiz, answers), SUBMISSIONS)
+        throughput[label] = SUBMISSIONS / (time.perf_counter() - start)
+    report(f"Scoring {SUBMISSIONS} submissions (ms)", rows)
+    for label, per_second in throughput.items():
+        print(f"  {label:<24} {per_second:,.0f} submissions/s")
+
+    assert throughput["answer key"] > 500
@@ -0,0 +1,38 @@
+"""
+Search latency of QuizListView as the catalog grows.
+
+Run explicitly: pytest benchmarks/bench_search.py -s
+"""
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from benchmarks.timing import measure, report
+from quizzes.models import Quiz
+from quizzes.search import get_search_backend
+
+SIZES = (1_000, 10_000, 50_000)
+ITERATIONS = 100
+WORDS = ("volcano", "planet", "empire", "river", "molecule", "poetry", "glacier", "algebra")
+
+
+@pytest.mark.django_db
+def test_search_latency_by_catalog_size():
+    client = APIClient()
+    url = reverse('quiz-list', kwargs={'version': 'v1'})
+    rows = {}
+
+    created = 0
+    for size in SIZES:
+        Quiz.objects.bulk_create(
+            (
+                Quiz(title=f"{WORDS[i % len(WORDS)]} quiz {i}", description=f"about {WORDS[(i * 7) % len(WORDS)]}")
+                for i in range(created, size)
+            ),
+            batch_size=2_000,
+        )
+        created = size
+        get_search_backend().rebuild()
+        rows[f"{size} quizzes"] = measure(lambda: client.get(url, {'search': 'glacier'}), ITERATIONS)
+
+    report("Quiz search (ms)", rows)
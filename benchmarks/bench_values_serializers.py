@@ -0,0 +1,38 @@
+"""
+Serialization throughput of list rows: DRF ModelSerializer vs the `.values()`
+fast path (core.fast_serializers).
+
+Run explicitly: pytest benchmarks/bench_values_serializers.py -s
+"""
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from benchmarks.timing import measure, report
+from core.fast_serializers import ValuesSerializer
+from quizzes.models import Category, Quiz
+from quizzes.serializers import QuizSerializer
+
+ROWS = 1_000
+ITERATIONS = 50
+
+
+@pytest.mark.django_db
+def test_quiz_list_serialization_throughput():
+    category = Category.objects.create(name="Bench", slug="bench")
+    Quiz.objects.bulk_create(
+        (Quiz(title=f"Quiz {i}", description="x" * 200, category=category) for i in range(ROWS)),
+        batch_size=1_000,
+    )
+    request = APIRequestFactory().get('/')
+    queryset = Quiz.objects.select_related('category').with_question_count()
+    fast = ValuesSerializer(QuizSerializer)
+
+    rows = {
+        f"ModelSerializer, {ROWS} rows": measure(
+            lambda: QuizSerializer(list(queryset), many=True, context={'request': request}).data, ITERATIONS
+        ),
+        f"ValuesSerializer, {ROWS} rows": measure(
+            lambda: fast.serialize(queryset.values(*fast.lookups), request), ITERATIONS
+        ),
+    }
+    report("Quiz list serialization (ms, query included)", rows)
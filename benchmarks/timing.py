@@ -0,0 +1,80 @@
+import hashlib
+import json
+import statistics
+import time
+import tracemalloc
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def percentile(samples, pct):
+    """Return the pct-th percentile (nearest rank) of a list of samples."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(func, iterations):
+    """Call func repeatedly and return latency percentiles in milliseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "mean": statistics.fmean(samples),
+    }
+
+
+def reference_workload():
+    """
+    A fixed, CPU-bound stand-in for request handling (JSON, sorting, hashing)
+    whose latency tracks how fast the machine is running right now.
+    """
+    rows = [{"id": i, "title": f"Quiz {i}", "tags": ["a", "b"]} for i in range(300)]
+    json.loads(json.dumps(rows))
+    sorted(rows, key=lambda row: row["title"], reverse=True)
+    hashlib.pbkdf2_hmac("sha256", b"password", b"salt", 2_000)
+
+
+def measure_rounds(calls, rounds):
+    """
+    Measure each of `calls` ({label: (func, iterations)}) in `rounds` rounds,
+    interleaved so that a slow spell of the machine hits every label alike.
+    Returns {label: [measure() result of each round]}.
+    """
+    results = {label: [] for label in calls}
+    for _ in range(rounds):
+        for label, (func, iterations) in calls.items():
+            results[label].append(measure(func, iterations))
+    return results
+
+
+def count_queries(func):
+    """Call func once and return the number of queries it ran."""
+    with CaptureQueriesContext(connection) as queries:
+        func()
+    return len(queries)
+
+
+def peak_allocations(func):
+    """Call func once and return the peak memory it allocated, in KiB."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def report(title, rows):
+    """Print a small aligned table of {label: stats} rows."""
+    print(f"\n{title}")
+    for label, stats in rows.items():
+        cells = "  ".join(f"{key}={value:8.3f}" for key, value in stats.items())
+        print(f"  {label:<24} {cells}")
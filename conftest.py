@@ -0,0 +1,19 @@
+import pytest
+from django.core.cache import cache
+
+from activities.buffer import activity_buffer
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache so cached payloads never leak between tests."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_activity_buffer():
+    """Drop buffered activities, so one test's rows are never written during another."""
+    yield
+    activity_buffer.clear()
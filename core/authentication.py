@@ -0,0 +1,120 @@
+"""
+Stateless JWT authentication with token versions and a user record cache.
+
+Tokens carry the user's `token_version` in the TOKEN_VERSION_CLAIM claim
+(tokens issued before the claim existed count as version 0). Changing the
+password or deactivating the user bumps the version (see
+accounts.models.User.save), which revokes every token issued before.
+
+Authenticated users are served from a small in-process cache keyed by
+(user id, token version), so a hot client authenticates without a query.
+Records live for settings.AUTH_USER_CACHE_TTL seconds. A user saved in
+this process is evicted at once (see accounts.signals). Other processes
+notice a revocation within the TTL. Users rebuilt from the cache may be
+stale and must never be saved; views that write load the row first.
+"""
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+TOKEN_VERSION_CLAIM = "tv"
+# Upper bound on user records held per process.
+LOCAL_MAX_ENTRIES = 10_000
+
+_local_users = {}  # (user id, token version) -> (expires at, field names, values)
+
+
+def get_token_user(user_id, token_version):
+    """
+    Return the active user a token was issued to, from the local cache when
+    fresh. Raises AuthenticationFailed if the user is gone, inactive, or the
+    token version has been revoked.
+    """
+    User = get_user_model()
+    key = (str(user_id), token_version)
+    now = time.monotonic()
+    entry = _local_users.get(key)
+    if entry is not None and entry[0] > now:
+        # A fresh instance per request, so views never share mutable state.
+        return User.from_db(DEFAULT_DB_ALIAS, entry[1], entry[2])
+
+    try:
+        user = User._default_manager.get(**{api_settings.USER_ID_FIELD: user_id})
+    except User.DoesNotExist:
+        raise AuthenticationFailed(_("User not found"), code="user_not_found")
+    if not user.is_active:
+        raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+    if user.token_version != token_version:
+        raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+
+    if len(_local_users) >= LOCAL_MAX_ENTRIES:
+        _local_users.clear()
+    names = [field.attname for field in User._meta.concrete_fields]
+    _local_users[key] = (now + settings.AUTH_USER_CACHE_TTL, names, [getattr(user, name) for name in names])
+    return user
+
+
+def forget_user(user_id):
+    """Drop every cached record of a user in this process."""
+    for key in [key for key in _local_users if key[0] == str(user_id)]:
+        _local_users.pop(key, None)
+
+
+class VersionedRefreshToken(RefreshToken):
+    """A refresh token (and its access tokens) stamped with the user's token version."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
+
+
+class VersionedTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = VersionedRefreshToken
+
+
+class VersionedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refuse to refresh tokens whose version has been revoked. Checks the user
+    through the record cache instead of the base class's own lookup.
+    """
+    token_class = VersionedRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        try:
+            user_id = refresh[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        get_token_user(user_id, refresh.get(TOKEN_VERSION_CLAIM, 0))
+
+        data = {"access": str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data["refresh"] = str(refresh)
+        return data
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that checks token versions and caches user records."""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        return get_token_user(user_id, validated_token.get(TOKEN_VERSION_CLAIM, 0))
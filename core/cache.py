@@ -0,0 +1,87 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY_PREFIX = "version"
+VERSION_TIMEOUT = 60 * 60 * 24
+
+
+def _version_key(name):
+    return f"{VERSION_KEY_PREFIX}:{name}"
+
+
+def _now_us():
+    return time.time_ns() // 1000
+
+
+def get_versions(*names):
+    """
+    Return the current version of each named resource as a dict.
+
+    Versions are microsecond timestamps of the last change, so they double as
+    a cheap Last-Modified value. A resource that has never been bumped (or was
+    evicted from the cache) is initialised to "now", which safely invalidates
+    anything derived from it. That makes expiry safe too, so versions get a
+    finite timeout and a lookup of any made-up name leaves nothing behind for
+    long.
+    """
+    keys = {_version_key(name): name for name in names}
+    found = cache.get_many(keys.keys())
+    versions = {keys[key]: value for key, value in found.items()}
+
+    for key, name in keys.items():
+        if name not in versions:
+            cache.add(key, _now_us(), VERSION_TIMEOUT)
+            versions[name] = cache.get(key)
+    return versions
+
+
+def get_version(name):
+    """Return the current version of a single named resource."""
+    return get_versions(name)[name]
+
+
+def bump_version(*names):
+    """
+    Mark the named resources as changed, once the current transaction
+    commits (at once outside one). A bump before the commit would let a
+    concurrent reader cache the old rows under the new version.
+    """
+    transaction.on_commit(lambda: _bump(names))
+
+
+def _bump(names):
+    now = _now_us()
+    current = cache.get_many(_version_key(name) for name in names)
+    cache.set_many(
+        {
+            _version_key(name): _next_version(current.get(_version_key(name), 0), now)
+            for name in names
+        },
+        VERSION_TIMEOUT,
+    )
+
+
+def _next_version(current, now):
+    """
+    A version after `current` that also moves its whole second, the
+    Last-Modified resolution, so a client holding the old value sees the
+    change. Runs at most a second ahead of the clock; within that second
+    further changes are told apart by ETag only.
+    """
+    next_second = -(-current // 1_000_000) * 1_000_000 + 1
+    return max(now, current + 1, min(next_second, now + 1_000_000))
+
+
+def incr_counter(key, delta=1, timeout=None):
+    """
+    Atomically increment a shared counter, creating it if needed. `timeout`
+    (seconds, default never) applies from the counter's creation.
+    """
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        if cache.add(key, delta, timeout):
+            return delta
+        return cache.incr(key, delta)
@@ -0,0 +1,50 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET/HEAD with ETag and Last-Modified validators derived from
+    version counters (see core.cache), and with 304 Not Modified when the
+    client's copy is current. Validators are computed before any queryset is
+    evaluated or serializer runs.
+
+    Views implement `get_validator_versions()`, returning the versions the
+    response depends on.
+    """
+
+    def get_validator_versions(self):
+        raise NotImplementedError
+
+    def get_validators(self, request):
+        """Return the (strong ETag, Last-Modified timestamp) pair for this request."""
+        versions = [str(version) for version in self.get_validator_versions()]
+        # The same versions render differently per URL (query string, cursor),
+        # host (absolute links) and negotiated format.
+        key = "|".join([
+            self.__class__.__name__,
+            *versions,
+            request.get_host(),
+            request.get_full_path(),
+            request.META.get('HTTP_ACCEPT', ''),
+        ])
+        etag = quote_etag(hashlib.sha1(key.encode('utf-8')).hexdigest())
+        # Rounded up to whole seconds, so it is never earlier than the change (see core.cache._bump).
+        last_modified = -(-max(int(version) for version in versions) // 1_000_000)
+        return etag, last_modified
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators(request)
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+            if not (200 <= response.status_code < 300):
+                return response
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        patch_vary_headers(response, ['Accept'])
+        return response
@@ -0,0 +1,37 @@
+from django.db import IntegrityError, connections, transaction
+from django.db.models import F
+
+
+def increment_or_create(model, lookup, **increments):
+    """
+    Atomically add `increments` to the row matching `lookup`, creating it
+    (with the increments as initial values) if it does not exist yet. `lookup`
+    must match a unique constraint so concurrent creates collide.
+    """
+    changes = {field: F(field) + delta for field, delta in increments.items()}
+    rows = model._default_manager.filter(**lookup)
+    if rows.update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            model._default_manager.create(**lookup, **increments)
+    except IntegrityError:
+        # Created concurrently since our UPDATE.
+        rows.update(**changes)
+
+
+def estimated_count(model, using='default'):
+    """
+    The planner's row estimate for a model's table, or None where the database
+    keeps none (anything but Postgres, or a table never analysed).
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [model._meta.db_table])
+        row = cursor.fetchone()
+    # reltuples is -1 until the table is first vacuumed or analysed.
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
@@ -0,0 +1,135 @@
+"""
+Opt-in fast path for read-only list endpoints.
+
+`ValuesSerializer` inspects an existing ModelSerializer once and compiles a
+row-to-dict function that turns `.values()` rows into exactly the
+representation the serializer would produce, without instantiating models or
+serializer fields per row. Views opt in through `ValuesListMixin`.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import relations, serializers
+from rest_framework.response import Response
+
+# Fields whose to_representation() is the identity for values loaded by the ORM.
+IDENTITY_FIELDS = (
+    serializers.ReadOnlyField,
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ChoiceField,
+    relations.PrimaryKeyRelatedField,
+)
+# Fields converted by their own (bound) to_representation().
+CONVERTED_FIELDS = (
+    serializers.DateTimeField,
+    serializers.DateField,
+    serializers.TimeField,
+    serializers.DurationField,
+    serializers.DecimalField,
+    serializers.FloatField,
+)
+
+
+class ValuesSerializer:
+    """Compile a ModelSerializer into a `.values()` row-to-dict function."""
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self._compiled = None
+
+    def _file_converter(self, field_name):
+        model = self.serializer_class.Meta.model
+        storage = model._meta.get_field(field_name).storage
+
+        def to_url(name, request):
+            url = storage.url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+        return to_url
+
+    def _compile(self):
+        fields = self.serializer_class().fields
+        lookups, namespace, lines = [], {}, ["def row_to_dict(row, request):", "    data = {}"]
+
+        for index, (name, field) in enumerate(fields.items()):
+            if field.write_only:
+                continue
+            if getattr(field, 'values_lookup', None):
+                # Fields backed by a queryset annotation name it themselves.
+                lookup, dotted = field.values_lookup, False
+            elif field.source == '*' or isinstance(field, serializers.BaseSerializer):
+                raise ImproperlyConfigured(
+                    f"{self.serializer_class.__name__}.{name} cannot be built from .values() rows."
+                )
+            else:
+                lookup, dotted = field.source.replace('.', '__'), '.' in field.source
+
+            value = f"v{index}"
+            lines.append(f"    {value} = row[{lookup!r}]")
+            if isinstance(field, serializers.FileField):
+                namespace[f"c{index}"] = self._file_converter(field.source)
+                expression = f"c{index}({value}, request) if {value} else None"
+            elif isinstance(field, CONVERTED_FIELDS):
+                namespace[f"c{index}"] = field.to_representation
+                expression = f"None if {value} is None else c{index}({value})"
+            elif isinstance(field, IDENTITY_FIELDS):
+                expression = value
+            else:
+                raise ImproperlyConfigured(
+                    f"{self.serializer_class.__name__}.{name} ({type(field).__name__}) is not supported."
+                )
+
+            # DRF skips read-only fields whose dotted source crosses a null relation.
+            if dotted:
+                lines.append(f"    if {value} is not None:")
+                lines.append(f"        data[{name!r}] = {expression}")
+            else:
+                lines.append(f"    data[{name!r}] = {expression}")
+            lookups.append(lookup)
+
+        lines.append("    return data")
+        exec("\n".join(lines), namespace)
+        return tuple(dict.fromkeys(lookups)), namespace["row_to_dict"]
+
+    @property
+    def lookups(self):
+        """ORM lookups to pass to `.values()`."""
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled[0]
+
+    def serialize(self, rows, request=None):
+        """Represent an iterable of `.values()` rows as a list of dicts."""
+        if self._compiled is None:
+            self._compiled = self._compile()
+        row_to_dict = self._compiled[1]
+        return [row_to_dict(row, request) for row in rows]
+
+
+class ValuesListMixin:
+    """
+    Serve `list()` from `.values()` rows through `values_serializer`.
+
+    Views opt in by setting `values_serializer = ValuesSerializer(SomeSerializer)`;
+    the output matches `serializer_class` byte for byte.
+    """
+    values_serializer = None
+
+    def get_values_lookups(self, queryset):
+        lookups = list(self.values_serializer.lookups)
+        # Keyset pagination reads its position from the ordering fields.
+        get_ordering = getattr(self.paginator, 'get_ordering', None)
+        if get_ordering is not None:
+            lookups += [field.lstrip('-') for field in get_ordering(self.request, queryset, self)]
+        return list(dict.fromkeys(lookups))
+
+    def list(self, request, *args, **kwargs):
+        if self.values_serializer is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values(*self.get_values_lookups(queryset))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(self.values_serializer.serialize(page, request))
+        return Response(self.values_serializer.serialize(rows, request))
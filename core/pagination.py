@@ -0,0 +1,176 @@
+import json
+from base64 import b64decode, b64encode
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+from core.db import estimated_count
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin paginator that skips the exact COUNT(*) of large, unfiltered tables.
+    On Postgres an unfiltered changelist uses the planner's row estimate once
+    it exceeds `exact_below`. Filtered lists, other databases and small
+    tables are counted exactly.
+    """
+    exact_below = 100_000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimated_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= self.exact_below:
+                return estimate
+        return super().count
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Opaque-cursor keyset pagination over a composite ordering such as
+    ('-completed_at', '-id').
+
+    Unlike DRF's CursorPagination, the cursor stores the full position tuple,
+    so each page is a single index range scan with no OFFSET and no COUNT(*),
+    however deep the client pages. Views declare their ordering with
+    `keyset_ordering` (or `get_keyset_ordering()`); the last field must be
+    unique so positions never tie.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-id',)
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_ordering(self, request, queryset, view):
+        if hasattr(view, 'get_keyset_ordering'):
+            return tuple(view.get_keyset_ordering())
+        return tuple(getattr(view, 'keyset_ordering', self.ordering))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        position, reverse = self.decode_cursor(request)
+
+        ordering = _invert(self.ordering) if reverse else self.ordering
+        if position is not None:
+            try:
+                position = self.convert_position(queryset, position)
+                queryset = queryset.filter(_after(ordering, position))
+            except (ValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+
+        has_more = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor((self._get_position_from_instance(self.page[-1], self.ordering), False))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor((self._get_position_from_instance(self.page[0], self.ordering), True))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+        try:
+            data = json.loads(b64decode(encoded.encode('ascii')).decode('utf-8'))
+            position = [_load_value(value) for value in data['p']]
+            reverse = bool(data.get('r'))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def convert_position(self, queryset, position):
+        """
+        Convert the decoded position to the ordering fields' Python types, so a
+        tampered cursor fails here (ValidationError) rather than in the query.
+        """
+        converted = []
+        for field, value in zip(self.ordering, position):
+            value = _ordering_field(queryset, field.lstrip('-')).to_python(value)
+            if value is None:
+                raise ValidationError('Missing value in cursor')
+            converted.append(value)
+        return converted
+
+    def encode_cursor(self, cursor):
+        position, reverse = cursor
+        data = {'p': [_dump_value(value) for value in position]}
+        if reverse:
+            data['r'] = 1
+        encoded = b64encode(json.dumps(data, separators=(',', ':')).encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _get_position_from_instance(self, instance, ordering):
+        names = [field.lstrip('-') for field in ordering]
+        if isinstance(instance, dict):
+            return [instance[name] for name in names]
+        return [getattr(instance, name) for name in names]
+
+
+def _invert(ordering):
+    return tuple(field[1:] if field.startswith('-') else f'-{field}' for field in ordering)
+
+
+def _after(ordering, position):
+    """
+    Build the filter for rows strictly after `position` in `ordering`.
+
+    The leading field gets a plain range bound of its own so the database can
+    seek straight into the composite index before applying the tie-breakers.
+    """
+    clauses = Q()
+    equal = {}
+    for field, value in zip(ordering, position):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        clauses |= Q(**equal, **{f'{name}__{lookup}': value})
+        equal[name] = value
+
+    first = ordering[0].lstrip('-')
+    bound = 'lte' if ordering[0].startswith('-') else 'gte'
+    return Q(**{f'{first}__{bound}': position[0]}) & clauses
+
+
+def _dump_value(value):
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    return value
+
+
+def _load_value(value):
+    """Unwrap a dumped value; its type is checked by KeysetPagination.convert_position."""
+    if isinstance(value, dict):
+        return value['dt']
+    return value
+
+
+def _ordering_field(queryset, name):
+    """The model field, or the annotation's output field, named `name`."""
+    try:
+        return queryset.model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return queryset.query.annotations[name].output_field
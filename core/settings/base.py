@@ -49,7 +49,7 @@ INSTALLED_APPS = [
 APPS = [
     "accounts.apps.AccountsConfig",
     "quizzes.apps.QuizzesConfig",
-    # "activities.apps.ActivitiesConfig",
+    "activities.apps.ActivitiesConfig",
 ]
 
 THIRD_PARTY_APPS = [
@@ -153,19 +153,44 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST framework throttle settings
 REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': (
+        'core.authentication.CachedJWTAuthentication',
+    ),
+    # Views opt in with `throttle_scope`; limits are sliding windows per client (see core.throttling)
+    'DEFAULT_THROTTLE_CLASSES': (
+        'core.throttling.SlidingWindowThrottle',
+    ),
     'DEFAULT_THROTTLE_RATES': {
-        'anon': '5/minute', # Users who are not authenticated can make 5 requests per minute
-    }
-}
-
-# REST framework versioning settings
-REST_FRAMEWORK = {
+        'anon': '20/minute', # Per IP across register, login and token refresh (core.throttling.AnonSlidingWindowThrottle)
+        'login': '10/minute',
+        'register': '5/hour',
+        'start': '30/minute',
+        'submit': '30/minute',
+        'autosave': '120/minute',
+        'batch-submit': '10/minute',
+    },
+    # Clients are identified by REMOTE_ADDR unless this many trusted proxies set X-Forwarded-For;
+    # trusting a client-set header would let it pick a fresh identity per request.
+    'NUM_PROXIES': int(os.getenv("NUM_PROXIES", "0")),
+    # Versioning
     'DEFAULT_VERSIONING_CLASS': 'rest_framework.versioning.URLPathVersioning',
     'DEFAULT_VERSION': 'v1',
     'ALLOWED_VERSIONS': ['v1', 'v2'],
     'VERSION_PARAM': 'version',
 }
 
+# JWT settings: tokens carry the user's token version (see core.authentication)
+SIMPLE_JWT = {
+    'TOKEN_OBTAIN_SERIALIZER': 'core.authentication.VersionedTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'core.authentication.VersionedTokenRefreshSerializer',
+}
+
+# Seconds an authenticated user record is reused from the in-process cache
+AUTH_USER_CACHE_TTL = 60
+
+# Quiz search: upper bound on ranked matches returned by the SQLite FTS5 backend
+QUIZ_SEARCH_MAX_RESULTS = 500
+
 # Unfold settings
 UNFOLD = {
     "SITE_TITLE": "Quiz App Admin",
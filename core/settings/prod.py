@@ -1,5 +1,7 @@
 # config/settings/prod.py
 
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *
 
 DEBUG = False
@@ -16,6 +18,19 @@ DATABASES = {
     }
 }
 
+# Version counters, cached payloads and rate limits must be shared by every
+# worker process; a per-process cache would serve stale payloads and let
+# each worker grant its own rate limit.
+if not os.getenv("REDIS_URL"):
+    raise ImproperlyConfigured("REDIS_URL must be set in production.")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL"),
+    }
+}
+
 SECURE_SSL_REDIRECT = True
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
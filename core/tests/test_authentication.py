@@ -0,0 +1,127 @@
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from core.authentication import TOKEN_VERSION_CLAIM, VersionedRefreshToken
+
+PASSWORD = "strong_password_123"
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(email="jwt@example.com", username="jwt", password=PASSWORD)
+
+
+def url(name):
+    return reverse(name, kwargs={'version': 'v1'})
+
+
+def bearer(token):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
+
+
+@pytest.mark.django_db
+class TestJWTAuthentication:
+
+    def test_login_issues_versioned_tokens(self, user):
+        response = APIClient().post(url('login'), {'email': user.email, 'password': PASSWORD})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert bearer(response.data['access']).get(url('my-profile')).data['username'] == "jwt"
+        assert RefreshToken(response.data['refresh'])[TOKEN_VERSION_CLAIM] == 0
+
+    def test_unauthenticated_requests_get_401(self, db):
+        response = APIClient().get(url('quiz-history'))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response['WWW-Authenticate'].startswith("Bearer")
+
+    def test_warm_user_is_not_queried(self, user, django_assert_num_queries):
+        client = bearer(VersionedRefreshToken.for_user(user).access_token)
+        client.get(url('quiz-history'))
+
+        # Only the history page itself.
+        with django_assert_num_queries(1):
+            assert client.get(url('quiz-history')).status_code == status.HTTP_200_OK
+
+    def test_password_change_revokes_tokens(self, user):
+        refresh = VersionedRefreshToken.for_user(user)
+        client = bearer(refresh.access_token)
+        client.get(url('quiz-history'))
+
+        user.set_password("another_password_456")
+        user.save()
+
+        assert client.get(url('quiz-history')).status_code == status.HTTP_401_UNAUTHORIZED
+        response = APIClient().post(url('token_refresh'), {'refresh': str(refresh)})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_deactivation_revokes_tokens(self, user):
+        client = bearer(VersionedRefreshToken.for_user(user).access_token)
+        client.get(url('quiz-history'))
+
+        user.is_active = False
+        user.save(update_fields=['is_active'])
+        user.is_active = True
+        user.save()
+
+        assert User.objects.get(pk=user.pk).token_version == 1
+        assert client.get(url('quiz-history')).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_other_saves_keep_tokens(self, user):
+        client = bearer(VersionedRefreshToken.for_user(user).access_token)
+
+        user.bio = "Still me"
+        user.save()
+
+        assert client.get(url('quiz-history')).status_code == status.HTTP_200_OK
+
+    def test_tokens_without_a_version_count_as_version_zero(self, user):
+        legacy = RefreshToken.for_user(user)
+
+        assert bearer(legacy.access_token).get(url('quiz-history')).status_code == status.HTTP_200_OK
+
+        user.set_password("another_password_456")
+        user.save()
+
+        assert bearer(legacy.access_token).get(url('quiz-history')).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_cached_records_expire(self, user, settings, django_assert_num_queries):
+        settings.AUTH_USER_CACHE_TTL = 0
+        client = bearer(VersionedRefreshToken.for_user(user).access_token)
+        client.get(url('quiz-history'))
+
+        with django_assert_num_queries(2):
+            client.get(url('quiz-history'))
+
+    def test_stale_cached_user_is_not_written_back(self, user):
+        client = bearer(VersionedRefreshToken.for_user(user).access_token)
+        client.get(url('my-profile'))
+        # A password change in another process, which leaves this one's record cache alone.
+        User.objects.filter(pk=user.pk).update(password=make_password("another_password_456"), token_version=1)
+
+        response = client.patch(url('my-profile'), {'bio': "Stale"}, format='json')
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        fresh = User.objects.get(pk=user.pk)
+        assert fresh.token_version == 1
+        assert fresh.bio != "Stale"
+        login = APIClient().post(url('login'), {'email': user.email, 'password': PASSWORD})
+        assert login.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_profile_update_saves_the_current_row(self, user):
+        client = bearer(VersionedRefreshToken.for_user(user).access_token)
+        client.get(url('my-profile'))
+        User.objects.filter(pk=user.pk).update(first_name="Changed elsewhere")
+
+        response = client.patch(url('my-profile'), {'bio': "Fresh"}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        fresh = User.objects.get(pk=user.pk)
+        assert (fresh.bio, fresh.first_name) == ("Fresh", "Changed elsewhere")
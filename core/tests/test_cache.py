@@ -0,0 +1,15 @@
+import time
+from types import SimpleNamespace
+
+from core.cache import VERSION_TIMEOUT, get_version
+
+
+class TestVersions:
+
+    def test_unknown_version_expires(self, monkeypatch):
+        first = get_version("quiz:999999")
+        later = SimpleNamespace(time=lambda: time.time() + VERSION_TIMEOUT + 1)
+        monkeypatch.setattr("django.core.cache.backends.base.time", later)
+        monkeypatch.setattr("django.core.cache.backends.locmem.time", later)
+
+        assert get_version("quiz:999999") > first
@@ -0,0 +1,128 @@
+import json
+from base64 import b64encode
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from accounts.models import User
+from core.pagination import EstimatedCountPaginator
+from quizzes.models import Quiz, TakenQuiz
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+
+    @pytest.fixture
+    def user(self):
+        return User.objects.create_user(email="pager@example.com", username="pager", password="password123")
+
+    @pytest.fixture
+    def history(self, user):
+        """25 attempts; groups of five share a completed_at to exercise the id tie-breaker."""
+        quiz = Quiz.objects.create(title="Paging", description="")
+        attempts = [TakenQuiz.objects.create(user=user, quiz=quiz, started_at=timezone.now()) for _ in range(25)]
+        base = timezone.now()
+        for index, attempt in enumerate(attempts):
+            TakenQuiz.objects.filter(pk=attempt.pk).update(completed_at=base + timedelta(minutes=index // 5))
+        return TakenQuiz.objects.filter(user=user).order_by('-completed_at', '-id')
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    def test_walks_forward_and_back_without_gaps(self, user, history):
+        client = self.client_for(user)
+        url = reverse('quiz-history', kwargs={'version': 'v1'})
+
+        seen, pages, next_url = [], [], f"{url}?page_size=10"
+        while next_url:
+            response = client.get(next_url)
+            assert response.status_code == 200
+            ids = [row['id'] for row in response.data['results']]
+            pages.append((ids, response.data['previous']))
+            seen += ids
+            next_url = response.data['next']
+
+        assert seen == [attempt.id for attempt in history]
+        assert [len(ids) for ids, _ in pages] == [10, 10, 5]
+        assert pages[0][1] is None
+
+        # Following "previous" from the last page returns the middle page again.
+        response = client.get(pages[2][1])
+        assert [row['id'] for row in response.data['results']] == pages[1][0]
+
+    def test_page_fetch_runs_no_count_query(self, user, history):
+        client = self.client_for(user)
+        url = reverse('quiz-history', kwargs={'version': 'v1'})
+        next_url = client.get(url).data['next']
+
+        with CaptureQueriesContext(connection) as queries:
+            client.get(next_url)
+
+        assert len(queries) == 1
+        assert 'COUNT(' not in queries[0]['sql'].upper()
+        assert 'OFFSET' not in queries[0]['sql'].upper()
+
+    def test_tampered_cursor_is_rejected(self, user, history):
+        url = reverse('quiz-history', kwargs={'version': 'v1'})
+        response = self.client_for(user).get(url, {'cursor': 'not-a-cursor'})
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize('position', [["abc", 1], [None, None], [{"dt": 5}, 1], [{"dt": "2024-01-01T00:00:00+00:00"}, "zz"], [[1], {}]])
+    def test_cursor_with_wrong_value_types_is_rejected(self, user, history, position):
+        url = reverse('quiz-history', kwargs={'version': 'v1'})
+        cursor = b64encode(json.dumps({'p': position}).encode()).decode()
+        response = self.client_for(user).get(url, {'cursor': cursor})
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize('name, position', [
+        ('quiz-list', ["abc", 1]), ('quiz-list', [{"dt": "2024-01-01T00:00:00+00:00"}, "zz"]),
+    ])
+    def test_tampered_quiz_list_cursor_is_rejected(self, name, position):
+        cursor = b64encode(json.dumps({'p': position}).encode()).decode()
+        response = APIClient().get(reverse(name, kwargs={'version': 'v1'}), {'cursor': cursor})
+        assert response.status_code == 404
+
+    def test_tampered_search_and_leaderboard_cursors_are_rejected(self):
+        Quiz.objects.create(title="Algebra basics", description="")
+        for url, position in [
+            (reverse('quiz-list', kwargs={'version': 'v1'}) + "?search=algebra", ["high", 1]),
+            (reverse('leaderboard', kwargs={'version': 'v1', 'period': 'all-time'}), ["first"]),
+        ]:
+            cursor = b64encode(json.dumps({'p': position}).encode()).decode()
+            assert APIClient().get(url, {'cursor': cursor}).status_code == 404
+
+    def test_quiz_list_is_paginated_newest_first(self):
+        quizzes = [Quiz.objects.create(title=f"Quiz {i}", description="") for i in range(3)]
+        url = reverse('quiz-list', kwargs={'version': 'v1'})
+
+        response = APIClient().get(url, {'page_size': 2})
+
+        assert [row['id'] for row in response.data['results']] == [quizzes[2].id, quizzes[1].id]
+        assert response.data['next'] is not None
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPaginator:
+
+    @pytest.fixture
+    def quizzes(self):
+        Quiz.objects.bulk_create(Quiz(title=f"Quiz {i}", description="") for i in range(3))
+        return Quiz.objects.order_by('id')
+
+    def test_large_unfiltered_tables_use_the_estimate(self, quizzes, monkeypatch):
+        monkeypatch.setattr('core.pagination.estimated_count', lambda model, using: 5_000_000)
+
+        assert EstimatedCountPaginator(quizzes, 2).count == 5_000_000
+        assert EstimatedCountPaginator(quizzes.filter(title="Quiz 1"), 2).count == 1
+
+    def test_small_or_unknown_estimates_count_exactly(self, quizzes, monkeypatch):
+        monkeypatch.setattr('core.pagination.estimated_count', lambda model, using: 10)
+        assert EstimatedCountPaginator(quizzes, 2).count == 3
+
+        monkeypatch.setattr('core.pagination.estimated_count', lambda model, using: None)
+        assert EstimatedCountPaginator(quizzes, 2).count == 3
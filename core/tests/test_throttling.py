@@ -0,0 +1,112 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from core.throttling import SlidingWindowThrottle
+
+
+class Clock:
+    def __init__(self, now=1_000_020.0):  # 20 s into a one-minute window
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(SlidingWindowThrottle, 'timer', lambda self: clock())
+    monkeypatch.setattr(SlidingWindowThrottle, 'THROTTLE_RATES', {
+        'login': '3/minute', 'submit': '2/minute', 'register': '5/hour', 'start': '30/minute', 'anon': '6/minute',
+    })
+    return clock
+
+
+def login(client, email="nobody@example.com"):
+    return client.post(reverse('login', kwargs={'version': 'v1'}), {'email': email, 'password': "wrong"})
+
+
+class TestSlidingWindowEstimate:
+
+    def test_previous_window_slides_out(self):
+        assert SlidingWindowThrottle.estimate(previous=10, current=2, elapsed=0.0) == 12
+        assert SlidingWindowThrottle.estimate(previous=10, current=2, elapsed=0.75) == 4.5
+        assert SlidingWindowThrottle.estimate(previous=10, current=2, elapsed=1.0) == 2
+
+
+@pytest.mark.django_db
+class TestSlidingWindowThrottle:
+
+    def test_login_is_limited_per_client(self, clock):
+        client = APIClient()
+        assert [login(client).status_code for _ in range(3)] == [status.HTTP_401_UNAUTHORIZED] * 3
+
+        response = login(client)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response['Retry-After']) > 0
+        assert login(APIClient()).status_code == status.HTTP_429_TOO_MANY_REQUESTS  # same IP
+        other = APIClient(REMOTE_ADDR="10.0.0.2")
+        assert login(other).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_window_slides_rather_than_resets(self, clock):
+        client = APIClient()
+        clock.now += 30  # late in the window
+        for _ in range(3):
+            login(client)
+
+        clock.now += 15  # a new fixed window, but most of the last one still overlaps
+        assert login(client).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+        clock.now += 55  # the burst has slid out
+        assert login(client).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_authenticated_clients_are_limited_by_user(self, clock):
+        user = User.objects.create_user(email="t@example.com", username="throttled")
+        client = APIClient(REMOTE_ADDR="10.0.0.3")
+        client.force_authenticate(user=user)
+        submit = reverse('quiz-submit', kwargs={'version': 'v1'})
+
+        codes = [client.post(submit, {}, format='json').status_code for _ in range(3)]
+
+        assert codes[-1] == status.HTTP_429_TOO_MANY_REQUESTS
+        neighbour = APIClient(REMOTE_ADDR="10.0.0.3")
+        neighbour.force_authenticate(user=User.objects.create_user(email="n@example.com", username="neighbour"))
+        assert neighbour.post(submit, {}, format='json').status_code != status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_auth_endpoints_share_a_per_ip_limit(self, clock):
+        client = APIClient()
+        register = reverse('register', kwargs={'version': 'v1'})
+        refresh = reverse('token_refresh', kwargs={'version': 'v1'})
+        # Within the login and register limits, but together at the anon one.
+        assert [login(client).status_code for _ in range(3)] == [status.HTTP_401_UNAUTHORIZED] * 3
+        assert all(client.post(register, {}).status_code == status.HTTP_400_BAD_REQUEST for _ in range(3))
+
+        assert client.post(refresh, {'refresh': "x"}).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        other = APIClient(REMOTE_ADDR="10.0.0.4")
+        assert other.post(refresh, {'refresh': "x"}).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_forwarded_for_does_not_reset_the_window(self, clock):
+        client = APIClient()
+        assert [login(client).status_code for _ in range(3)] == [status.HTTP_401_UNAUTHORIZED] * 3
+
+        spoofed = APIClient(HTTP_X_FORWARDED_FOR="203.0.113.9")
+
+        assert login(spoofed).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_forwarded_for_is_used_behind_trusted_proxies(self, clock, settings):
+        settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, 'NUM_PROXIES': 1}
+        for _ in range(3):
+            login(APIClient(HTTP_X_FORWARDED_FOR="203.0.113.9"))
+
+        assert login(APIClient(HTTP_X_FORWARDED_FOR="203.0.113.9")).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert login(APIClient(HTTP_X_FORWARDED_FOR="203.0.113.10")).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_unscoped_views_are_not_limited(self, clock, db):
+        client = APIClient()
+        url = reverse('category-list', kwargs={'version': 'v1'})
+
+        assert all(client.get(url).status_code == status.HTTP_200_OK for _ in range(10))
@@ -0,0 +1,80 @@
+"""
+Sliding-window rate limiting on the shared cache.
+
+Each (scope, client) key keeps two counters: requests in the current fixed
+window and in the previous one. The sliding-window estimate weights the
+previous count by how much of it still overlaps the last `duration`
+seconds. That needs O(1) memory per key instead of a timestamp log.
+Counting is an atomic cache increment, so limits hold across worker
+processes that share the cache. Rejected requests count too, so a client
+that keeps retrying stays throttled.
+"""
+from django.core.cache import cache
+from rest_framework.throttling import ScopedRateThrottle
+
+from core.cache import incr_counter
+
+THROTTLE_KEY_PREFIX = "throttle"
+
+
+class SlidingWindowThrottle(ScopedRateThrottle):
+    """
+    Limit each client per view scope (the view's `throttle_scope`), using the
+    rates in DEFAULT_THROTTLE_RATES. Clients are identified by user id when
+    authenticated and by IP address otherwise.
+    """
+    cache_format = THROTTLE_KEY_PREFIX + ":%(scope)s:%(ident)s"
+
+    def get_scope(self, view):
+        return getattr(view, self.scope_attr, None)
+
+    def allow_request(self, request, view):
+        self.scope = self.get_scope(view)
+        if not self.scope:
+            return True
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window, position = divmod(self.now, self.duration)
+        window = int(window)
+        self.elapsed = position / self.duration
+        self.previous = cache.get(f"{self.key}:{window - 1}", 0)
+        # The current window's counter is still read as `previous` by the next one.
+        self.current = incr_counter(f"{self.key}:{window}", timeout=2 * self.duration)
+        return self.estimate(self.previous, self.current, self.elapsed) <= self.num_requests
+
+    @staticmethod
+    def estimate(previous, current, elapsed):
+        """Requests in the sliding window ending `elapsed` (0-1) into the current window."""
+        return previous * (1 - elapsed) + current
+
+    def wait(self):
+        """Seconds until the sliding window has room for another request."""
+        room = self.num_requests - 1
+        if self.current <= room:
+            # Wait for enough of the previous window to slide out.
+            needed = 1 - (room - self.current) / self.previous
+            return max(0.0, (needed - self.elapsed) * self.duration)
+        # Wait for the next window, then for enough of this one to slide out.
+        needed = 1 - room / self.current
+        return (1 - self.elapsed + needed) * self.duration
+
+
+class AnonSlidingWindowThrottle(SlidingWindowThrottle):
+    """
+    One 'anon' limit per IP address, shared by every view that lists this
+    throttle next to its own scoped one. The unauthenticated auth endpoints
+    (register, login, token refresh) use it, so spreading attempts over them
+    doesn't multiply what a client may try.
+    """
+    scope = 'anon'
+
+    def get_scope(self, view):
+        return self.scope
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
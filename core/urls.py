@@ -41,4 +41,5 @@ urlpatterns = [
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
     path('api/<str:version>/accounts/', include('accounts.urls')),
     path('api/<str:version>/quizzes/', include('quizzes.urls')),
+    path('api/<str:version>/activities/', include('activities.urls')),
 ]
@@ -0,0 +1,304 @@
+"""
+Rule-based achievements.
+
+Each rule awards the Achievement whose `code` matches its own. Rules declare
+the events that can make them true, and RULES_BY_EVENT indexes them by
+event, so recording a completed quiz only evaluates the rules its events
+trigger: an uncategorised, imperfect attempt never looks at category totals.
+Evaluation is batched. The progress of every user in a batch is loaded with
+one query, and new awards are inserted with one bulk_create. The unique
+(user, achievement) constraint makes repeated awards no-ops, and only awards
+actually inserted are returned and announced.
+
+The Achievement rows of these rules are created by migration
+quizzes/0014_rule_achievements. `sync_achievements()` creates those of rules
+added since, and `backfill_achievements()` evaluates every rule for every
+user in chunks (the backfill_achievements command runs both).
+"""
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.dispatch import Signal
+
+from accounts.cache import get_achievement_ids, invalidate_achievement_ids, invalidate_all_profiles, invalidate_profile
+from accounts.models import Achievement, Profile, UserAchievement
+
+from .models import TakenQuiz, UserCategoryStat
+
+# Events raised by completed attempts.
+QUIZ_COMPLETED = "quiz_completed"
+PERFECT_SCORE = "perfect_score"
+CATEGORY_PROGRESS = "category_progress"
+
+# Data a rule may need loaded into Progress.
+PROFILE = "profile"
+CATEGORIES = "categories"
+
+PERFECT = 100.0
+BACKFILL_CHUNK_SIZE = 1000
+
+# Sent with `awards`, a list of new UserAchievement instances.
+achievements_earned = Signal()
+
+
+class Progress:
+    """What rules may inspect about one user. Fields no triggered rule needs stay at their defaults."""
+    __slots__ = ('perfect_score', 'quizzes_taken', 'current_streak', 'category_attempts')
+
+    def __init__(self):
+        self.perfect_score = False
+        self.quizzes_taken = 0
+        self.current_streak = 0
+        self.category_attempts = 0  # attempts in the user's most played category
+
+
+class Rule:
+    """Awards the achievement `code` once `earned(progress)` holds."""
+    events = ()
+    needs = frozenset()
+
+    def __init__(self, code, name, description, badge_type):
+        self.code = code
+        self.name = name
+        self.description = description
+        self.badge_type = badge_type
+
+    def earned(self, progress):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.code}>"
+
+
+class QuizzesTaken(Rule):
+    events = (QUIZ_COMPLETED,)
+    needs = frozenset({PROFILE})
+
+    def __init__(self, code, name, description, badge_type, count):
+        super().__init__(code, name, description, badge_type)
+        self.count = count
+
+    def earned(self, progress):
+        return progress.quizzes_taken >= self.count
+
+
+class PerfectScore(Rule):
+    events = (PERFECT_SCORE,)
+
+    def earned(self, progress):
+        return progress.perfect_score
+
+
+class CategoryAttempts(Rule):
+    events = (CATEGORY_PROGRESS,)
+    needs = frozenset({CATEGORIES})
+
+    def __init__(self, code, name, description, badge_type, count):
+        super().__init__(code, name, description, badge_type)
+        self.count = count
+
+    def earned(self, progress):
+        return progress.category_attempts >= self.count
+
+
+class Streak(Rule):
+    events = (QUIZ_COMPLETED,)
+    needs = frozenset({PROFILE})
+
+    def __init__(self, code, name, description, badge_type, days):
+        super().__init__(code, name, description, badge_type)
+        self.days = days
+
+    def earned(self, progress):
+        return progress.current_streak >= self.days
+
+
+RULES = (
+    QuizzesTaken("first-quiz", "First Steps", "Complete your first quiz.", "uncommon", count=1),
+    QuizzesTaken("quizzes-50", "Quiz Veteran", "Complete 50 quizzes.", "rare", count=50),
+    PerfectScore("perfect-score", "Flawless", "Score 100% on a quiz.", "rare"),
+    CategoryAttempts("category-10", "Specialist", "Complete 10 quizzes in one category.", "rare", count=10),
+    Streak("streak-7", "On Fire", "Complete a quiz on 7 days in a row.", "epic", days=7),
+)
+
+
+def index_rules(rules):
+    """Map each event to the rules it can trigger."""
+    by_event = defaultdict(list)
+    for rule in rules:
+        for event in rule.events:
+            by_event[event].append(rule)
+    return dict(by_event)
+
+
+RULES_BY_EVENT = index_rules(RULES)
+
+
+def completion_events(attempts):
+    """The events raised by a user's newly completed attempts."""
+    events = {QUIZ_COMPLETED}
+    for attempt in attempts:
+        if attempt.score >= PERFECT:
+            events.add(PERFECT_SCORE)
+        if attempt.quiz.category_id is not None:
+            events.add(CATEGORY_PROGRESS)
+    return events
+
+
+def award_for_attempts(attempts, rules_by_event=RULES_BY_EVENT):
+    """
+    Evaluate the rules triggered by newly completed attempts (see
+    quizzes.signals) and award what they unlocked. Returns the new awards.
+    """
+    achievement_ids = get_achievement_ids()
+    per_user = defaultdict(list)
+    for attempt in attempts:
+        per_user[attempt.user_id].append(attempt)
+
+    triggered = {}
+    for user_id, user_attempts in per_user.items():
+        rules = {
+            rule for event in completion_events(user_attempts)
+            for rule in rules_by_event.get(event, ()) if rule.code in achievement_ids
+        }
+        if rules:
+            triggered[user_id] = rules
+    if not triggered:
+        return []
+
+    needs = set().union(*(rule.needs for rules in triggered.values() for rule in rules))
+    category_ids = {attempt.quiz.category_id for attempt in attempts} - {None}
+    progress = _load_progress(list(triggered), needs, category_ids)
+    for attempt in attempts:
+        if attempt.score >= PERFECT:
+            progress[attempt.user_id].perfect_score = True
+
+    awards = _award(
+        (user_id, rule) for user_id, rules in triggered.items() for rule in rules if rule.earned(progress[user_id])
+    )
+    if awards:
+        usernames = {attempt.user_id: attempt.user.username for attempt in attempts}
+        for user_id in {award.user_id for award in awards}:
+            invalidate_profile(usernames[user_id])
+        achievements_earned.send(sender=UserAchievement, awards=awards)
+    return awards
+
+
+def _load_progress(user_ids, needs, category_ids=None):
+    """Progress of each user, with one query for the profile and category data `needs`."""
+    progress = defaultdict(Progress)
+    if not needs:
+        return progress
+
+    rows = Profile.objects.filter(user_id__in=user_ids)
+    fields = ['user_id']
+    if PROFILE in needs:
+        fields += ['quizzes_taken', 'current_streak']
+    if CATEGORIES in needs:
+        stats = UserCategoryStat.objects.filter(user_id=OuterRef('user_id'))
+        if category_ids is not None:
+            stats = stats.filter(category_id__in=category_ids)
+        top = stats.order_by('-attempts').values('attempts')[:1]
+        rows = rows.annotate(category_attempts=Coalesce(Subquery(top), Value(0)))
+        fields.append('category_attempts')
+
+    for row in rows.values(*fields):
+        user_progress = progress[row.pop('user_id')]
+        for name, value in row.items():
+            setattr(user_progress, name, value)
+    return progress
+
+
+def _award(earned):
+    """Insert the awards in `earned` ((user id, rule) pairs) that are new. Returns them."""
+    achievement_ids = get_achievement_ids()
+    pairs = {(user_id, achievement_ids[rule.code]) for user_id, rule in earned}
+    if not pairs:
+        return []
+
+    existing = set(
+        UserAchievement.objects.filter(
+            user_id__in={user_id for user_id, _ in pairs},
+            achievement_id__in={achievement_id for _, achievement_id in pairs},
+        ).values_list('user_id', 'achievement_id')
+    )
+    return _insert_awards(sorted(pairs - existing))
+
+
+def _insert_awards(pairs):
+    """
+    Insert UserAchievements for (user id, achievement id) `pairs` and return
+    those actually inserted. A pair awarded concurrently since it was checked
+    fails the unique constraint; the batch is then retried row by row, so it
+    is left out rather than announced twice.
+    """
+    awards = [UserAchievement(user_id=user_id, achievement_id=achievement_id) for user_id, achievement_id in pairs]
+    if not awards:
+        return []
+    try:
+        with transaction.atomic():
+            return UserAchievement.objects.bulk_create(awards)
+    except IntegrityError:
+        pass
+
+    inserted = []
+    for award in awards:
+        award.pk = None
+        try:
+            with transaction.atomic():
+                award.save(force_insert=True)
+        except IntegrityError:
+            continue
+        inserted.append(award)
+    return inserted
+
+
+def sync_achievements(rules=RULES):
+    """
+    Create the Achievement of each rule that has none. Existing rows, which
+    may have been edited in the admin, are left alone. Returns the number created.
+    """
+    existing = set(Achievement.objects.filter(code__in=[rule.code for rule in rules]).values_list('code', flat=True))
+    created = Achievement.objects.bulk_create(
+        [
+            Achievement(code=rule.code, name=rule.name, description=rule.description, badge_type=rule.badge_type)
+            for rule in rules if rule.code not in existing
+        ],
+        ignore_conflicts=True,
+    )
+    if created:
+        invalidate_achievement_ids()
+    return len(created)
+
+
+def backfill_achievements(rules=RULES, chunk_size=BACKFILL_CHUNK_SIZE):
+    """
+    Evaluate every rule for every user, `chunk_size` users at a time, e.g.
+    after adding a rule. Returns the number of achievements awarded.
+    """
+    achievement_ids = get_achievement_ids()
+    rules = [rule for rule in rules if rule.code in achievement_ids]
+    needs = set().union(*(rule.needs for rule in rules))
+    profiles = Profile.objects.order_by('user_id').values_list('user_id', flat=True)
+
+    awarded = 0
+    last_user_id = 0
+    while rules:
+        user_ids = list(profiles.filter(user_id__gt=last_user_id)[:chunk_size])
+        if not user_ids:
+            break
+        last_user_id = user_ids[-1]
+
+        progress = _load_progress(user_ids, needs)
+        perfect = TakenQuiz.objects.filter(user_id__in=user_ids, score__gte=PERFECT).order_by()
+        for user_id in perfect.values_list('user_id', flat=True).distinct():
+            progress[user_id].perfect_score = True
+        awarded += len(_award(
+            (user_id, rule) for user_id in user_ids for rule in rules if rule.earned(progress[user_id])
+        ))
+
+    if awarded:
+        invalidate_all_profiles()
+    return awarded
@@ -1,8 +1,23 @@
-from django.contrib import admin
+from django import forms
+from django.contrib import admin, messages
+from django.http import StreamingHttpResponse
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import reverse
 from unfold.admin import ModelAdmin
+from unfold.contrib.filters.admin import AutocompleteSelectFilter, RangeDateTimeFilter
+from unfold.decorators import action
+from core.pagination import EstimatedCountPaginator
+from quizzes.bulk import QuizImportError, export_quizzes, import_quizzes
 from quizzes.models import Category, Quiz, Question, Choice, TakenQuiz
 import nested_admin
 
+
+class QuizImportForm(forms.Form):
+    """Upload form for the JSONL quiz import."""
+    file = forms.FileField(help_text="One quiz per line, as written by the export action.")
+
+
 class ChoiceInline(nested_admin.NestedTabularInline):
     """Nested inline for choices."""
     model = Choice
@@ -27,12 +42,42 @@ class QuizAdmin(nested_admin.NestedModelAdmin, ModelAdmin):
     Admin interface for quizzes using nested_admin for hierarchy 
     and Unfold for the premium look.
     """
-    list_display = ("title", "category", "difficulty", "time_limit_minutes", "is_active", "created_at")
+    list_display = (
+        "title", "category", "difficulty", "suggested_difficulty", "time_limit_minutes", "is_active", "created_at"
+    )
     list_filter = ("category", "difficulty", "is_active")
     search_fields = ("title", "description")
     list_editable = ("is_active",)
     inlines = [QuestionInline]
     readonly_fields = ("created_at", "updated_at")
+    actions = ["export_jsonl"]
+    actions_list = ["import_jsonl"]
+
+    @admin.action(description="Export selected quizzes as JSONL")
+    def export_jsonl(self, request, queryset):
+        response = StreamingHttpResponse(export_quizzes(queryset), content_type="application/x-ndjson")
+        response["Content-Disposition"] = 'attachment; filename="quizzes.jsonl"'
+        return response
+
+    @action(description="Import JSONL", url_path="import-jsonl", permissions=["add"])
+    def import_jsonl(self, request):
+        form = QuizImportForm(request.POST or None, request.FILES or None)
+        if request.method == "POST" and form.is_valid():
+            try:
+                count = import_quizzes(form.cleaned_data["file"])
+            except QuizImportError as exc:
+                form.add_error("file", str(exc))
+            else:
+                self.message_user(request, f"Imported {count} quizzes.", messages.SUCCESS)
+                return redirect(reverse("admin:quizzes_quiz_changelist"))
+
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": "Import quizzes",
+            "form": form,
+        }
+        return TemplateResponse(request, "admin/quizzes/quiz/import_jsonl.html", context)
 
     class Media:
         css = {
@@ -41,13 +86,29 @@ class QuizAdmin(nested_admin.NestedModelAdmin, ModelAdmin):
 
 @admin.register(Question)
 class QuestionAdmin(ModelAdmin):
-    """Standalone admin for questions if needed."""
-    list_display = ("text", "quiz", "order")
+    """Standalone admin for questions if needed. Lists item statistics (see quizzes.analysis)."""
+    list_display = ("text", "quiz", "order", "p_value", "discrimination", "analysed_attempts")
     list_filter = ("quiz", "quiz__category")
+    list_select_related = ("quiz", "stat")
     search_fields = ("text",)
     inlines = [ChoiceInline]
     ordering = ("quiz", "order")
 
+    @admin.display(description="P-value", ordering="stat__p_value")
+    def p_value(self, obj):
+        stat = getattr(obj, "stat", None)
+        return None if stat is None or stat.p_value is None else round(stat.p_value, 3)
+
+    @admin.display(description="Discrimination", ordering="stat__discrimination")
+    def discrimination(self, obj):
+        stat = getattr(obj, "stat", None)
+        return None if stat is None or stat.discrimination is None else round(stat.discrimination, 3)
+
+    @admin.display(description="Attempts", ordering="stat__attempts")
+    def analysed_attempts(self, obj):
+        stat = getattr(obj, "stat", None)
+        return None if stat is None else stat.attempts
+
 @admin.register(Choice)
 class ChoiceAdmin(ModelAdmin):
     """Standalone admin for choices."""
@@ -57,9 +118,21 @@ class ChoiceAdmin(ModelAdmin):
 
 @admin.register(TakenQuiz)
 class TakenQuizAdmin(ModelAdmin):
-    """Admin for tracking user attempts."""
+    """
+    Admin for tracking user attempts. Built for millions of rows: users and
+    quizzes are picked by autocomplete rather than listed, there is no date
+    hierarchy (it scans every date), and the unfiltered count is estimated.
+    """
     list_display = ("user", "quiz", "score", "correct_answers", "total_questions", "completed_at", "duration")
-    list_filter = ("quiz", "user", "completed_at")
+    list_filter = (
+        ("quiz", AutocompleteSelectFilter),
+        ("user", AutocompleteSelectFilter),
+        ("completed_at", RangeDateTimeFilter),
+    )
+    list_filter_submit = True
+    list_select_related = ("user", "quiz")
+    autocomplete_fields = ("user", "quiz")
     search_fields = ("user__username", "user__email", "quiz__title")
     readonly_fields = ("completed_at",)
-    date_hierarchy = "completed_at"
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
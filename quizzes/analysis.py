@@ -0,0 +1,165 @@
+"""
+Item analysis of questions from submitted answers.
+
+For each quiz, the packed choice IDs of its submitted attempts (see
+quizzes.scoring.pack_choice_ids) are decoded `chunk_size` attempts at a
+time into a boolean attempts x choices matrix. Each chunk is reduced with a
+few array operations to sums: attempts, choices picked, questions answered
+correctly, and the sums needed to correlate each question with the rest of
+the quiz. Memory therefore stays bounded however many attempts a quiz has.
+Per question this gives:
+
+- p-value: the share of attempts answering it correctly (as in
+  AnswerKey.count_correct, a question counts as correct if any chosen
+  choice is correct);
+- discrimination: the point-biserial correlation between answering it
+  correctly and the number of other questions answered correctly;
+- choice rates: the share of attempts choosing each of its choices.
+
+Results go to QuestionStat, and the quiz's mean p-value suggests its
+difficulty. The analyze_items command runs `analyze_items()`.
+"""
+import numpy as np
+from django.db import transaction
+
+from .models import QuestionStat, Quiz, TakenQuiz
+from .scoring import CHOICE_ID_SIZE, get_answer_key
+
+CHUNK_SIZE = 100_000
+# Quizzes need this many analysed attempts before a difficulty is suggested.
+MIN_ATTEMPTS = 30
+# Lowest mean p-value of each suggested difficulty, easiest first.
+DIFFICULTY_P_VALUES = ((Quiz.Difficulty.EASY, 0.7), (Quiz.Difficulty.MEDIUM, 0.4), (Quiz.Difficulty.HARD, 0.0))
+
+
+class ItemSums:
+    """Running sums of one quiz's attempts, from which the item statistics follow."""
+
+    def __init__(self, answer_key):
+        self.choice_ids = np.array(sorted(answer_key.choice_questions), dtype=np.uint64)
+        self.question_ids = sorted(answer_key.question_ids())
+        question_columns = {question_id: i for i, question_id in enumerate(self.question_ids)}
+        self.correct_columns = np.array(
+            [i for i, choice_id in enumerate(self.choice_ids.tolist()) if choice_id in answer_key.correct_choice_ids],
+            dtype=np.intp,
+        )
+        # Maps the correct choices onto their questions.
+        self.correct_questions = np.zeros((len(self.correct_columns), len(self.question_ids)), dtype=np.int32)
+        for row, column in enumerate(self.correct_columns.tolist()):
+            question_id = answer_key.choice_questions[int(self.choice_ids[column])]
+            self.correct_questions[row, question_columns[question_id]] = 1
+        self.question_of_choice = [answer_key.choice_questions[choice_id] for choice_id in self.choice_ids.tolist()]
+
+        self.attempts = 0
+        self.choice_counts = np.zeros(len(self.choice_ids), dtype=np.int64)
+        self.correct = np.zeros(len(self.question_ids))  # attempts answering each question correctly
+        self.total = 0.0  # correct answers over all attempts
+        self.total_squares = 0.0
+        self.correct_totals = np.zeros(len(self.question_ids))  # attempt totals, summed where correct
+
+    def add(self, packed_answers):
+        """Add a chunk of attempts, each a packed bytes of choice IDs."""
+        count = len(packed_answers)
+        lengths = np.fromiter((len(packed) for packed in packed_answers), dtype=np.intp, count=count)
+        chosen = np.frombuffer(b"".join(packed_answers), dtype="<u8")
+        rows = np.repeat(np.arange(count), lengths // CHOICE_ID_SIZE)
+
+        # Choices no longer in the quiz are dropped.
+        columns = np.minimum(np.searchsorted(self.choice_ids, chosen), len(self.choice_ids) - 1)
+        known = self.choice_ids[columns] == chosen
+        selected = np.zeros((count, len(self.choice_ids)), dtype=bool)
+        selected[rows[known], columns[known]] = True
+
+        answered = (selected[:, self.correct_columns].astype(np.int32) @ self.correct_questions > 0).astype(np.float64)
+        totals = answered.sum(axis=1)
+        self.attempts += count
+        self.choice_counts += selected.sum(axis=0)
+        self.correct += answered.sum(axis=0)
+        self.total += totals.sum()
+        self.total_squares += totals @ totals
+        self.correct_totals += totals @ answered
+
+    def p_values(self):
+        return self.correct / self.attempts
+
+    def discriminations(self):
+        """Point-biserial correlation of each question with the rest score; NaN where undefined."""
+        n, correct = self.attempts, self.correct
+        # Sums of the rest score (the total without the question itself).
+        rest = self.total - correct
+        rest_squares = self.total_squares - 2 * self.correct_totals + correct
+        correct_rest = self.correct_totals - correct
+
+        covariance = n * correct_rest - correct * rest
+        spread = (n * correct - correct ** 2) * (n * rest_squares - rest ** 2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(spread > 0, covariance / np.sqrt(spread), np.nan)
+
+    def stats(self):
+        """One unsaved QuestionStat per question."""
+        rates = (self.choice_counts / self.attempts).tolist()
+        choice_rates = {question_id: {} for question_id in self.question_ids}
+        for choice_id, question_id, rate in zip(self.choice_ids.tolist(), self.question_of_choice, rates):
+            choice_rates[question_id][str(choice_id)] = rate
+        return [
+            QuestionStat(
+                question_id=question_id, attempts=self.attempts, p_value=p_value,
+                discrimination=None if np.isnan(discrimination) else discrimination,
+                choice_rates=choice_rates[question_id],
+            )
+            for question_id, p_value, discrimination in zip(
+                self.question_ids, self.p_values().tolist(), self.discriminations().tolist()
+            )
+        ]
+
+    def suggested_difficulty(self):
+        """The difficulty matching the mean p-value, or '' with too few attempts."""
+        if self.attempts < MIN_ATTEMPTS:
+            return ''
+        mean = float(self.p_values().mean())
+        return next(difficulty for difficulty, lowest in DIFFICULTY_P_VALUES if mean >= lowest)
+
+
+def analyze_quiz(quiz_id, chunk_size=CHUNK_SIZE):
+    """The ItemSums of a quiz's submitted attempts, or None if there is nothing to analyse."""
+    answer_key = get_answer_key(quiz_id)
+    if not answer_key.choice_questions:
+        return None
+    sums = ItemSums(answer_key)
+
+    packed = TakenQuiz.objects.filter(
+        quiz_id=quiz_id, score__isnull=False, choice_ids__isnull=False
+    ).values_list('choice_ids', flat=True)
+    chunk = []
+    for choice_ids in packed.iterator(chunk_size=chunk_size):
+        chunk.append(choice_ids)
+        if len(chunk) == chunk_size:
+            sums.add(chunk)
+            chunk = []
+    if chunk:
+        sums.add(chunk)
+    return sums if sums.attempts else None
+
+
+def analyze_items(quiz_ids=None, chunk_size=CHUNK_SIZE):
+    """
+    Refresh the QuestionStats and suggested difficulty of each quiz (default:
+    all). Returns the number of quizzes analysed.
+    """
+    if quiz_ids is None:
+        quiz_ids = Quiz.objects.order_by('id').values_list('id', flat=True)
+
+    analysed = 0
+    for quiz_id in quiz_ids:
+        sums = analyze_quiz(quiz_id, chunk_size)
+        if sums is None:
+            continue
+        with transaction.atomic():
+            QuestionStat.objects.bulk_create(
+                sums.stats(), update_conflicts=True, unique_fields=['question'],
+                update_fields=['attempts', 'p_value', 'discrimination', 'choice_rates', 'updated_at'],
+            )
+            # update() skips the save signals: a suggestion does not change the quiz's content.
+            Quiz.objects.filter(pk=quiz_id).update(suggested_difficulty=sums.suggested_difficulty())
+        analysed += 1
+    return analysed
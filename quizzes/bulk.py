@@ -0,0 +1,225 @@
+"""
+Streaming JSONL import/export of quiz content.
+
+Each line is one quiz carrying its questions and choices:
+
+    {"title": "...", "description": "...", "category": {"slug": "...", "name": "..."},
+     "difficulty": "EASY", "time_limit_minutes": 10, "is_active": true,
+     "questions": [{"text": "...", "order": 1,
+                    "choices": [{"text": "...", "is_correct": true}]}]}
+
+Both directions work in fixed-size chunks, so memory stays flat however big
+the file is. Imports bypass model signals (bulk_create), so each chunk
+indexes its quizzes for search and the catalog caches are invalidated once
+at the end.
+"""
+import json
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_slug
+from django.db import IntegrityError, transaction
+
+from .cache import invalidate_catalog, invalidate_quiz_list
+from .models import Category, Choice, Question, Quiz
+from .search import get_search_backend
+
+CHUNK_SIZE = 500  # quizzes per transaction
+# Largest value of a PositiveIntegerField on every supported database.
+MAX_POSITIVE_INTEGER = 2_147_483_647
+
+
+class QuizImportError(ValueError):
+    """A line of the import file is not a valid quiz record."""
+
+    def __init__(self, line_number, message):
+        self.line_number = line_number
+        super().__init__(f"Line {line_number}: {message}")
+
+
+def quiz_to_record(quiz):
+    """Represent a quiz with prefetched questions and choices as a JSON-ready dict."""
+    category = quiz.category
+    return {
+        'title': quiz.title,
+        'description': quiz.description,
+        'category': {'slug': category.slug, 'name': category.name} if category else None,
+        'difficulty': quiz.difficulty,
+        'time_limit_minutes': quiz.time_limit_minutes,
+        'is_active': quiz.is_active,
+        'questions': [
+            {
+                'text': question.text,
+                'order': question.order,
+                'choices': [
+                    {'text': choice.text, 'is_correct': choice.is_correct}
+                    for choice in question.choices.all()
+                ],
+            }
+            for question in quiz.questions.all()
+        ],
+    }
+
+
+def export_quizzes(queryset=None, chunk_size=CHUNK_SIZE):
+    """Yield one JSONL line per quiz, loading `chunk_size` quizzes at a time."""
+    if queryset is None:
+        queryset = Quiz.objects.all()
+    queryset = queryset.select_related('category').prefetch_related('questions__choices').order_by('id')
+    for quiz in queryset.iterator(chunk_size=chunk_size):
+        yield json.dumps(quiz_to_record(quiz), ensure_ascii=False) + "\n"
+
+
+def import_quizzes(lines, chunk_size=CHUNK_SIZE, using='default'):
+    """
+    Create quizzes from an iterable of JSONL lines and return how many were
+    created. Each chunk is validated, then committed in its own transaction;
+    an invalid line raises QuizImportError with earlier chunks kept.
+    """
+    records = _parse(lines)
+    categories = {}
+    created = 0
+    try:
+        while chunk := list(islice(records, chunk_size)):
+            with transaction.atomic(using=using):
+                created += _create_chunk(chunk, categories, using)
+    finally:
+        if created:
+            invalidate_catalog()
+            invalidate_quiz_list()
+    return created
+
+
+def _parse(lines):
+    for line_number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            try:
+                line = line.decode('utf-8')
+            except UnicodeDecodeError:
+                raise QuizImportError(line_number, "not valid UTF-8")
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            raise QuizImportError(line_number, f"invalid JSON ({exc})")
+        _validate(record, line_number)
+        yield line_number, record
+
+
+def _validate(record, line_number):
+    if not isinstance(record, dict):
+        raise QuizImportError(line_number, "expected a JSON object")
+    _check_text(record, 'title', Quiz, line_number, required=True)
+    _check_text(record, 'description', Quiz, line_number)
+    if record.get('difficulty', Quiz.Difficulty.EASY) not in Quiz.Difficulty.values:
+        raise QuizImportError(line_number, f"unknown difficulty {record['difficulty']!r}")
+    _check_integer(record, 'time_limit_minutes', line_number)
+    _check_boolean(record, 'is_active', line_number)
+
+    category = record.get('category')
+    if category is not None:
+        if not isinstance(category, dict) or not isinstance(category.get('slug'), str):
+            raise QuizImportError(line_number, "'category' must be null or an object with a 'slug'")
+        _check_text(category, 'slug', Category, line_number, required=True, context="category ")
+        try:
+            validate_slug(category['slug'])
+        except ValidationError:
+            raise QuizImportError(line_number, f"invalid category slug {category['slug']!r}")
+        _check_text(category, 'name', Category, line_number, context="category ")
+
+    for question in _check_list(record, 'questions', line_number):
+        if not isinstance(question, dict):
+            raise QuizImportError(line_number, "every question must be an object")
+        _check_text(question, 'text', Question, line_number, required=True, context="question ")
+        _check_integer(question, 'order', line_number, context="question ")
+        for choice in _check_list(question, 'choices', line_number, context="question "):
+            if not isinstance(choice, dict):
+                raise QuizImportError(line_number, "every choice must be an object")
+            _check_text(choice, 'text', Choice, line_number, required=True, context="choice ")
+            _check_boolean(choice, 'is_correct', line_number, context="choice ")
+
+
+def _check_text(data, key, model, line_number, required=False, context=""):
+    """Optional keys may be absent, but never null."""
+    if key not in data and not required:
+        return
+    value = data.get(key)
+    max_length = model._meta.get_field(key).max_length
+    if not isinstance(value, str) or (required and not value):
+        raise QuizImportError(line_number, f"{context}'{key}' must be a{' non-empty' if required else ''} string")
+    if max_length is not None and len(value) > max_length:
+        raise QuizImportError(line_number, f"{context}'{key}' is longer than {max_length} characters")
+
+
+def _check_integer(data, key, line_number, context=""):
+    if key not in data:
+        return
+    value = data[key]
+    # bool is an int subclass, but true is not a time limit.
+    if not isinstance(value, int) or isinstance(value, bool) or not 0 <= value <= MAX_POSITIVE_INTEGER:
+        raise QuizImportError(line_number, f"{context}'{key}' must be a non-negative integer")
+
+
+def _check_boolean(data, key, line_number, context=""):
+    if key in data and not isinstance(data[key], bool):
+        raise QuizImportError(line_number, f"{context}'{key}' must be true or false")
+
+
+def _check_list(data, key, line_number, context=""):
+    value = data.get(key, [])
+    if not isinstance(value, list):
+        raise QuizImportError(line_number, f"{context}'{key}' must be a list")
+    return value
+
+
+def _category_id(data, categories, line_number, using):
+    if data is None:
+        return None
+    slug = data['slug']
+    if slug not in categories:
+        try:
+            category, _ = Category.objects.using(using).get_or_create(
+                slug=slug, defaults={'name': data.get('name') or slug}
+            )
+        except IntegrityError:
+            # The name is unique too, and taken by a category with another slug.
+            raise QuizImportError(line_number, f"category name {data.get('name') or slug!r} is used by another slug")
+        categories[slug] = category.id
+    return categories[slug]
+
+
+def _create_chunk(numbered, categories, using):
+    chunk = [record for _, record in numbered]
+    quizzes = Quiz.objects.using(using).bulk_create([
+        Quiz(
+            title=record['title'],
+            description=record.get('description', ''),
+            category_id=_category_id(record.get('category'), categories, line_number, using),
+            difficulty=record.get('difficulty', Quiz.Difficulty.EASY),
+            time_limit_minutes=record.get('time_limit_minutes', 10),
+            is_active=record.get('is_active', True),
+        )
+        for line_number, record in numbered
+    ])
+
+    question_data = [
+        (quiz, position, question)
+        for quiz, record in zip(quizzes, chunk)
+        for position, question in enumerate(record.get('questions', []))
+    ]
+    questions = Question.objects.using(using).bulk_create([
+        Question(quiz_id=quiz.id, text=data['text'], order=data.get('order', position))
+        for quiz, position, data in question_data
+    ], batch_size=CHUNK_SIZE)
+
+    # Assigning raw *_id values skips the related descriptors, which
+    # dominate the cost of building hundreds of thousands of rows.
+    Choice.objects.using(using).bulk_create([
+        Choice(question_id=question.id, text=choice['text'], is_correct=bool(choice.get('is_correct')))
+        for question, (_, _, data) in zip(questions, question_data)
+        for choice in data.get('choices', [])
+    ], batch_size=CHUNK_SIZE)
+
+    get_search_backend(using).index_quizzes([quiz.id for quiz in quizzes])
+    return len(quizzes)
@@ -0,0 +1,71 @@
+from django.core.cache import cache
+
+from core.cache import bump_version, get_versions, incr_counter
+
+# Bumped by any Quiz or Category change: quiz payloads embed the category and
+# its quiz count, so these invalidate every rendered quiz at once.
+CATALOG_VERSION = "catalog"
+# Bumped by question changes, which alter the question counts in quiz lists.
+QUIZ_LIST_VERSION = "quiz-list"
+
+PAYLOAD_KEY_PREFIX = "quiz-detail"
+PAYLOAD_HITS_KEY = f"{PAYLOAD_KEY_PREFIX}:hits"
+PAYLOAD_MISSES_KEY = f"{PAYLOAD_KEY_PREFIX}:misses"
+# Stale versions are never read again, so let them age out.
+PAYLOAD_TIMEOUT = 60 * 60 * 24
+
+
+def quiz_version_name(quiz_id):
+    """Version name bumped by changes to a quiz's questions and choices."""
+    return f"quiz:{quiz_id}"
+
+
+def get_quiz_versions(quiz_id):
+    """Return the (catalog, quiz) version pair a quiz payload depends on."""
+    name = quiz_version_name(quiz_id)
+    versions = get_versions(CATALOG_VERSION, name)
+    return versions[CATALOG_VERSION], versions[name]
+
+
+def invalidate_catalog():
+    """Invalidate every cached quiz payload."""
+    bump_version(CATALOG_VERSION)
+
+
+def invalidate_quiz(quiz_id):
+    """Invalidate the cached payload of a single quiz."""
+    bump_version(quiz_version_name(quiz_id))
+
+
+def invalidate_quiz_list():
+    """Invalidate validators of the quiz list."""
+    bump_version(QUIZ_LIST_VERSION)
+
+
+def _payload_key(quiz_id, versions, base_url):
+    catalog_version, quiz_version = versions
+    return f"{PAYLOAD_KEY_PREFIX}:{quiz_id}:{catalog_version}:{quiz_version}:{base_url}"
+
+
+def get_quiz_payload(quiz_id, versions, base_url=""):
+    """
+    Return the rendered quiz, as (JSON bytes, layout) (see quizzes.shuffle),
+    or None on a cache miss.
+    """
+    payload = cache.get(_payload_key(quiz_id, versions, base_url))
+    incr_counter(PAYLOAD_MISSES_KEY if payload is None else PAYLOAD_HITS_KEY)
+    return payload
+
+
+def set_quiz_payload(quiz_id, versions, payload, base_url=""):
+    """Store the rendered quiz, as (JSON bytes, layout), under its content versions."""
+    cache.set(_payload_key(quiz_id, versions, base_url), payload, PAYLOAD_TIMEOUT)
+
+
+def payload_cache_stats():
+    """Return the shared hit/miss counters of the quiz payload cache."""
+    counters = cache.get_many([PAYLOAD_HITS_KEY, PAYLOAD_MISSES_KEY])
+    return {
+        "hits": counters.get(PAYLOAD_HITS_KEY, 0),
+        "misses": counters.get(PAYLOAD_MISSES_KEY, 0),
+    }
@@ -0,0 +1,126 @@
+"""
+Precomputed leaderboards.
+
+Every completed quiz adds its score to the user's entry on three boards:
+all-time, the ISO week it was completed in, and its category. Adding costs
+two statements however many entries a board has, and marks the entries
+rank-stale. `refresh_ranks()` (the refresh_leaderboards command, run every
+minute or so) recomputes ranks with one ROW_NUMBER() UPDATE over just the
+boards holding stale entries, writing only the ranks that moved. Reading
+the top N, or a user's rank and neighbours, is an index range scan on
+(board, rank); ranks lag scores by up to one refresh.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from accounts.models import Profile
+
+from .models import LeaderboardEntry, UserCategoryStat
+
+ALL_TIME = "all-time"
+WEEKLY_PREFIX = "weekly"
+CATEGORY_PREFIX = "category"
+# Weekly boards older than this many weeks are dropped by refresh_ranks().
+WEEKS_KEPT = 4
+
+TABLE = LeaderboardEntry._meta.db_table
+# UPDATE ... FROM needs SQLite 3.33+; Postgres has always had it. Filled in
+# with the board placeholders and the null-safe "differs" operator.
+RANK_SQL = f"""
+    UPDATE {TABLE} SET rank = ranked.position
+    FROM (
+        SELECT id, ROW_NUMBER() OVER (PARTITION BY board ORDER BY score DESC, user_id) AS position
+        FROM {TABLE}
+        WHERE board IN (%(boards)s)
+    ) AS ranked
+    WHERE {TABLE}.id = ranked.id AND {TABLE}.rank %(distinct)s ranked.position
+"""
+
+
+def weekly_board(moment=None):
+    """Board name of the ISO week containing `moment` (default: now)."""
+    year, week, _ = (moment or timezone.now()).isocalendar()
+    return f"{WEEKLY_PREFIX}:{year}-W{week:02d}"
+
+
+def category_board(category_id):
+    return f"{CATEGORY_PREFIX}:{category_id}"
+
+
+def record_scores(attempts):
+    """Add completed attempts to the users' leaderboard entries."""
+    totals = defaultdict(lambda: [0.0, 0])  # (board, user id) -> [score, quizzes]
+    for attempt in attempts:
+        boards = [ALL_TIME, weekly_board(attempt.completed_at or timezone.now())]
+        if attempt.quiz.category_id is not None:
+            boards.append(category_board(attempt.quiz.category_id))
+        for board in boards:
+            totals[board, attempt.user_id][0] += attempt.score
+            totals[board, attempt.user_id][1] += 1
+
+    # Boards receiving the same increments (all of them, for a single
+    # attempt) share one INSERT of missing entries and one UPDATE.
+    grouped = defaultdict(list)
+    for (board, user_id), (score, quizzes) in totals.items():
+        grouped[user_id, score, quizzes].append(board)
+    for (user_id, score, quizzes), boards in grouped.items():
+        LeaderboardEntry.objects.bulk_create(
+            [LeaderboardEntry(board=board, user_id=user_id) for board in boards], ignore_conflicts=True
+        )
+        LeaderboardEntry.objects.filter(user_id=user_id, board__in=boards).update(
+            score=F('score') + score, quizzes=F('quizzes') + quizzes, rank_stale=True
+        )
+
+
+def refresh_ranks():
+    """
+    Drop expired weekly boards and re-rank the boards whose scores changed
+    since the last refresh. Returns the number of ranks that moved.
+    """
+    cutoff = weekly_board(timezone.now() - timedelta(weeks=WEEKS_KEPT))
+    with transaction.atomic():
+        # ISO week names sort chronologically.
+        LeaderboardEntry.objects.filter(board__startswith=f"{WEEKLY_PREFIX}:", board__lt=cutoff).delete()
+        stale = LeaderboardEntry.objects.filter(rank_stale=True)
+        boards = list(stale.values_list('board', flat=True).distinct())
+        if not boards:
+            return 0
+        # Cleared before ranking: a score added meanwhile marks its entry again for the next refresh.
+        stale.filter(board__in=boards).update(rank_stale=False)
+        sql = RANK_SQL % {
+            'boards': ", ".join(["%s"] * len(boards)),
+            'distinct': "IS NOT" if connection.vendor == 'sqlite' else "IS DISTINCT FROM",
+        }
+        with connection.cursor() as cursor:
+            cursor.execute(sql, boards)
+            return cursor.rowcount
+
+
+def rebuild_boards():
+    """
+    Recreate the all-time and category boards from profile statistics (see
+    quizzes.stats.reconcile_stats), then re-rank. Weekly boards are kept.
+    """
+    with transaction.atomic():
+        LeaderboardEntry.objects.exclude(board__startswith=f"{WEEKLY_PREFIX}:").delete()
+        LeaderboardEntry.objects.bulk_create(
+            (
+                LeaderboardEntry(board=ALL_TIME, user_id=user_id, score=score, quizzes=quizzes)
+                for user_id, score, quizzes in Profile.objects.filter(quizzes_taken__gt=0)
+                .values_list('user_id', 'total_score', 'quizzes_taken').iterator()
+            ),
+            batch_size=1000,
+        )
+        LeaderboardEntry.objects.bulk_create(
+            (
+                LeaderboardEntry(board=category_board(category_id), user_id=user_id, score=score, quizzes=attempts)
+                for user_id, category_id, score, attempts in UserCategoryStat.objects
+                .values_list('user_id', 'category_id', 'total_score', 'attempts').iterator()
+            ),
+            batch_size=1000,
+        )
+    return refresh_ranks()
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from quizzes.analysis import CHUNK_SIZE, analyze_items
+
+
+class Command(BaseCommand):
+    help = "Recompute question statistics and suggested quiz difficulty from submitted answers."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--quiz', type=int, action='append', dest='quiz_ids', help="Only this quiz id (repeatable).")
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Attempts decoded per chunk.")
+
+    def handle(self, *args, **options):
+        analysed = analyze_items(options['quiz_ids'], chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f"Analysed {analysed} quizzes."))
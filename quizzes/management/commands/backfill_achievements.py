@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from quizzes.achievements import BACKFILL_CHUNK_SIZE, backfill_achievements, sync_achievements
+
+
+class Command(BaseCommand):
+    help = "Create achievements for new rules, then award every rule across all users. Run after deploying new rules."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=BACKFILL_CHUNK_SIZE, help="Users evaluated per batch.")
+
+    def handle(self, *args, **options):
+        created = sync_achievements()
+        awarded = backfill_achievements(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f"Created {created} achievements and awarded {awarded}."))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from quizzes.bulk import export_quizzes
+from quizzes.models import Quiz
+
+
+class Command(BaseCommand):
+    help = "Export quizzes with their questions and choices as JSONL."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-', help="Output file, or '-' for stdout.")
+        parser.add_argument('--category', help="Only export quizzes in the category with this slug.")
+        parser.add_argument('--active-only', action='store_true', help="Skip inactive quizzes.")
+
+    def handle(self, *args, **options):
+        queryset = Quiz.objects.all()
+        if options['category']:
+            queryset = queryset.filter(category__slug=options['category'])
+        if options['active_only']:
+            queryset = queryset.filter(is_active=True)
+
+        if options['path'] == '-':
+            for line in export_quizzes(queryset):
+                self.stdout.write(line, ending='')
+            return
+
+        count = 0
+        with open(options['path'], 'w', encoding='utf-8') as output:
+            for line in export_quizzes(queryset):
+                output.write(line)
+                count += 1
+        self.stdout.write(self.style.SUCCESS(f"Exported {count} quizzes."))
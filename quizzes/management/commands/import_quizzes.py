@@ -0,0 +1,28 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quizzes.bulk import CHUNK_SIZE, QuizImportError, import_quizzes
+
+
+class Command(BaseCommand):
+    help = "Import quizzes with their questions and choices from JSONL."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Input file, or '-' for stdin.")
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Quizzes per transaction.")
+        parser.add_argument('--database', default='default', help="Database alias to import into.")
+
+    def handle(self, *args, **options):
+        try:
+            if options['path'] == '-':
+                count = self.run_import(sys.stdin, options)
+            else:
+                with open(options['path'], encoding='utf-8') as lines:
+                    count = self.run_import(lines, options)
+        except (OSError, QuizImportError) as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(self.style.SUCCESS(f"Imported {count} quizzes."))
+
+    def run_import(self, lines, options):
+        return import_quizzes(lines, chunk_size=options['chunk_size'], using=options['database'])
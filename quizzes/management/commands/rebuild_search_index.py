@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from quizzes.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for all quizzes."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help="Database alias to rebuild.")
+
+    def handle(self, *args, **options):
+        count = get_search_backend(options['database']).rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} quizzes."))
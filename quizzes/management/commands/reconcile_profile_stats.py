@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from quizzes.stats import RECONCILE_BATCH_SIZE, reconcile_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute profile statistics from quiz history and correct any drift. Run periodically (e.g. nightly)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='user_ids', help="Only this user id (repeatable).")
+        parser.add_argument('--batch-size', type=int, default=RECONCILE_BATCH_SIZE, help="Users per batch.")
+
+    def handle(self, *args, **options):
+        drifted = reconcile_stats(options['user_ids'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Corrected {drifted} drifted profiles."))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from quizzes.leaderboards import rebuild_boards, refresh_ranks
+
+
+class Command(BaseCommand):
+    help = "Re-rank every leaderboard and drop expired weekly boards. Run every minute or so."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild', action='store_true',
+            help="Recreate the all-time and category boards from profile statistics first.",
+        )
+
+    def handle(self, *args, **options):
+        moved = rebuild_boards() if options['rebuild'] else refresh_ranks()
+        self.stdout.write(self.style.SUCCESS(f"Updated {moved} ranks."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from quizzes.streaks import reset_broken_streaks
+
+
+class Command(BaseCommand):
+    help = "Reset streaks that lapsed in each user's timezone. Run hourly, or at least nightly."
+
+    def handle(self, *args, **options):
+        reset = reset_broken_streaks()
+        self.stdout.write(self.style.SUCCESS(f"Reset {reset} broken streaks."))
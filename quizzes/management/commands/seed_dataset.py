@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from quizzes.seeding import BATCH_SIZE, SeedError, seed_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a synthetic dataset of users, quizzes and attempts with skewed popularity, deterministic from --seed. "
+        "Production scale: --users 1000000 --quizzes 10000 --attempts 50000000."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1_000, help="Users to create.")
+        parser.add_argument('--quizzes', type=int, default=100, help="Quizzes to create.")
+        parser.add_argument('--attempts', type=int, default=10_000, help="Attempts to create.")
+        parser.add_argument('--questions', type=int, default=20, help="Questions per quiz.")
+        parser.add_argument('--choices', type=int, default=4, help="Choices per question, one of them correct.")
+        parser.add_argument('--categories', type=int, default=20, help="Categories to spread the quizzes over.")
+        parser.add_argument('--quiz-skew', type=float, default=1.1, help="Zipf exponent of quiz popularity (0: uniform).")
+        parser.add_argument('--user-skew', type=float, default=0.8, help="Zipf exponent of user activity (0: uniform).")
+        parser.add_argument('--unfinished', type=float, default=0.01, help="Share of attempts still in progress.")
+        parser.add_argument('--days', type=int, default=365, help="Spread attempts over this many past days.")
+        parser.add_argument('--seed', type=int, default=0, help="Random seed; also names the seeded users.")
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help="Rows per insert and transaction.")
+        parser.add_argument('--database', default='default', help="Database alias to seed.")
+
+    def handle(self, *args, **options):
+        try:
+            counts = seed_dataset(
+                options['users'], options['quizzes'], options['attempts'],
+                questions=options['questions'], choices=options['choices'], categories=options['categories'],
+                quiz_skew=options['quiz_skew'], user_skew=options['user_skew'], unfinished=options['unfinished'],
+                days=options['days'], seed=options['seed'], batch_size=options['batch_size'],
+                using=options['database'],
+            )
+        except SeedError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {counts['users']} users, {counts['quizzes']} quizzes and {counts['attempts']} attempts. "
+            "Run reconcile_profile_stats, refresh_leaderboards --rebuild and analyze_items to fill in derived data."
+        ))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-17 07:43
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0002_alter_takenquiz_correct_answers_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='question',
+            options={'ordering': ['order']},
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.4 on 2026-10-17 07:43
+
+from django.db import migrations
+
+# Frozen copies of quizzes.search as of this migration, so later changes to
+# that module can't alter what this migration does.
+FTS_TABLE = "quizzes_quiz_fts"
+POSTGRES_DOCUMENT_SQL = """
+    setweight(to_tsvector('english', coalesce(quizzes_quiz.title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(
+        (SELECT name FROM quizzes_category WHERE quizzes_category.id = quizzes_quiz.category_id), ''
+    )), 'B') ||
+    setweight(to_tsvector('english', coalesce(quizzes_quiz.description, '')), 'C')
+"""
+SQLITE_SELECT_SQL = """
+    SELECT quizzes_quiz.id, quizzes_quiz.title, quizzes_quiz.description, coalesce(quizzes_category.name, '')
+    FROM quizzes_quiz LEFT JOIN quizzes_category ON quizzes_category.id = quizzes_quiz.category_id
+"""
+
+
+def create_search_index(apps, schema_editor):
+    """Create the vendor-specific full-text index and fill it."""
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("ALTER TABLE quizzes_quiz ADD COLUMN search_vector tsvector")
+        schema_editor.execute(
+            "CREATE INDEX quizzes_quiz_search_vector_gin ON quizzes_quiz USING gin (search_vector)"
+        )
+        schema_editor.execute(f"UPDATE quizzes_quiz SET search_vector = {POSTGRES_DOCUMENT_SQL}")
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            "title, description, category, tokenize = 'porter unicode61')"
+        )
+        schema_editor.execute(f"INSERT INTO {FTS_TABLE} (rowid, title, description, category) {SQLITE_SELECT_SQL}")
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS quizzes_quiz_search_vector_gin")
+        schema_editor.execute("ALTER TABLE quizzes_quiz DROP COLUMN IF EXISTS search_vector")
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0003_alter_question_options'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
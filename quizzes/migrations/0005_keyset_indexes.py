@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-17 07:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0004_quiz_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['is_active', '-created_at', '-id'], name='quiz_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='takenquiz',
+            index=models.Index(fields=['user', '-completed_at', '-id'], name='takenquiz_user_history_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_stats(apps, schema_editor):
+    """Seed per-category totals and profile wins from existing attempts."""
+    TakenQuiz = apps.get_model('quizzes', 'TakenQuiz')
+    UserCategoryStat = apps.get_model('quizzes', 'UserCategoryStat')
+    Profile = apps.get_model('accounts', 'Profile')
+    completed = TakenQuiz.objects.filter(score__isnull=False).order_by()
+
+    UserCategoryStat.objects.bulk_create(
+        (
+            UserCategoryStat(
+                user_id=row['user_id'], category_id=row['quiz__category_id'],
+                attempts=row['attempts'], total_score=row['total_score'],
+            )
+            for row in completed.filter(quiz__category__isnull=False)
+            .values('user_id', 'quiz__category_id')
+            .annotate(attempts=Count('id'), total_score=Sum('score'))
+            .iterator()
+        ),
+        batch_size=500,
+    )
+    wins = completed.values('user_id').annotate(wins=Count('id', filter=Q(score__gte=50.0)))
+    for row in wins.iterator():
+        Profile.objects.filter(user_id=row['user_id']).update(wins=row['wins'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_profile_wins'),
+        ('quizzes', '0005_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserCategoryStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('total_score', models.FloatField(default=0.0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_stats', to='quizzes.category')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='category_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'category'), name='unique_user_category_stat')],
+            },
+        ),
+        migrations.RunPython(backfill_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def seed_boards(apps, schema_editor):
+    """Seed all-time and category boards from existing stats; refresh_leaderboards ranks them."""
+    LeaderboardEntry = apps.get_model('quizzes', 'LeaderboardEntry')
+    UserCategoryStat = apps.get_model('quizzes', 'UserCategoryStat')
+    Profile = apps.get_model('accounts', 'Profile')
+
+    LeaderboardEntry.objects.bulk_create(
+        (
+            LeaderboardEntry(board='all-time', user_id=user_id, score=score, quizzes=quizzes)
+            for user_id, score, quizzes in Profile.objects.filter(quizzes_taken__gt=0)
+            .values_list('user_id', 'total_score', 'quizzes_taken').iterator()
+        ),
+        batch_size=1000,
+    )
+    LeaderboardEntry.objects.bulk_create(
+        (
+            LeaderboardEntry(board=f'category:{category_id}', user_id=user_id, score=score, quizzes=attempts)
+            for user_id, category_id, score, attempts in UserCategoryStat.objects
+            .values_list('user_id', 'category_id', 'total_score', 'attempts').iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0006_usercategorystat'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('board', models.CharField(max_length=64)),
+                ('score', models.FloatField(default=0.0)),
+                ('quizzes', models.PositiveIntegerField(default=0)),
+                ('rank', models.PositiveIntegerField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['board', 'rank'], name='leaderboard_rank_idx'), models.Index(fields=['board', '-score', 'user'], name='leaderboard_score_idx')],
+                'constraints': [models.UniqueConstraint(fields=('board', 'user'), name='unique_leaderboard_entry')],
+            },
+        ),
+        migrations.RunPython(seed_boards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0007_leaderboardentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='takenquiz',
+            name='answers',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
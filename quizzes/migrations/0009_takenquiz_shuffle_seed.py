@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0008_takenquiz_answers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='takenquiz',
+            name='shuffle_seed',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-17 10:20
+
+import struct
+
+from django.db import migrations, models
+
+
+def pack_answers(apps, schema_editor):
+    """Move the answers saved so far from the JSON column to packed choice IDs."""
+    TakenQuiz = apps.get_model('quizzes', 'TakenQuiz')
+    attempts = TakenQuiz.objects.filter(answers__isnull=False).only('id', 'answers')
+    packed = []
+    for attempt in attempts.iterator():
+        choice_ids = sorted({choice_id for ids in attempt.answers.values() for choice_id in ids})
+        attempt.choice_ids = struct.pack(f"<{len(choice_ids)}Q", *choice_ids)
+        packed.append(attempt)
+    TakenQuiz.objects.bulk_update(packed, ['choice_ids'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0009_takenquiz_shuffle_seed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='takenquiz',
+            name='choice_ids',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.RunPython(pack_answers, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='takenquiz',
+            name='answers',
+        ),
+    ]
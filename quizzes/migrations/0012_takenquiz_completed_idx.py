@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0011_questionstat'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='takenquiz',
+            index=models.Index(fields=['-completed_at', '-id'], name='takenquiz_completed_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.4 on 2026-10-17 09:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0012_takenquiz_completed_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='quiz',
+            name='quiz_active_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['quiz', 'order'], name='question_quiz_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at', '-id'], name='quiz_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', '-created_at', '-id'], name='quiz_category_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='takenquiz',
+            index=models.Index(condition=models.Q(('score__isnull', False)), fields=['user', 'score'], name='takenquiz_user_scored_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='takenquiz',
+            index=models.Index(condition=models.Q(('score__isnull', False)), fields=['quiz'], name='takenquiz_quiz_scored_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from django.db import migrations
+
+# The rules of quizzes.achievements as of this migration: (code, name, description, badge type).
+RULE_ACHIEVEMENTS = (
+    ("first-quiz", "First Steps", "Complete your first quiz.", "uncommon"),
+    ("quizzes-50", "Quiz Veteran", "Complete 50 quizzes.", "rare"),
+    ("perfect-score", "Flawless", "Score 100% on a quiz.", "rare"),
+    ("category-10", "Specialist", "Complete 10 quizzes in one category.", "rare"),
+    ("streak-7", "On Fire", "Complete a quiz on 7 days in a row.", "epic"),
+)
+
+
+def create_rule_achievements(apps, schema_editor):
+    """Create the Achievement of each rule that has none; existing rows may have been edited in the admin."""
+    Achievement = apps.get_model('accounts', 'Achievement')
+    db_alias = schema_editor.connection.alias
+    existing = set(
+        Achievement.objects.using(db_alias).filter(code__isnull=False).values_list('code', flat=True)
+    )
+    Achievement.objects.using(db_alias).bulk_create([
+        Achievement(code=code, name=name, description=description, badge_type=badge_type)
+        for code, name, description, badge_type in RULE_ACHIEVEMENTS if code not in existing
+    ])
+    # accounts.cache.ACHIEVEMENT_IDS_KEY as of this migration: the cached code -> id map.
+    cache.delete("achievement-ids")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_achievement_code_unique_user_achievement'),
+        ('quizzes', '0013_index_pack'),
+    ]
+
+    operations = [
+        # Reversing leaves the rows, and the awards that point at them, in place.
+        migrations.RunPython(create_rule_achievements, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-17 11:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0014_rule_achievements'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='leaderboardentry',
+            name='rank_stale',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddIndex(
+            model_name='leaderboardentry',
+            index=models.Index(condition=models.Q(('rank_stale', True)), fields=['board'], name='leaderboard_stale_idx'),
+        ),
+    ]
@@ -1,9 +1,34 @@
 from django.db import models
+from django.db.models.functions import Coalesce
 from accounts.models import User
 from django.conf import settings
 
 # Create your models here.
 
+class CategoryQuerySet(models.QuerySet):
+    """QuerySet for categories with aggregate helpers."""
+
+    def with_quiz_count(self):
+        """Annotate each category with its number of quizzes."""
+        return self.annotate(quiz_count=models.Count('quizzes'))
+
+
+class QuizQuerySet(models.QuerySet):
+    """QuerySet for quizzes with aggregate helpers."""
+
+    def with_question_count(self):
+        """
+        Annotate each quiz with its number of questions. A correlated subquery
+        rather than COUNT ... GROUP BY: it runs only for the rows returned, so
+        an ordered, limited page stays a range scan on the ordering index.
+        """
+        questions = Question.objects.filter(quiz=models.OuterRef('pk')).order_by().values('quiz')
+        count = questions.annotate(count=models.Count('pk')).values('count')
+        return self.annotate(
+            question_count=Coalesce(models.Subquery(count, output_field=models.IntegerField()), 0)
+        )
+
+
 class Category(models.Model):
     """Model to represent quiz categories."""
 
@@ -12,6 +37,8 @@ class Category(models.Model):
     icon = models.ImageField(upload_to='category_icons/', null=True, blank=True)
     description = models.TextField(blank=True)
 
+    objects = CategoryQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
@@ -31,6 +58,8 @@ class Quiz(models.Model):
     description = models.TextField()
     category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, related_name='quizzes')
     difficulty = models.CharField(max_length=10, choices=Difficulty.choices, default=Difficulty.EASY)
+    # From the item analysis of submitted answers (see quizzes.analysis)
+    suggested_difficulty = models.CharField(max_length=10, choices=Difficulty.choices, blank=True)
 
     # Quiz settings
     time_limit_minutes = models.PositiveIntegerField(default=10) # For timed quizzes
@@ -38,6 +67,23 @@ class Quiz(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = QuizQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Keyset pagination of the active quiz list: (created_at, id). Partial,
+            # since Django filters booleans as a bare `WHERE is_active`, which
+            # SQLite cannot match to a leading index column.
+            models.Index(
+                fields=['-created_at', '-id'], condition=models.Q(is_active=True), name='quiz_active_created_idx',
+            ),
+            # The same, filtered by category.
+            models.Index(
+                fields=['category', '-created_at', '-id'], condition=models.Q(is_active=True),
+                name='quiz_category_active_idx',
+            ),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -54,6 +100,24 @@ class Question(models.Model):
 
     class Meta:
         ordering = ['order']
+        indexes = [
+            # A quiz's questions in order (quiz detail, answer keys).
+            models.Index(fields=['quiz', 'order'], name='question_quiz_order_idx'),
+        ]
+
+
+class QuestionStat(models.Model):
+    """Item analysis of a question over its quiz's submitted attempts (see quizzes.analysis)."""
+
+    question = models.OneToOneField(Question, on_delete=models.CASCADE, primary_key=True, related_name='stat')
+    attempts = models.PositiveIntegerField(default=0)
+    p_value = models.FloatField(null=True, blank=True) # Share of attempts answering correctly
+    discrimination = models.FloatField(null=True, blank=True) # Point-biserial against the rest of the quiz
+    choice_rates = models.JSONField(default=dict) # {choice id: share of attempts choosing it}
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.question_id}: p={self.p_value}"
 
 
 class Choice(models.Model):
@@ -81,9 +145,82 @@ class TakenQuiz(models.Model):
     started_at = models.DateTimeField()
     completed_at = models.DateTimeField(auto_now_add=True)
     duration = models.DurationField(null=True, blank=True) # Bitəndə hesablanır
+    # Chosen choice IDs, packed (see quizzes.scoring.pack_choice_ids); autosaved in
+    # batches, final at submit (see quizzes.sessions)
+    choice_ids = models.BinaryField(null=True, blank=True)
+    # Orders the attempt's questions and choices (see quizzes.shuffle); null means canonical order.
+    shuffle_seed = models.PositiveIntegerField(null=True, blank=True)
 
     class Meta:
         ordering = ['-completed_at']
+        indexes = [
+            # Keyset pagination of a user's history: (completed_at, id).
+            models.Index(fields=['user', '-completed_at', '-id'], name='takenquiz_user_history_idx'),
+            # The admin changelist, newest first.
+            models.Index(fields=['-completed_at', '-id'], name='takenquiz_completed_idx'),
+            # Scored attempts per user (stats reconciliation, achievement backfill)
+            # and per quiz (item analysis). Ongoing attempts are left out.
+            models.Index(
+                fields=['user', 'score'], condition=models.Q(score__isnull=False), name='takenquiz_user_scored_idx',
+            ),
+            models.Index(fields=['quiz'], condition=models.Q(score__isnull=False), name='takenquiz_quiz_scored_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember whether the attempt was already scored, so its stats are recorded only once."""
+        instance = super().from_db(db, field_names, values)
+        instance._was_scored = instance.__dict__.get("score") is not None
+        return instance
+
+    def __str__(self):
+        return f"{self.user.username} - {self.quiz.title}"
+
+
+class UserCategoryStat(models.Model):
+    """Running totals of a user's completed quizzes in one category (see quizzes.stats)."""
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='category_stats')
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='user_stats')
+    attempts = models.PositiveIntegerField(default=0)
+    total_score = models.FloatField(default=0.0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'category'], name='unique_user_category_stat'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.category_id}: {self.attempts}"
+
+class LeaderboardEntry(models.Model):
+    """
+    A user's running score on one leaderboard (see quizzes.leaderboards).
+
+    Scores are updated as quizzes are completed; `rank` is recomputed for
+    whole boards by a periodic job, so reads are index lookups on (board, rank).
+    `rank_stale` marks entries whose score changed since then; the job only
+    re-ranks their boards.
+    """
+
+    board = models.CharField(max_length=64) # "all-time", "weekly:2026-W42", "category:7"
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='leaderboard_entries')
+    score = models.FloatField(default=0.0)
+    quizzes = models.PositiveIntegerField(default=0)
+    rank = models.PositiveIntegerField(null=True, blank=True)
+    rank_stale = models.BooleanField(default=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['board', 'user'], name='unique_leaderboard_entry'),
+        ]
+        indexes = [
+            # Finds the boards to re-rank; holds only the entries changed since the last refresh.
+            models.Index(fields=['board'], condition=models.Q(rank_stale=True), name='leaderboard_stale_idx'),
+            models.Index(fields=['board', 'rank'], name='leaderboard_rank_idx'),
+            # Feeds the ROW_NUMBER() window of the rank refresh.
+            models.Index(fields=['board', '-score', 'user'], name='leaderboard_score_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.user.username} - {self.quiz.title}"
\ No newline at end of file
+        return f"{self.board} #{self.rank}: {self.user_id} ({self.score})"
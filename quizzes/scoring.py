@@ -0,0 +1,157 @@
+"""
+Compiled answer keys for scoring submissions.
+
+An AnswerKey holds everything scoring needs for one quiz, so scoring a
+submission is O(answers) and, once the key is warm, needs no queries. Keys
+are cached in process and in the shared cache under the quiz's content
+version (see quizzes.cache), so editing a question or choice retires them.
+
+Submitted answers are stored on the attempt as packed choice IDs
+(`pack_choice_ids`) and regrouped per question with the answer key.
+"""
+import struct
+
+from django.core.cache import cache
+
+from core.cache import get_version
+
+from .cache import PAYLOAD_TIMEOUT, quiz_version_name
+from .models import Choice, Question
+
+ANSWER_KEY_PREFIX = "answer-key"
+# Packed choice IDs are sorted little-endian unsigned 64-bit integers.
+CHOICE_ID_CODE = "Q"
+CHOICE_ID_SIZE = struct.calcsize(f"<{CHOICE_ID_CODE}")
+# Upper bound on answer keys held per process.
+LOCAL_MAX_ENTRIES = 1024
+
+_local_keys = {}
+
+
+class AnswerKey:
+    """The correct choices of a quiz, its question count and each choice's question."""
+    __slots__ = ('correct_choice_ids', 'question_count', 'choice_questions')
+
+    def __init__(self, correct_choice_ids, question_count, choice_questions):
+        self.correct_choice_ids = frozenset(correct_choice_ids)
+        self.question_count = question_count
+        self.choice_questions = choice_questions
+
+    def __getstate__(self):
+        return self.correct_choice_ids, self.question_count, self.choice_questions
+
+    def __setstate__(self, state):
+        self.correct_choice_ids, self.question_count, self.choice_questions = state
+
+    @classmethod
+    def build(cls, quiz_id):
+        """Compile the key of a quiz from the database."""
+        rows = Choice.objects.filter(question__quiz_id=quiz_id).values_list('id', 'question_id', 'is_correct')
+        choice_questions, correct = {}, []
+        for choice_id, question_id, is_correct in rows:
+            choice_questions[choice_id] = question_id
+            if is_correct:
+                correct.append(choice_id)
+        question_count = Question.objects.filter(quiz_id=quiz_id).count()
+        return cls(correct, question_count, choice_questions)
+
+    def count_correct(self, choice_ids):
+        """
+        Count the questions answered correctly. Choices from other quizzes are
+        ignored, and each question counts at most once.
+        """
+        answered = set()
+        for choice_id in choice_ids:
+            if choice_id in self.correct_choice_ids:
+                answered.add(self.choice_questions[choice_id])
+        return len(answered)
+
+    def question_ids(self):
+        """IDs of the questions that have choices."""
+        return set(self.choice_questions.values())
+
+    def group_by_question(self, choice_ids):
+        """
+        Group choice IDs by question, as {question id (str): [choice ids]}.
+        Choices from other quizzes are ignored.
+        """
+        grouped = {}
+        for choice_id in choice_ids:
+            question_id = self.choice_questions.get(choice_id)
+            if question_id is not None:
+                grouped.setdefault(str(question_id), []).append(choice_id)
+        return grouped
+
+    def group_answers(self, answers):
+        """
+        Keep the answers to this quiz's questions from {question id: [choice
+        ids]}, as {question id (str): [choice ids]}. Choices of other
+        questions are dropped, and an empty list is kept: it clears the question.
+        """
+        question_ids = self.question_ids()
+        grouped = {}
+        for question_id, choice_ids in answers.items():
+            question_id = int(question_id)
+            if question_id in question_ids:
+                grouped[str(question_id)] = [
+                    choice_id for choice_id in choice_ids if self.choice_questions.get(choice_id) == question_id
+                ]
+        return grouped
+
+    def review(self, choice_ids):
+        """
+        Each question's chosen and correct choices, and whether it counts as
+        answered correctly (as in count_correct), ordered by question ID.
+        """
+        chosen = self.group_by_question(choice_ids)
+        correct = {}
+        for choice_id in sorted(self.correct_choice_ids):
+            correct.setdefault(self.choice_questions[choice_id], []).append(choice_id)
+        return [
+            {
+                "question_id": question_id,
+                "chosen_choice_ids": chosen.get(str(question_id), []),
+                "correct_choice_ids": correct.get(question_id, []),
+                "is_correct": any(choice_id in self.correct_choice_ids for choice_id in chosen.get(str(question_id), ())),
+            }
+            for question_id in sorted(self.question_ids())
+        ]
+
+    def score(self, correct_count):
+        """Percentage score, rounded to two decimals."""
+        if not self.question_count:
+            return 0
+        return round(correct_count / self.question_count * 100, 2)
+
+
+def pack_choice_ids(choice_ids):
+    """Pack choice IDs into bytes for TakenQuiz.choice_ids."""
+    choice_ids = sorted(set(choice_ids))
+    return struct.pack(f"<{len(choice_ids)}{CHOICE_ID_CODE}", *choice_ids)
+
+
+def unpack_choice_ids(packed):
+    """The choice IDs packed by pack_choice_ids; an empty list for None."""
+    if not packed:
+        return []
+    return list(struct.unpack(f"<{len(packed) // CHOICE_ID_SIZE}{CHOICE_ID_CODE}", packed))
+
+
+def get_answer_key(quiz_id):
+    """Return the answer key for the current version of a quiz."""
+    version = get_version(quiz_version_name(quiz_id))
+
+    local = _local_keys.get(quiz_id)
+    if local is not None and local[0] == version:
+        return local[1]
+
+    shared_key = f"{ANSWER_KEY_PREFIX}:{quiz_id}:{version}"
+    answer_key = cache.get(shared_key)
+    if answer_key is None:
+        answer_key = AnswerKey.build(quiz_id)
+        cache.set(shared_key, answer_key, PAYLOAD_TIMEOUT)
+
+    if len(_local_keys) >= LOCAL_MAX_ENTRIES and quiz_id not in _local_keys:
+        _local_keys.clear()
+    _local_keys[quiz_id] = (version, answer_key)
+    return answer_key
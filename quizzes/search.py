@@ -0,0 +1,190 @@
+"""
+Ranked full-text search over quizzes.
+
+Postgres keeps a weighted `search_vector` tsvector column on quizzes_quiz
+behind a GIN index; SQLite keeps an FTS5 shadow table keyed by quiz id. Both
+are maintained by raw SQL (see migration 0004) so the Quiz model stays
+database agnostic, and both are kept in sync by quizzes.signals.
+"""
+import json
+import re
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "quizzes_quiz_fts"
+
+# Columns are weighted title > category > description in both backends.
+POSTGRES_DOCUMENT_SQL = """
+    setweight(to_tsvector('english', coalesce(quizzes_quiz.title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(
+        (SELECT name FROM quizzes_category WHERE quizzes_category.id = quizzes_quiz.category_id), ''
+    )), 'B') ||
+    setweight(to_tsvector('english', coalesce(quizzes_quiz.description, '')), 'C')
+"""
+SQLITE_SELECT_SQL = """
+    SELECT quizzes_quiz.id, quizzes_quiz.title, quizzes_quiz.description, coalesce(quizzes_category.name, '')
+    FROM quizzes_quiz LEFT JOIN quizzes_category ON quizzes_category.id = quizzes_quiz.category_id
+"""
+SQLITE_BM25_WEIGHTS = "10.0, 2.0, 5.0"  # title, description, category
+
+BATCH_SIZE = 500
+
+
+def _batches(ids):
+    ids = list(ids)
+    for start in range(0, len(ids), BATCH_SIZE):
+        yield ids[start:start + BATCH_SIZE]
+
+
+def _placeholders(values):
+    return ", ".join(["%s"] * len(values))
+
+
+class SearchBackend:
+    """Base class for quiz search backends."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def index_quizzes(self, quiz_ids):
+        """(Re)index the given quizzes."""
+
+    def remove_quizzes(self, quiz_ids):
+        """Drop the given quizzes from the index."""
+
+    def rebuild(self):
+        """Rebuild the whole index and return the number of indexed quizzes."""
+        return 0
+
+    def search(self, queryset, query):
+        """Filter a Quiz queryset to matches, annotated with `search_rank` (higher is better)."""
+        raise NotImplementedError
+
+    @staticmethod
+    def no_matches(queryset):
+        """An empty result that still carries the `search_rank` annotation."""
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField())).none()
+
+
+class PostgresSearchBackend(SearchBackend):
+    """tsvector column with a GIN index, ranked with ts_rank_cd."""
+
+    def index_quizzes(self, quiz_ids):
+        with self.connection.cursor() as cursor:
+            for batch in _batches(quiz_ids):
+                cursor.execute(
+                    f"UPDATE quizzes_quiz SET search_vector = {POSTGRES_DOCUMENT_SQL} "
+                    f"WHERE quizzes_quiz.id IN ({_placeholders(batch)})",
+                    batch,
+                )
+
+    def remove_quizzes(self, quiz_ids):
+        # The vector lives on the quiz row and is deleted with it.
+        pass
+
+    def rebuild(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"UPDATE quizzes_quiz SET search_vector = {POSTGRES_DOCUMENT_SQL}")
+            return cursor.rowcount
+
+    def search(self, queryset, query):
+        tsquery = "websearch_to_tsquery('english', %s)"
+        return queryset.filter(
+            RawSQL(f"quizzes_quiz.search_vector @@ {tsquery}", [query], output_field=BooleanField())
+        ).annotate(
+            search_rank=RawSQL(f"ts_rank_cd(quizzes_quiz.search_vector, {tsquery})", [query], output_field=FloatField())
+        )
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """FTS5 shadow table whose rowid is the quiz id, ranked with bm25."""
+
+    def index_quizzes(self, quiz_ids):
+        with self.connection.cursor() as cursor:
+            for batch in _batches(quiz_ids):
+                placeholders = _placeholders(batch)
+                cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})", batch)
+                cursor.execute(
+                    f"INSERT INTO {FTS_TABLE} (rowid, title, description, category) "
+                    f"{SQLITE_SELECT_SQL} WHERE quizzes_quiz.id IN ({placeholders})",
+                    batch,
+                )
+
+    def remove_quizzes(self, quiz_ids):
+        with self.connection.cursor() as cursor:
+            for batch in _batches(quiz_ids):
+                cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({_placeholders(batch)})", batch)
+
+    def rebuild(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+            cursor.execute(f"INSERT INTO {FTS_TABLE} (rowid, title, description, category) {SQLITE_SELECT_SQL}")
+            return cursor.rowcount
+
+    @staticmethod
+    def to_match_expression(query):
+        """Quote every word so user input can't inject FTS5 syntax; the last word matches as a prefix."""
+        words = re.findall(r"\w+", query)
+        if not words:
+            return None
+        terms = [f'"{word}"' for word in words]
+        terms[-1] += "*"
+        return " ".join(terms)
+
+    def search(self, queryset, query):
+        expression = self.to_match_expression(query)
+        if expression is None:
+            return self.no_matches(queryset)
+
+        # The FTS index yields the best matches directly; only those rows are
+        # then loaded through the ORM, so cost tracks the result size rather
+        # than the catalog size. The queryset's own filters (active quizzes,
+        # a category) are joined in before the LIMIT, so matches it excludes
+        # never crowd out the ones it keeps.
+        candidates, params = queryset.order_by().values('id').query.get_compiler(
+            connection=self.connection
+        ).as_sql()
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {FTS_TABLE}.rowid, bm25({FTS_TABLE}, {SQLITE_BM25_WEIGHTS}) AS score FROM {FTS_TABLE} "
+                f"JOIN ({candidates}) AS candidates ON candidates.id = {FTS_TABLE}.rowid "
+                f"WHERE {FTS_TABLE} MATCH %s ORDER BY score LIMIT %s",
+                [*params, expression, settings.QUIZ_SEARCH_MAX_RESULTS],
+            )
+            matches = cursor.fetchall()
+        if not matches:
+            return self.no_matches(queryset)
+
+        # bm25 is lower-is-better; negate it so higher ranks are better
+        # everywhere. Ranks travel as one JSON parameter rather than a CASE
+        # per match, which keeps the SQL small however many rows match.
+        ranks = json.dumps({str(quiz_id): -score for quiz_id, score in matches})
+        return queryset.filter(id__in=[quiz_id for quiz_id, _ in matches]).annotate(
+            search_rank=RawSQL(
+                """json_extract(%s, '$."' || "quizzes_quiz"."id" || '"')""", [ranks], output_field=FloatField()
+            )
+        )
+
+
+class FallbackSearchBackend(SearchBackend):
+    """Unranked substring search for databases without a full-text engine."""
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            Q(title__icontains=query) | Q(description__icontains=query) | Q(category__name__icontains=query)
+        ).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+BACKENDS = {
+    "postgresql": PostgresSearchBackend,
+    "sqlite": SQLiteSearchBackend,
+}
+
+
+def get_search_backend(using="default"):
+    """Return the search backend matching the vendor of the given database."""
+    connection = connections[using]
+    return BACKENDS.get(connection.vendor, FallbackSearchBackend)(connection)
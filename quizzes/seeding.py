@@ -0,0 +1,242 @@
+"""
+Synthetic datasets for reproducing production-scale behaviour locally.
+
+`seed_dataset` creates users, categories, quizzes (all with the same number
+of questions and choices, one choice correct) and attempts. Quiz popularity
+and user activity are skewed: the k-th most popular quiz (or most active
+user) is picked in proportion to 1 / k ** skew, so a skew of 0 is uniform.
+Each question gets an ease, the chance an attempt answers it correctly, and
+attempts store their packed answers (see quizzes.scoring.pack_choice_ids)
+with a matching score. Everything is drawn from one seeded generator, so a
+seed always gives the same dataset; only dates are relative to the run.
+
+Seeding bypasses what makes the ORM path slow: users get an unusable
+password instead of a hash, model signals do not fire (bulk_create), and
+attempts are written with COPY on Postgres and batched INSERTs elsewhere
+(bulk_create would stamp every completed_at with the current time). Profile
+statistics, leaderboards and item analysis are left to their batch jobs:
+run reconcile_profile_stats, refresh_leaderboards --rebuild and analyze_items
+after seeding.
+"""
+import csv
+import io
+from datetime import timedelta
+
+import numpy as np
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.db import connections, transaction
+from django.utils import timezone
+
+from accounts.models import Profile, User
+
+from .cache import invalidate_catalog, invalidate_quiz_list
+from .models import Category, Choice, Question, Quiz, TakenQuiz
+from .search import get_search_backend
+
+BATCH_SIZE = 10_000  # rows per INSERT/COPY and per transaction
+QUIZ_CHUNK_SIZE = 500  # quizzes created per transaction, with their questions and choices
+ATTEMPT_FIELDS = (
+    'user_id', 'quiz_id', 'score', 'total_questions', 'correct_answers',
+    'started_at', 'completed_at', 'duration', 'choice_ids',
+)
+# Range of the share of attempts answering a question correctly.
+EASE_RANGE = (0.3, 0.95)
+
+
+class SeedError(ValueError):
+    """The requested dataset cannot be seeded."""
+
+
+def username(seed, index):
+    return f"s{seed}u{index}"
+
+
+def category_slug(seed, index):
+    return f"s{seed}-category-{index}"
+
+
+def popularity(rng, count, skew):
+    """Cumulative pick probabilities of `count` items with Zipf-like weights, in random rank order."""
+    weights = rng.permutation(1.0 / np.arange(1, count + 1) ** skew)
+    cdf = np.cumsum(weights)
+    return cdf / cdf[-1]
+
+
+def pick(rng, cdf, size):
+    """Draw `size` indexes from the distribution `cdf`."""
+    return np.minimum(np.searchsorted(cdf, rng.random(size), side='right'), len(cdf) - 1)
+
+
+def seed_dataset(users, quizzes, attempts, questions=20, choices=4, categories=20, quiz_skew=1.1, user_skew=0.8,
+                 unfinished=0.01, days=365, seed=0, batch_size=BATCH_SIZE, using='default'):
+    """
+    Create the dataset described in the module docstring and return the
+    number of users, quizzes and attempts created. Attempts are spread over
+    the last `days` days; a share `unfinished` of them is still in progress.
+    """
+    if attempts and not (users and quizzes):
+        raise SeedError("Attempts need at least one user and one quiz.")
+    if quizzes and not (questions and choices >= 2):
+        raise SeedError("Quizzes need at least one question and two choices.")
+    if (User.objects.using(using).filter(username=username(seed, 0)).exists()
+            or Category.objects.using(using).filter(slug=category_slug(seed, 0)).exists()):
+        raise SeedError(f"Seed {seed} was already used on this database; pick another --seed.")
+
+    rng = np.random.default_rng(seed)
+    user_ids = _create_users(users, seed, batch_size, using)
+    quiz_ids, choice_table, correct_positions = _create_quizzes(
+        rng, quizzes, questions, choices, categories, seed, using,
+    )
+    if attempts:
+        ease = rng.uniform(*EASE_RANGE, size=(quizzes, questions))
+        _create_attempts(
+            rng, attempts, user_ids, quiz_ids, choice_table, correct_positions, ease,
+            popularity(rng, users, user_skew), popularity(rng, quizzes, quiz_skew),
+            unfinished, days, batch_size, using,
+        )
+    return {'users': users, 'quizzes': quizzes, 'attempts': attempts}
+
+
+def _create_users(count, seed, batch_size, using):
+    user_ids = np.empty(count, dtype=np.int64)
+    joined = timezone.now()
+    for start in range(0, count, batch_size):
+        with transaction.atomic(using=using):
+            created = User.objects.using(using).bulk_create([
+                User(
+                    username=username(seed, i), email=f"{username(seed, i)}@example.com",
+                    password=UNUSABLE_PASSWORD_PREFIX, date_joined=joined,
+                )
+                for i in range(start, min(start + batch_size, count))
+            ])
+            # The signal creating each profile does not fire for bulk_create.
+            Profile.objects.using(using).bulk_create([Profile(user_id=user.id) for user in created])
+        user_ids[start:start + len(created)] = [user.id for user in created]
+    return user_ids
+
+
+def _create_quizzes(rng, count, questions, choices, categories, seed, using):
+    """
+    Returns the quiz IDs, the choice IDs as a quizzes x questions x choices
+    array, and the position of each question's correct choice.
+    """
+    quiz_ids = np.empty(count, dtype=np.int64)
+    choice_table = np.empty((count, questions, choices), dtype=np.uint64)
+    correct_positions = rng.integers(choices, size=(count, questions))
+    if not count:
+        return quiz_ids, choice_table, correct_positions
+
+    category_ids = [
+        category.id for category in Category.objects.using(using).bulk_create(
+            Category(name=f"Seed {seed} category {i}", slug=category_slug(seed, i)) for i in range(categories)
+        )
+    ]
+    quiz_categories = rng.integers(len(category_ids), size=count) if category_ids else None
+    difficulties = rng.choice(Quiz.Difficulty.values, size=count)
+
+    try:
+        for start in range(0, count, QUIZ_CHUNK_SIZE):
+            stop = min(start + QUIZ_CHUNK_SIZE, count)
+            with transaction.atomic(using=using):
+                created = Quiz.objects.using(using).bulk_create([
+                    Quiz(
+                        title=f"Quiz {i}", description=f"Seeded quiz {i}.", difficulty=str(difficulties[i]),
+                        category_id=category_ids[quiz_categories[i]] if category_ids else None,
+                    )
+                    for i in range(start, stop)
+                ])
+                quiz_ids[start:stop] = [quiz.id for quiz in created]
+                # Assigning raw *_id values skips the related descriptors (as in quizzes.bulk).
+                created_questions = Question.objects.using(using).bulk_create([
+                    Question(quiz_id=quiz.id, text=f"Question {q}", order=q) for quiz in created for q in range(questions)
+                ])
+                created_choices = Choice.objects.using(using).bulk_create([
+                    Choice(
+                        question_id=question.id, text=f"Choice {c}",
+                        is_correct=bool(c == correct_positions[start + n // questions, n % questions]),
+                    )
+                    for n, question in enumerate(created_questions) for c in range(choices)
+                ])
+                choice_table[start:stop] = np.array(
+                    [choice.id for choice in created_choices], dtype=np.uint64,
+                ).reshape(stop - start, questions, choices)
+                get_search_backend(using).index_quizzes([quiz.id for quiz in created])
+    finally:
+        invalidate_catalog()
+        invalidate_quiz_list()
+    return quiz_ids, choice_table, correct_positions
+
+
+def _create_attempts(rng, count, user_ids, quiz_ids, choice_table, correct_positions, ease, user_cdf, quiz_cdf,
+                     unfinished, days, batch_size, using):
+    quizzes, questions, choices = choice_table.shape
+    time_limits = dict(Quiz.objects.using(using).filter(id__in=quiz_ids.tolist()).values_list('id', 'time_limit_minutes'))
+    time_limits = np.array([time_limits[quiz_id] for quiz_id in quiz_ids.tolist()], dtype=np.float64) * 60
+    now = timezone.now()
+
+    for start in range(0, count, batch_size):
+        size = min(batch_size, count - start)
+        users = user_ids[pick(rng, user_cdf, size)]
+        picked = pick(rng, quiz_cdf, size)
+        started = rng.uniform(0, days * 86400, size=size)
+        durations = rng.uniform(0.1, 1.0, size=size) * time_limits[picked]
+        finished = rng.random(size) >= unfinished
+
+        # A wrong answer picks one of the other choices, by shifting the correct position.
+        correct = rng.random((size, questions)) < ease[picked]
+        positions = np.where(
+            correct, correct_positions[picked],
+            (correct_positions[picked] + rng.integers(1, choices, size=(size, questions))) % choices,
+        )
+        chosen = np.sort(choice_table[picked[:, None], np.arange(questions), positions], axis=1).astype('<u8')
+        correct_counts = correct.sum(axis=1)
+
+        rows = []
+        for i in range(size):
+            started_at = now - timedelta(seconds=float(started[i]))
+            if finished[i]:
+                duration = timedelta(seconds=round(float(durations[i])))
+                rows.append((
+                    int(users[i]), int(quiz_ids[picked[i]]), round(int(correct_counts[i]) / questions * 100, 2),
+                    questions, int(correct_counts[i]), started_at, started_at + duration, duration, chosen[i].tobytes(),
+                ))
+            else:
+                rows.append((int(users[i]), int(quiz_ids[picked[i]]), None, None, None, started_at, started_at, None, None))
+        with transaction.atomic(using=using):
+            insert_rows(TakenQuiz, ATTEMPT_FIELDS, rows, using)
+
+
+def insert_rows(model, field_names, rows, using='default'):
+    """
+    Write raw rows of `field_names` values into the model's table, without
+    signals or pre_save hooks: with COPY on Postgres, an executemany INSERT elsewhere.
+    """
+    connection = connections[using]
+    fields = [model._meta.get_field(name) for name in field_names]
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    table = connection.ops.quote_name(model._meta.db_table)
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerows([_copy_value(value) for value in row] for row in rows)
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+        else:
+            placeholders = ", ".join(["%s"] * len(fields))
+            cursor.executemany(
+                f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+                [[field.get_db_prep_save(value, connection) for field, value in zip(fields, row)] for row in rows],
+            )
+
+
+def _copy_value(value):
+    """A value in Postgres' CSV COPY format; None is an unquoted empty field, i.e. NULL."""
+    if isinstance(value, bytes):
+        return "\\x" + value.hex()
+    if isinstance(value, timedelta):
+        return f"{value.total_seconds()} seconds"
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
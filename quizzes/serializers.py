@@ -1,9 +1,32 @@
 from rest_framework import serializers
-from .models import Category, Quiz, Question, Choice, TakenQuiz
+from .models import Category, Quiz, Question, Choice, TakenQuiz, LeaderboardEntry
+
+
+class AnnotatedCountField(serializers.ReadOnlyField):
+    """
+    Read a count annotated on the queryset (e.g. by `with_quiz_count()`).
+    Falls back to a COUNT query for instances that were not annotated.
+    """
+    def __init__(self, related_name, **kwargs):
+        self.related_name = related_name
+        kwargs['source'] = '*'
+        super().__init__(**kwargs)
+
+    @property
+    def values_lookup(self):
+        """The annotation read by the `.values()` fast path."""
+        return self.field_name
+
+    def to_representation(self, instance):
+        count = getattr(instance, self.field_name, None)
+        if count is None:
+            count = getattr(instance, self.related_name).count()
+        return count
+
 
 class CategorySerializer(serializers.ModelSerializer):
     """Serializer for quiz categories."""
-    quiz_count = serializers.IntegerField(source='quizzes.count', read_only=True)
+    quiz_count = AnnotatedCountField('quizzes')
 
     class Meta:
         model = Category
@@ -29,7 +52,7 @@ class QuestionSerializer(serializers.ModelSerializer):
 class QuizSerializer(serializers.ModelSerializer):
     """Serializer for basic quiz information."""
     category_name = serializers.ReadOnlyField(source='category.name')
-    question_count = serializers.IntegerField(source='questions.count', read_only=True)
+    question_count = AnnotatedCountField('questions')
 
     class Meta:
         model = Quiz
@@ -66,3 +89,12 @@ class TakenQuizSerializer(serializers.ModelSerializer):
             'started_at', 'completed_at', 'duration'
         )
         read_only_fields = ('completed_at', 'duration')
+
+
+class LeaderboardEntrySerializer(serializers.ModelSerializer):
+    """Serializer for a ranked leaderboard row."""
+    username = serializers.ReadOnlyField(source='user.username')
+
+    class Meta:
+        model = LeaderboardEntry
+        fields = ('rank', 'username', 'score', 'quizzes')
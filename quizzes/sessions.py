@@ -0,0 +1,158 @@
+"""
+Server-side attempt sessions with answer autosave.
+
+Starting a quiz stores a small session record in the shared cache, so an
+autosave can check ownership and the time limit without a query. Each
+autosave writes the questions it answers to per-question cache keys with
+one set_many. A later save of a question replaces the earlier one, and
+concurrent saves never race on a shared value. Saving an empty list
+clears a question's answer, and every save records the server time it
+was made, as evidence of when the attempt was still open (see
+last_saved_at). Every `FLUSH_EVERY` saves,
+the merged answers are copied to TakenQuiz.choice_ids, so losing the cache
+loses at most that many saves. Submitting scores the session's answers and
+stores the final set with the score in the same UPDATE, and leaves the
+session cached as submitted, so late autosaves are refused without a query.
+"""
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+
+from core.cache import incr_counter
+
+from .models import TakenQuiz
+from .scoring import get_answer_key, pack_choice_ids, unpack_choice_ids
+
+SESSION_KEY_PREFIX = "attempt-session"
+FLUSH_EVERY = 10
+# Sessions outlive the time limit by this much, to cover the grace period and slow submits.
+SESSION_MARGIN = timedelta(hours=1)
+
+
+def _session_key(attempt_id):
+    return f"{SESSION_KEY_PREFIX}:{attempt_id}"
+
+
+def _answer_key(attempt_id, question_id):
+    return f"{SESSION_KEY_PREFIX}:{attempt_id}:q:{question_id}"
+
+
+def _saves_key(attempt_id):
+    return f"{SESSION_KEY_PREFIX}:{attempt_id}:saves"
+
+
+def _saved_at_key(attempt_id):
+    return f"{SESSION_KEY_PREFIX}:{attempt_id}:saved-at"
+
+
+def last_saved_at(attempt_ids):
+    """{attempt id: server time of its latest autosave} for the attempts autosaved since they started."""
+    keys = {_saved_at_key(attempt_id): attempt_id for attempt_id in attempt_ids}
+    return {
+        keys[key]: datetime.fromtimestamp(saved, tz=dt_timezone.utc)
+        for key, saved in cache.get_many(keys).items()
+    }
+
+
+class AttemptSession:
+    """The in-progress state of one attempt."""
+    __slots__ = (
+        'attempt_id', 'user_id', 'quiz_id', 'started_at', 'time_limit_minutes', 'shuffle_seed', 'submitted'
+    )
+
+    def __init__(self, attempt_id, user_id, quiz_id, started_at, time_limit_minutes, shuffle_seed=None,
+                 submitted=False):
+        self.attempt_id = attempt_id
+        self.user_id = user_id
+        self.quiz_id = quiz_id
+        self.started_at = started_at
+        self.time_limit_minutes = time_limit_minutes
+        self.shuffle_seed = shuffle_seed
+        self.submitted = submitted
+
+    @classmethod
+    def from_attempt(cls, attempt):
+        return cls(
+            attempt.id, attempt.user_id, attempt.quiz_id, attempt.started_at,
+            attempt.quiz.time_limit_minutes, attempt.shuffle_seed, submitted=attempt.score is not None,
+        )
+
+    @property
+    def timeout(self):
+        """Seconds the session's cache entries should live."""
+        return int((timedelta(minutes=self.time_limit_minutes) + SESSION_MARGIN).total_seconds())
+
+    def store(self):
+        """Record the session in the shared cache."""
+        state = (
+            self.user_id, self.quiz_id, self.started_at.timestamp(), self.time_limit_minutes, self.shuffle_seed,
+            self.submitted,
+        )
+        cache.set(_session_key(self.attempt_id), state, self.timeout)
+
+    @classmethod
+    def load(cls, attempt_id):
+        """
+        Return the session of an attempt, or None if there is no such attempt.
+        Falls back to the database (and re-stores the session) on a cache miss.
+        """
+        state = cache.get(_session_key(attempt_id))
+        if state is not None:
+            user_id, quiz_id, started, time_limit_minutes, shuffle_seed, submitted = state
+            started_at = datetime.fromtimestamp(started, tz=dt_timezone.utc)
+            return cls(attempt_id, user_id, quiz_id, started_at, time_limit_minutes, shuffle_seed, submitted)
+
+        attempt = TakenQuiz.objects.select_related('quiz').filter(pk=attempt_id).first()
+        if attempt is None:
+            return None
+        session = cls.from_attempt(attempt)
+        if not session.submitted:
+            session.store()
+        return session
+
+    def save_answers(self, answers):
+        """
+        Autosave {question id: [choice ids]}, replacing earlier answers to the
+        same questions; an empty list clears a question. Flushes to the
+        database every FLUSH_EVERY saves.
+        """
+        cache.set_many(
+            {
+                **{_answer_key(self.attempt_id, question_id): choice_ids for question_id, choice_ids in answers.items()},
+                _saved_at_key(self.attempt_id): time.time(),
+            },
+            self.timeout,
+        )
+        saves = incr_counter(_saves_key(self.attempt_id), timeout=self.timeout)
+        if saves % FLUSH_EVERY == 0:
+            self.flush()
+
+    def answers(self, question_ids, saved=None):
+        """
+        The answers to `question_ids` autosaved so far, on top of the
+        `saved` snapshot ({question id: [choice ids]}) from TakenQuiz.choice_ids.
+        """
+        keys = {_answer_key(self.attempt_id, question_id): str(question_id) for question_id in question_ids}
+        cached = cache.get_many(keys)
+        merged = dict(saved or {})
+        merged.update((keys[key], choice_ids) for key, choice_ids in cached.items())
+        return merged
+
+    def flush(self):
+        """Copy the autosaved answers over the attempt's stored snapshot."""
+        attempt = TakenQuiz.objects.filter(pk=self.attempt_id, score__isnull=True)
+        answer_key = get_answer_key(self.quiz_id)
+        saved = answer_key.group_by_question(unpack_choice_ids(attempt.values_list('choice_ids', flat=True).first()))
+        answers = self.answers(answer_key.question_ids(), saved)
+        attempt.update(choice_ids=pack_choice_ids(choice_id for ids in answers.values() for choice_id in ids))
+
+    def clear(self):
+        """Drop the autosaved answers once the attempt is submitted, and mark the session submitted."""
+        self.submitted = True
+        self.store()
+        cache.delete_many([
+            _saves_key(self.attempt_id),
+            _saved_at_key(self.attempt_id),
+            *(_answer_key(self.attempt_id, question_id) for question_id in get_answer_key(self.quiz_id).question_ids()),
+        ])
@@ -0,0 +1,94 @@
+"""
+Per-attempt question and choice order.
+
+Every attempt gets a random `shuffle_seed` when it starts. The order of its
+questions, and of each question's choices, is derived from that seed, so no
+per-attempt ordering rows are stored and the order is the same on every
+request.
+
+The shared quiz payload (see quizzes.cache) is rendered once, in canonical
+order, together with a layout: the byte spans of each question and choice.
+Shuffling is then one join of slices of the cached bytes. Nothing is parsed
+or re-rendered, so shuffled responses still come from the cache.
+"""
+import random
+import secrets
+
+from rest_framework.renderers import JSONRenderer
+
+SEED_BITS = 31
+
+
+def new_seed():
+    return secrets.randbits(SEED_BITS)
+
+
+def render_quiz(data):
+    """
+    Render serialized quiz `data` (see QuizDetailSerializer) to the same JSON
+    bytes as JSONRenderer, and return them with their layout:
+    (questions start, questions end, ((start, choices start, choices end, end, choice spans), ...)).
+    """
+    renderer = JSONRenderer()
+    # `questions` and `choices` are the last fields, so their lists close the objects.
+    head = renderer.render({**data, 'questions': []})[:-2]
+    parts, questions = [head], []
+    offset = questions_start = len(head)
+    for i, question in enumerate(data['questions']):
+        if i:
+            parts.append(b",")
+            offset += 1
+        question_head = renderer.render({**question, 'choices': []})[:-2]
+        start = offset
+        parts.append(question_head)
+        offset += len(question_head)
+        choices_start = offset
+
+        spans = []
+        for j, choice in enumerate(question['choices']):
+            if j:
+                parts.append(b",")
+                offset += 1
+            rendered = renderer.render(choice)
+            parts.append(rendered)
+            spans.append((offset, offset + len(rendered)))
+            offset += len(rendered)
+
+        parts.append(b"]}")
+        questions.append((start, choices_start, offset, offset + 2, tuple(spans)))
+        offset += 2
+    parts.append(b"]}")
+    return b"".join(parts), (questions_start, offset, tuple(questions))
+
+
+def _join(view, spans):
+    parts = []
+    for i, (start, end) in enumerate(spans):
+        if i:
+            parts.append(b",")
+        parts.append(view[start:end])
+    return parts
+
+
+def shuffle_payload(payload, layout, seed):
+    """The payload with its questions and choices in the order given by `seed`."""
+    questions_start, questions_end, questions = layout
+    rng = random.Random(seed)
+    view = memoryview(payload)
+
+    rendered = []
+    for start, choices_start, choices_end, end, choices in questions:
+        rendered.append([
+            view[start:choices_start],
+            *_join(view, rng.sample(choices, len(choices))),
+            view[choices_end:end],
+        ])
+    order = rng.sample(range(len(questions)), len(questions))
+
+    parts = [view[:questions_start]]
+    for i, index in enumerate(order):
+        if i:
+            parts.append(b",")
+        parts.extend(rendered[index])
+    parts.append(view[questions_end:])
+    return b"".join(parts)
@@ -1,50 +1,86 @@
-from django.db.models.signals import post_save
-from django.dispatch import receiver
-from quizzes.models import TakenQuiz
-from accounts.models import Profile
-from django.db.models import Avg, Sum, Count
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import Signal, receiver
+from quizzes.models import Category, Quiz, Question, Choice, TakenQuiz
+from quizzes.achievements import award_for_attempts
+from quizzes.cache import invalidate_catalog, invalidate_quiz, invalidate_quiz_list
+from quizzes.search import get_search_backend
+from quizzes.stats import record_completed_attempts
+
+# Sent with `attempts`, a list of newly scored TakenQuiz instances.
+quiz_completed = Signal()
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Quiz)
+def invalidate_catalog_content(sender, instance, **kwargs):
+    """Invalidate rendered quiz payloads when a quiz or category changes."""
+    invalidate_catalog()
+
+
+@receiver(post_save, sender=Quiz)
+def index_quiz(sender, instance, **kwargs):
+    """Keep the full-text search index in sync with quiz content."""
+    get_search_backend().index_quizzes([instance.pk])
+
+
+@receiver(post_delete, sender=Quiz)
+def unindex_quiz(sender, instance, **kwargs):
+    """Drop a deleted quiz from the full-text search index."""
+    get_search_backend().remove_quizzes([instance.pk])
+
+
+@receiver(post_save, sender=Category)
+def index_category_quizzes(sender, instance, created, **kwargs):
+    """Re-index quizzes whose searchable category name may have changed."""
+    if not created:
+        get_search_backend().index_quizzes(instance.quizzes.values_list('pk', flat=True))
+
+
+@receiver(pre_delete, sender=Category)
+def remember_category_quizzes(sender, instance, **kwargs):
+    """Remember which quizzes lose their category, before SET_NULL clears it."""
+    instance._search_quiz_ids = list(instance.quizzes.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Category)
+def index_orphaned_quizzes(sender, instance, **kwargs):
+    """Re-index quizzes that no longer have a category."""
+    get_search_backend().index_quizzes(getattr(instance, '_search_quiz_ids', []))
+
+
+@receiver([post_save, post_delete], sender=Question)
+def invalidate_question_content(sender, instance, **kwargs):
+    """Invalidate the rendered payload of the quiz owning this question."""
+    invalidate_quiz(instance.quiz_id)
+    invalidate_quiz_list()
+
+
+@receiver([post_save, post_delete], sender=Choice)
+def invalidate_choice_content(sender, instance, **kwargs):
+    """Invalidate the rendered payload of the quiz owning this choice."""
+    if Choice.question.is_cached(instance):
+        quiz_id = instance.question.quiz_id
+    else:
+        quiz_id = Question.objects.filter(pk=instance.question_id).values_list('quiz_id', flat=True).first()
+
+    # A cascaded delete may run after its question is gone; the question's own
+    # post_delete has already invalidated the quiz in that case.
+    if quiz_id is not None:
+        invalidate_quiz(quiz_id)
+
 
 @receiver(post_save, sender=TakenQuiz)
-def update_user_profile_stats(sender, instance, created, **kwargs):
+def update_user_profile_stats(sender, instance, **kwargs):
     """
-    Update Profile statistics whenever a TakenQuiz is completed/updated with a score.
+    Add an attempt to the user's Profile statistics when it is first scored.
     """
-    # We only update stats if the quiz is completed (has a score)
-    if instance.score is not None:
-        user = instance.user
-        profile, _ = Profile.objects.get_or_create(user=user)
-        
-        # Get all completed quizzes for this user
-        results = TakenQuiz.objects.filter(user=user, score__isnull=False)
-        stats = results.aggregate(
-            total_s=Sum('score'),
-            count=Count('id'),
-            avg_s=Avg('score')
-        )
-        
-        # Update basic stats
-        profile.quizzes_taken = stats['count'] or 0
-        profile.total_score = stats['total_s'] or 0.0
-        
-        # Win rate (let's define a win as score >= 50)
-        wins = results.filter(score__gte=50.0).count()
-        if profile.quizzes_taken > 0:
-            profile.win_rate = (wins / profile.quizzes_taken) * 100
-        
-        # Level calculation (simple: 1 level per 500 total points)
-        # You can make this more complex later
-        profile.level = int(profile.total_score // 500) + 1
-        
-        # Duration / Time Played
-        total_duration = results.aggregate(total_dur=Sum('duration'))['total_dur']
-        profile.time_played = total_duration
-        
-        # Best Category calculation
-        best_cat = results.values('quiz__category__name').annotate(
-            avg_score=Avg('score')
-        ).order_by('-avg_score').first()
-        
-        if best_cat:
-            profile.best_category = best_cat['quiz__category__name']
-
-        profile.save()
+    if instance.score is not None and not getattr(instance, '_was_scored', False):
+        record_completed_attempts([instance])
+        instance._was_scored = True
+        quiz_completed.send(sender=TakenQuiz, attempts=[instance])
+
+
+@receiver(quiz_completed)
+def award_achievements(sender, attempts, **kwargs):
+    """Award the achievements that newly completed attempts unlocked."""
+    award_for_attempts(attempts)
@@ -0,0 +1,207 @@
+"""
+Incremental profile statistics.
+
+Completing a quiz adds to the user's Profile counters with a single atomic
+F() UPDATE and to a per-category running total (UserCategoryStat), so the
+cost of recording an attempt does not depend on how many quizzes the user
+has already taken. `reconcile_stats()` recomputes everything from the
+TakenQuiz history and corrects any drift, e.g. after attempts are edited or
+deleted in the admin.
+"""
+import math
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, DurationField, F, FloatField, IntegerField, Q, Sum, Value
+from django.db.models.functions import Cast, Coalesce, Floor
+from django.utils import timezone
+
+from accounts.cache import invalidate_profile
+from accounts.models import Profile
+from core.db import increment_or_create
+
+from .leaderboards import record_scores
+from .models import TakenQuiz, UserCategoryStat
+from .streaks import local_day, streak_changes
+
+WIN_SCORE = 50.0  # A completed quiz counts as a win at or above this score.
+POINTS_PER_LEVEL = 500
+RECONCILE_BATCH_SIZE = 500
+
+
+class _Totals:
+    """Stats deltas accumulated for one user."""
+
+    def __init__(self):
+        self.username = None
+        self.count = 0
+        self.total_score = 0.0
+        self.wins = 0
+        self.duration = None
+        self.categories = defaultdict(lambda: [0, 0.0])  # category id -> [attempts, total score]
+        self.days = set()  # local days with a completed quiz
+        self.attempts = []
+
+    def add(self, attempt):
+        self.attempts.append(attempt)
+        self.username = attempt.user.username
+        self.count += 1
+        self.total_score += attempt.score
+        self.wins += attempt.score >= WIN_SCORE
+        if attempt.duration is not None:
+            self.duration = (self.duration or timedelta(0)) + attempt.duration
+        self.days.add(local_day(attempt.completed_at or timezone.now(), attempt.user))
+        category_id = attempt.quiz.category_id
+        if category_id is not None:
+            self.categories[category_id][0] += 1
+            self.categories[category_id][1] += attempt.score
+
+
+def record_completed_attempts(attempts):
+    """
+    Add newly scored attempts to their users' statistics. Callers make sure
+    each attempt is recorded once (see quizzes.signals).
+    """
+    per_user = defaultdict(_Totals)
+    for attempt in attempts:
+        per_user[attempt.user_id].add(attempt)
+
+    for user_id, totals in per_user.items():
+        with transaction.atomic():
+            for category_id, (count, total_score) in totals.categories.items():
+                increment_or_create(
+                    UserCategoryStat, {'user_id': user_id, 'category_id': category_id},
+                    attempts=count, total_score=total_score,
+                )
+            _update_profile(user_id, totals)
+            record_scores(totals.attempts)
+        invalidate_profile(totals.username)
+
+
+def best_category(user_id):
+    """Name of the category with the user's highest average score, or ''."""
+    name = UserCategoryStat.objects.filter(user_id=user_id).annotate(
+        average=F('total_score') / F('attempts')
+    ).order_by('-average', 'category__name').values_list('category__name', flat=True).first()
+    return name or ''
+
+
+def _update_profile(user_id, totals):
+    quizzes_taken = F('quizzes_taken') + totals.count
+    total_score = F('total_score') + totals.total_score
+    wins = F('wins') + totals.wins
+    changes = {
+        'quizzes_taken': quizzes_taken,
+        'total_score': total_score,
+        'wins': wins,
+        'win_rate': Cast(wins, FloatField()) * 100 / quizzes_taken,
+        'level': Cast(Floor(total_score / POINTS_PER_LEVEL), IntegerField()) + 1,
+    }
+    if totals.duration is not None:
+        changes['time_played'] = Coalesce(
+            'time_played', Value(timedelta(0)), output_field=DurationField()
+        ) + Value(totals.duration)
+    if totals.categories:
+        changes['best_category'] = best_category(user_id)
+    # Streaks advance one day at a time; a single attempt touches one day.
+    days = sorted(totals.days)
+    changes.update(streak_changes(days[0]))
+
+    profile = Profile.objects.filter(user_id=user_id)
+    if not profile.update(**changes):
+        Profile.objects.get_or_create(user_id=user_id)
+        profile.update(**changes)
+    for day in days[1:]:
+        profile.update(**streak_changes(day))
+
+
+def expected_profile_stats(count, total_score, wins, duration, best):
+    """The Profile field values implied by a user's completed history."""
+    return {
+        'quizzes_taken': count,
+        'total_score': total_score,
+        'wins': wins,
+        'win_rate': wins * 100 / count if count else 0.0,
+        'level': int(total_score // POINTS_PER_LEVEL) + 1,
+        'time_played': duration,
+        'best_category': best,
+    }
+
+
+def _drifted(profile, expected):
+    for field, value in expected.items():
+        current = getattr(profile, field)
+        if isinstance(value, float):
+            if not math.isclose(current, value, rel_tol=1e-9, abs_tol=1e-9):
+                return True
+        elif current != value:
+            return True
+    return False
+
+
+def reconcile_stats(user_ids=None, batch_size=RECONCILE_BATCH_SIZE):
+    """
+    Recompute profile and per-category statistics from TakenQuiz history, in
+    batches of users, and return the number of profiles that had drifted.
+    """
+    profiles = Profile.objects.select_related('user').order_by('user_id')
+    if user_ids is not None:
+        profiles = profiles.filter(user_id__in=user_ids)
+
+    drifted, last_user_id = 0, None
+    while True:
+        batch = profiles if last_user_id is None else profiles.filter(user_id__gt=last_user_id)
+        batch = list(batch[:batch_size])
+        if not batch:
+            return drifted
+        last_user_id = batch[-1].user_id
+        drifted += _reconcile_batch(batch)
+
+
+def _reconcile_batch(profiles):
+    user_ids = [profile.user_id for profile in profiles]
+    completed = TakenQuiz.objects.filter(user_id__in=user_ids, score__isnull=False).order_by()
+
+    totals = {
+        row['user_id']: row
+        for row in completed.values('user_id').annotate(
+            count=Count('id'),
+            total_score=Sum('score'),
+            wins=Count('id', filter=Q(score__gte=WIN_SCORE)),
+            duration=Sum('duration'),
+        )
+    }
+    category_rows = completed.filter(quiz__category__isnull=False).values(
+        'user_id', 'quiz__category_id', 'quiz__category__name'
+    ).annotate(attempts=Count('id'), total_score=Sum('score'))
+
+    stats, best = [], {}
+    ranked = sorted(category_rows, key=lambda row: (-row['total_score'] / row['attempts'], row['quiz__category__name']))
+    for row in ranked:
+        best.setdefault(row['user_id'], row['quiz__category__name'])
+        stats.append(UserCategoryStat(
+            user_id=row['user_id'], category_id=row['quiz__category_id'],
+            attempts=row['attempts'], total_score=row['total_score'],
+        ))
+
+    changed = []
+    for profile in profiles:
+        row = totals.get(profile.user_id, {})
+        expected = expected_profile_stats(
+            row.get('count', 0), row.get('total_score') or 0.0, row.get('wins', 0),
+            row.get('duration'), best.get(profile.user_id, ''),
+        )
+        if _drifted(profile, expected):
+            for field, value in expected.items():
+                setattr(profile, field, value)
+            changed.append(profile)
+
+    with transaction.atomic():
+        UserCategoryStat.objects.filter(user_id__in=user_ids).delete()
+        UserCategoryStat.objects.bulk_create(stats)
+        if changed:
+            Profile.objects.bulk_update(changed, list(expected_profile_stats(0, 0.0, 0, None, '')))
+    for profile in changed:
+        invalidate_profile(profile.user.username)
+    return len(changed)
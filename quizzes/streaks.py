@@ -0,0 +1,63 @@
+"""
+Daily streaks.
+
+A streak counts consecutive days, in the user's own timezone, with at least
+one completed quiz. Profile.last_active_day marks the last such day, so
+extending a streak is a CASE inside the UPDATE that records the attempt
+(see quizzes.stats) and never scans history. `reset_broken_streaks()`
+zeroes lapsed streaks for all users in one UPDATE.
+"""
+from datetime import timedelta
+
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from accounts.cache import invalidate_all_profiles
+from accounts.models import Profile, User, get_zone
+
+
+def local_day(moment, user):
+    """The calendar day of `moment` in the user's timezone."""
+    return moment.astimezone(user.tzinfo).date()
+
+
+def streak_changes(day):
+    """Profile UPDATE expressions recording activity on the local `day`."""
+    current_streak = Case(
+        # Already active that day, or an older attempt recorded late.
+        When(last_active_day__gte=day, then=F('current_streak')),
+        When(last_active_day=day - timedelta(days=1), then=F('current_streak') + 1),
+        default=Value(1),
+        output_field=IntegerField(),
+    )
+    return {
+        'current_streak': current_streak,
+        'highest_streak': Greatest('highest_streak', current_streak),
+        'last_active_day': Case(
+            When(last_active_day__gt=day, then=F('last_active_day')),
+            default=Value(day),
+        ),
+    }
+
+
+def reset_broken_streaks(now=None):
+    """
+    Zero every streak whose last active day is before the user's local
+    yesterday, with one UPDATE filtered per timezone in use. Returns the
+    number of streaks reset.
+    """
+    now = now or timezone.now()
+    timezones = User.objects.filter(profile__current_streak__gt=0).values_list('timezone', flat=True).distinct()
+
+    broken = Q()
+    for name in timezones:
+        yesterday = now.astimezone(get_zone(name)).date() - timedelta(days=1)
+        broken |= Q(user__timezone=name, last_active_day__lt=yesterday)
+    if not broken:
+        return 0
+
+    reset = Profile.objects.filter(broken, current_streak__gt=0).update(current_streak=0)
+    if reset:
+        invalidate_all_profiles()
+    return reset
@@ -0,0 +1,199 @@
+import io
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.cache import invalidate_achievement_ids
+from accounts.models import Achievement, Profile, User, UserAchievement
+from activities.buffer import activity_buffer
+from activities.models import Activity
+from quizzes.achievements import (
+    CATEGORY_PROGRESS, PERFECT_SCORE, QUIZ_COMPLETED, RULES, RULES_BY_EVENT, CategoryAttempts,
+    _insert_awards, award_for_attempts, backfill_achievements, completion_events, sync_achievements,
+)
+from quizzes.models import Category, Quiz, TakenQuiz
+
+
+@pytest.fixture
+def rules(db):
+    sync_achievements()
+
+
+@pytest.fixture
+def no_rules(db):
+    """Drop the rule achievements created by migration, as before a rule is deployed."""
+    Achievement.objects.filter(code__isnull=False).delete()
+    invalidate_achievement_ids()
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(email="badge@example.com", username="badge")
+
+
+@pytest.fixture
+def quizzes(db):
+    science = Category.objects.create(name="Science", slug="science")
+    return {"science": Quiz.objects.create(title="Bio", category=science), "loose": Quiz.objects.create(title="Misc")}
+
+
+def complete(user, quiz, score=60.0, moment=None):
+    with patch('django.utils.timezone.now', return_value=moment or timezone.now()):
+        return TakenQuiz.objects.create(user=user, quiz=quiz, score=score, started_at=timezone.now())
+
+
+def earned(user):
+    return set(UserAchievement.objects.filter(user=user).values_list('achievement__code', flat=True))
+
+
+@pytest.mark.django_db
+class TestRuleIndex:
+
+    def test_rules_are_indexed_by_event(self):
+        assert {rule.code for rule in RULES_BY_EVENT[PERFECT_SCORE]} == {"perfect-score"}
+        assert {rule.code for rule in RULES_BY_EVENT[CATEGORY_PROGRESS]} == {"category-10"}
+        assert "streak-7" in {rule.code for rule in RULES_BY_EVENT[QUIZ_COMPLETED]}
+
+    def test_events_of_a_completion(self, user, quizzes):
+        loose = TakenQuiz(user=user, quiz=quizzes["loose"], score=40.0)
+        perfect = TakenQuiz(user=user, quiz=quizzes["science"], score=100.0)
+
+        assert completion_events([loose]) == {QUIZ_COMPLETED}
+        assert completion_events([loose, perfect]) == {QUIZ_COMPLETED, PERFECT_SCORE, CATEGORY_PROGRESS}
+
+
+@pytest.mark.django_db
+class TestAwarding:
+
+    def test_first_quiz_and_perfect_score(self, rules, user, quizzes):
+        complete(user, quizzes["loose"], score=100.0)
+
+        assert earned(user) == {"first-quiz", "perfect-score"}
+
+    def test_category_threshold(self, rules, user, quizzes):
+        for _ in range(9):
+            complete(user, quizzes["science"])
+        assert "category-10" not in earned(user)
+
+        complete(user, quizzes["science"])
+
+        assert "category-10" in earned(user)
+
+    def test_seven_day_streak(self, rules, user, quizzes):
+        start = datetime(2026, 3, 1, 12, tzinfo=dt_timezone.utc)
+        for day in range(7):
+            complete(user, quizzes["loose"], moment=start + timedelta(days=day))
+
+        assert "streak-7" in earned(user)
+
+    def test_awarded_once(self, rules, user, quizzes):
+        complete(user, quizzes["loose"], score=100.0)
+        complete(user, quizzes["loose"], score=100.0)
+
+        assert UserAchievement.objects.filter(user=user).count() == 2
+
+    def test_uniqueness_is_enforced(self, rules, user):
+        achievement = Achievement.objects.get(code="first-quiz")
+        UserAchievement.objects.create(user=user, achievement=achievement)
+
+        with pytest.raises(IntegrityError):
+            UserAchievement.objects.create(user=user, achievement=achievement)
+
+    def test_untriggered_rules_are_skipped(self, rules, user, quizzes):
+        attempt = TakenQuiz.objects.create(user=user, quiz=quizzes["loose"], started_at=timezone.now())
+        attempt.score = 50.0
+
+        with CaptureQueriesContext(connection) as queries:
+            attempt.save()
+
+        # An uncategorised attempt never evaluates the category rules.
+        assert not any("usercategorystat" in query["sql"] for query in queries.captured_queries)
+        assert earned(user) == {"first-quiz"}
+
+    def test_concurrently_awarded_pairs_are_not_returned(self, rules, user):
+        first, perfect = (Achievement.objects.get(code=code) for code in ("first-quiz", "perfect-score"))
+        # Awarded by another request after this one checked.
+        UserAchievement.objects.create(user=user, achievement=first)
+
+        inserted = _insert_awards([(user.id, first.id), (user.id, perfect.id)])
+
+        assert [award.achievement_id for award in inserted] == [perfect.id]
+        assert UserAchievement.objects.filter(user=user).count() == 2
+
+    def test_repeated_evaluation_announces_nothing(self, rules, user, quizzes):
+        attempt = complete(user, quizzes["loose"])
+        assert earned(user) == {"first-quiz"}
+
+        assert award_for_attempts([attempt]) == []
+
+    def test_achievements_without_rules_are_ignored(self, no_rules, user, quizzes):
+        Achievement.objects.create(name="Hand-picked", description="", badge_type="epic")
+
+        complete(user, quizzes["loose"], score=100.0)
+
+        assert not UserAchievement.objects.exists()
+
+    def test_earned_achievements_reach_the_feed(self, rules, user, quizzes, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            complete(user, quizzes["loose"])
+        activity_buffer.flush()
+
+        assert Activity.objects.filter(
+            user=user, activity_type=Activity.ActivityType.ACHIEVEMENT_EARNED, description="Earned 'First Steps'"
+        ).exists()
+
+
+@pytest.mark.django_db
+class TestRuleAchievements:
+
+    def test_migration_creates_an_achievement_per_rule(self):
+        names = dict(Achievement.objects.filter(code__isnull=False).values_list('code', 'name'))
+        assert names == {rule.code: rule.name for rule in RULES}
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('no_rules')
+class TestBackfill:
+
+    def test_sync_creates_missing_definitions_only(self):
+        Achievement.objects.create(code="first-quiz", name="Renamed", description="", badge_type="uncommon")
+
+        created = sync_achievements()
+
+        assert created == len(RULES) - 1
+        assert Achievement.objects.get(code="first-quiz").name == "Renamed"
+
+    def test_backfill_in_chunks(self, user, quizzes):
+        other = User.objects.create_user(email="o@example.com", username="other")
+        complete(user, quizzes["loose"], score=100.0)
+        for _ in range(10):
+            complete(other, quizzes["science"])
+        sync_achievements()
+
+        assert backfill_achievements(chunk_size=1) == 4
+        assert earned(user) == {"first-quiz", "perfect-score"}
+        assert earned(other) == {"first-quiz", "category-10"}
+        assert backfill_achievements() == 0
+
+    def test_custom_rules(self, user, quizzes):
+        rule = CategoryAttempts("science-2", "Curious", "Two categorised quizzes.", "uncommon", count=2)
+        complete(user, quizzes["science"])
+        complete(user, quizzes["science"])
+        sync_achievements([rule])
+
+        assert backfill_achievements([rule]) == 1
+        assert earned(user) == {"science-2"}
+
+    def test_command(self, user, quizzes):
+        complete(user, quizzes["loose"])
+        output = io.StringIO()
+
+        call_command('backfill_achievements', '--chunk-size', '10', stdout=output)
+
+        assert "Created 5 achievements and awarded 1." in output.getvalue()
+        assert Profile.objects.get(user=user).quizzes_taken == 1
@@ -0,0 +1,53 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import User
+from quizzes.models import Quiz, TakenQuiz
+
+
+@pytest.mark.django_db
+class TestLargeTableAdmin:
+
+    @pytest.fixture
+    def admin_client(self, client):
+        admin = User.objects.create_superuser(email="admin@example.com", username="admin", password="pass12345")
+        client.force_login(admin)
+        return client
+
+    def seed(self, count):
+        users = User.objects.bulk_create(
+            User(email=f"player{i}@example.com", username=f"player{i}")
+            for i in range(User.objects.count(), User.objects.count() + count)
+        )
+        quizzes = Quiz.objects.bulk_create(Quiz(title=f"Quiz {i}", description="") for i in range(count))
+        TakenQuiz.objects.bulk_create(
+            TakenQuiz(user=user, quiz=quiz, started_at=timezone.now(), score=50.0) for user, quiz in zip(users, quizzes)
+        )
+        return users
+
+    def changelist_queries(self, client, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, params)
+        assert response.status_code == 200
+        return len(queries)
+
+    @pytest.mark.parametrize('name', ['admin:quizzes_takenquiz_changelist', 'admin:accounts_profile_changelist'])
+    def test_changelist_queries_do_not_grow_with_rows(self, admin_client, name):
+        url = reverse(name)
+        self.seed(5)
+        few = self.changelist_queries(admin_client, url)
+        self.seed(50)
+
+        assert self.changelist_queries(admin_client, url) == few
+
+    def test_filters_by_user_without_listing_users(self, admin_client):
+        users = self.seed(5)
+        url = reverse('admin:quizzes_takenquiz_changelist')
+
+        response = admin_client.get(url, {'user__id__exact': users[0].id})
+
+        assert list(response.context['cl'].result_list) == [TakenQuiz.objects.get(user=users[0])]
+        assert users[1].username not in response.content.decode()
@@ -0,0 +1,113 @@
+import io
+import math
+import random
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from accounts.models import User
+from quizzes.analysis import analyze_items, analyze_quiz
+from quizzes.models import Choice, Question, QuestionStat, Quiz, TakenQuiz
+from quizzes.scoring import pack_choice_ids
+
+
+@pytest.fixture
+def quiz(db):
+    """Three questions of three choices each; returns the quiz and its choices per question (correct first)."""
+    quiz = Quiz.objects.create(title="Algebra")
+    choices = []
+    for i in range(3):
+        question = Question.objects.create(quiz=quiz, text=f"Question {i}", order=i)
+        choices.append([
+            Choice.objects.create(question=question, text=f"Choice {j}", is_correct=j == 0).id for j in range(3)
+        ])
+    return quiz, choices
+
+
+def submit(quiz, answer_sets):
+    user = User.objects.create_user(email="analysis@example.com", username="analysis")
+    TakenQuiz.objects.bulk_create(
+        TakenQuiz(user=user, quiz=quiz, started_at=timezone.now(), score=0.0, choice_ids=pack_choice_ids(answers))
+        for answers in answer_sets
+    )
+
+
+def point_biserial(item, rest):
+    n = len(item)
+    mean_item, mean_rest = sum(item) / n, sum(rest) / n
+    covariance = sum((x - mean_item) * (y - mean_rest) for x, y in zip(item, rest))
+    spread = math.sqrt(sum((x - mean_item) ** 2 for x in item) * sum((y - mean_rest) ** 2 for y in rest))
+    return covariance / spread
+
+
+@pytest.mark.django_db
+class TestItemAnalysis:
+
+    def test_matches_a_direct_computation(self, quiz):
+        quiz, choices = quiz
+        rng = random.Random(3)
+        answer_sets = [[rng.choice(question) for question in choices] for _ in range(200)]
+        submit(quiz, answer_sets)
+
+        analyze_items(chunk_size=64)
+
+        correct = [[int(answers[q] == choices[q][0]) for q in range(3)] for answers in answer_sets]
+        for q, question_choices in enumerate(choices):
+            stat = QuestionStat.objects.get(question__quiz=quiz, question__order=q)
+            item = [row[q] for row in correct]
+            rest = [sum(row) - row[q] for row in correct]
+            assert stat.attempts == 200
+            assert stat.p_value == pytest.approx(sum(item) / 200)
+            assert stat.discrimination == pytest.approx(point_biserial(item, rest))
+            assert stat.choice_rates == {
+                str(choice_id): pytest.approx(sum(answers[q] == choice_id for answers in answer_sets) / 200)
+                for choice_id in question_choices
+            }
+
+    def test_chunking_does_not_change_results(self, quiz):
+        quiz, choices = quiz
+        rng = random.Random(5)
+        submit(quiz, [[rng.choice(question) for question in choices] for _ in range(50)])
+
+        whole, chunked = analyze_quiz(quiz.id, chunk_size=1000), analyze_quiz(quiz.id, chunk_size=7)
+
+        assert [s.p_value for s in whole.stats()] == pytest.approx([s.p_value for s in chunked.stats()])
+        assert [s.discrimination for s in whole.stats()] == pytest.approx([s.discrimination for s in chunked.stats()])
+
+    def test_suggests_difficulty_from_mean_p_value(self, quiz):
+        quiz, choices = quiz
+        submit(quiz, [[question[0] for question in choices]] * 20 + [[question[1] for question in choices]] * 20)
+
+        analyze_items()
+
+        assert Quiz.objects.get(pk=quiz.id).suggested_difficulty == Quiz.Difficulty.MEDIUM
+        assert QuestionStat.objects.get(question__quiz=quiz, question__order=0).p_value == 0.5
+
+    def test_too_few_attempts_suggest_nothing(self, quiz):
+        quiz, choices = quiz
+        submit(quiz, [[question[0] for question in choices]] * 3)
+
+        analyze_items()
+
+        assert Quiz.objects.get(pk=quiz.id).suggested_difficulty == ''
+        # Every attempt answered every question correctly, so nothing discriminates.
+        assert QuestionStat.objects.filter(question__quiz=quiz, discrimination__isnull=True).count() == 3
+
+    def test_rerun_updates_stats_and_ignores_stale_choices(self, quiz):
+        quiz, choices = quiz
+        submit(quiz, [[choices[0][0], 10 ** 12]])
+        analyze_items()
+
+        TakenQuiz.objects.update(choice_ids=pack_choice_ids([choices[0][1]]))
+        call_command('analyze_items', quiz_ids=[quiz.id], stdout=io.StringIO())
+
+        stat = QuestionStat.objects.get(question__quiz=quiz, question__order=0)
+        assert (stat.attempts, stat.p_value) == (1, 0.0)
+        assert QuestionStat.objects.count() == 3
+
+    def test_quizzes_without_answers_are_skipped(self, quiz):
+        quiz, choices = quiz
+
+        assert analyze_items() == 0
+        assert not QuestionStat.objects.exists()
@@ -0,0 +1,172 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import Profile, User
+from quizzes.models import Category, Choice, Question, Quiz, TakenQuiz, UserCategoryStat
+from quizzes.sessions import AttemptSession
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(email="batch@example.com", username="batch")
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def quiz(db):
+    """A two-question quiz; returns it with its correct and wrong choice IDs."""
+    category = Category.objects.create(name="History", slug="history")
+    quiz = Quiz.objects.create(title="Rome", category=category, time_limit_minutes=10)
+    correct, wrong = [], []
+    for i in range(2):
+        question = Question.objects.create(quiz=quiz, text=f"Question {i}", order=i)
+        correct.append(Choice.objects.create(question=question, text="Right", is_correct=True).id)
+        wrong.append(Choice.objects.create(question=question, text="Wrong", is_correct=False).id)
+    return quiz, correct, wrong
+
+
+def attempt(user, quiz, started_at=None):
+    return TakenQuiz.objects.create(user=user, quiz=quiz, started_at=started_at or timezone.now())
+
+
+def submit_batch(client, items):
+    return client.post(reverse('quiz-submit-batch', kwargs={'version': 'v1'}), {"attempts": items}, format='json')
+
+
+@pytest.mark.django_db
+class TestBatchSubmit:
+
+    def test_scores_every_attempt(self, client, user, quiz):
+        quiz, correct, wrong = quiz
+        first, second = attempt(user, quiz), attempt(user, quiz)
+
+        response = submit_batch(client, [
+            {"attempt_id": first.id, "answers": correct},
+            {"attempt_id": second.id, "answers": [correct[0], wrong[1]]},
+        ])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['submitted'] == 2
+        assert [(r['attempt_id'], r['status'], r['score']) for r in response.data['results']] == [
+            (first.id, 200, 100.0), (second.id, 200, 50.0),
+        ]
+        assert TakenQuiz.objects.get(pk=second.id).correct_answers == 1
+
+    def test_stats_are_recorded_once_per_attempt(self, client, user, quiz):
+        quiz, correct, wrong = quiz
+        attempts = [attempt(user, quiz) for _ in range(3)]
+
+        submit_batch(client, [{"attempt_id": a.id, "answers": correct} for a in attempts])
+
+        profile = Profile.objects.get(user=user)
+        assert (profile.quizzes_taken, profile.total_score) == (3, 300.0)
+        assert UserCategoryStat.objects.get(user=user).attempts == 3
+
+    def test_profile_is_updated_once_per_batch(self, client, user, quiz):
+        quiz, correct, wrong = quiz
+        attempts = [attempt(user, quiz) for _ in range(5)]
+
+        with CaptureQueriesContext(connection) as queries:
+            submit_batch(client, [{"attempt_id": a.id, "answers": correct} for a in attempts])
+
+        profile_updates = [q for q in queries if q['sql'].startswith('UPDATE "accounts_profile"')]
+        assert len(profile_updates) == 1
+
+    def test_queries_do_not_grow_with_the_batch(self, client, user, quiz):
+        quiz, correct, wrong = quiz
+        # Earn the achievements these attempts unlock first, so neither batch awards any.
+        submit_batch(client, [{"attempt_id": attempt(user, quiz).id, "answers": correct} for _ in range(10)])
+
+        counts = []
+        for size in (1, 10):
+            attempts = [attempt(user, quiz) for _ in range(size)]
+            with CaptureQueriesContext(connection) as queries:
+                submit_batch(client, [{"attempt_id": a.id, "answers": correct} for a in attempts])
+            counts.append(len(queries))
+
+        assert counts[0] == counts[1]
+
+    def test_partial_failures_are_reported(self, client, user, quiz):
+        quiz, correct, wrong = quiz
+        other = User.objects.create_user(email="other@example.com", username="other")
+        good = attempt(user, quiz)
+        late = attempt(user, quiz, started_at=timezone.now() - timedelta(minutes=20))
+        foreign = attempt(other, quiz)
+
+        response = submit_batch(client, [
+            {"attempt_id": good.id, "answers": correct},
+            {"attempt_id": good.id, "answers": correct},
+            {"attempt_id": late.id, "answers": correct},
+            {"attempt_id": foreign.id, "answers": correct},
+            {"attempt_id": "x"},
+            {"attempt_id": attempt(user, quiz).id, "answers": "1,2"},
+        ])
+
+        assert response.data['submitted'] == 1
+        assert [r['status'] for r in response.data['results']] == [200, 400, 403, 404, 404, 400]
+        assert TakenQuiz.objects.filter(user=user, score__isnull=False).count() == 1
+        assert TakenQuiz.objects.get(pk=foreign.id).score is None
+
+    def test_offline_completion_time_is_checked(self, client, user, quiz):
+        quiz, correct, wrong = quiz
+        started = timezone.now() - timedelta(hours=2)
+        on_time, too_early = attempt(user, quiz, started), attempt(user, quiz, started)
+
+        response = submit_batch(client, [
+            {"attempt_id": on_time.id, "answers": correct, "completed_at": (started + timedelta(minutes=5)).isoformat()},
+            {"attempt_id": too_early.id, "answers": correct, "completed_at": (started - timedelta(minutes=1)).isoformat()},
+        ])
+
+        assert [r['status'] for r in response.data['results']] == [200, 400]
+        assert TakenQuiz.objects.get(pk=on_time.id).duration == timedelta(minutes=5)
+
+    def test_completion_time_is_not_before_the_last_autosave(self, client, user, quiz):
+        quiz, correct, wrong = quiz
+        started = timezone.now() - timedelta(hours=2)
+        late = attempt(user, quiz, started)
+        AttemptSession.from_attempt(late).save_answers({Choice.objects.get(pk=correct[0]).question_id: correct[:1]})
+
+        response = submit_batch(client, [
+            {"attempt_id": late.id, "answers": correct, "completed_at": (started + timedelta(minutes=5)).isoformat()},
+        ])
+
+        assert response.data['results'][0]['status'] == status.HTTP_403_FORBIDDEN
+        assert TakenQuiz.objects.get(pk=late.id).score is None
+
+    def test_completion_time_is_within_the_offline_window(self, client, user, quiz):
+        quiz, correct, wrong = quiz
+        started = timezone.now() - timedelta(hours=30)
+        stale = attempt(user, quiz, started)
+
+        response = submit_batch(client, [
+            {"attempt_id": stale.id, "answers": correct, "completed_at": (started + timedelta(minutes=5)).isoformat()},
+        ])
+
+        assert response.data['results'][0]['status'] == status.HTTP_403_FORBIDDEN
+
+    def test_accepts_string_attempt_ids(self, client, user, quiz):
+        quiz, correct, wrong = quiz
+        pending = attempt(user, quiz)
+
+        response = submit_batch(client, [{"attempt_id": str(pending.id), "answers": correct}])
+
+        assert response.data['submitted'] == 1
+        assert response.data['results'][0]['attempt_id'] == str(pending.id)
+        assert TakenQuiz.objects.get(pk=pending.id).score == 100.0
+
+    def test_rejects_malformed_batches(self, client):
+        assert submit_batch(client, "nope").status_code == status.HTTP_400_BAD_REQUEST
+        assert submit_batch(client, [{"attempt_id": 1}] * 101).status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,172 @@
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from quizzes.bulk import QuizImportError, export_quizzes, import_quizzes
+from quizzes.models import Category, Choice, Question, Quiz
+
+
+def record(title, category="science", questions=2):
+    return json.dumps({
+        "title": title,
+        "description": "Imported",
+        "category": {"slug": category, "name": category.title()} if category else None,
+        "difficulty": "MEDIUM",
+        "questions": [
+            {"text": f"{title} Q{q}", "choices": [
+                {"text": "Right", "is_correct": True},
+                {"text": "Wrong", "is_correct": False},
+            ]}
+            for q in range(questions)
+        ],
+    }) + "\n"
+
+
+@pytest.mark.django_db
+class TestQuizImportExport:
+
+    def test_import_creates_nested_content(self):
+        lines = [record(f"Quiz {i}") for i in range(5)] + [record("Loose", category=None)]
+
+        assert import_quizzes(lines, chunk_size=2) == 6
+
+        assert Quiz.objects.count() == 6
+        assert Category.objects.get(slug="science").quizzes.count() == 5
+        assert Question.objects.count() == 12
+        assert Choice.objects.filter(is_correct=True).count() == 12
+        quiz = Quiz.objects.get(title="Quiz 3")
+        assert quiz.difficulty == "MEDIUM"
+        assert list(quiz.questions.values_list('text', 'order')) == [("Quiz 3 Q0", 0), ("Quiz 3 Q1", 1)]
+
+    def test_export_round_trips(self):
+        import_quizzes([record("Física"), record("Loose", category=None)])
+
+        exported = list(export_quizzes())
+        Quiz.objects.all().delete()
+        import_quizzes(exported)
+
+        assert list(export_quizzes()) == exported
+
+    def test_invalid_line_keeps_earlier_chunks(self):
+        lines = [record("Good 1"), record("Good 2"), '{"description": "no title"}\n']
+
+        with pytest.raises(QuizImportError) as excinfo:
+            import_quizzes(lines, chunk_size=2)
+
+        assert excinfo.value.line_number == 3
+        assert set(Quiz.objects.values_list('title', flat=True)) == {"Good 1", "Good 2"}
+
+    @pytest.mark.parametrize('change, message', [
+        ({"time_limit_minutes": "abc"}, "'time_limit_minutes' must be a non-negative integer"),
+        ({"time_limit_minutes": -1}, "'time_limit_minutes' must be a non-negative integer"),
+        ({"time_limit_minutes": True}, "'time_limit_minutes' must be a non-negative integer"),
+        ({"is_active": "yes"}, "'is_active' must be true or false"),
+        ({"description": None}, "'description' must be a string"),
+        ({"title": "x" * 256}, "'title' is longer than 255 characters"),
+        ({"title": 5}, "'title' must be a non-empty string"),
+        ({"category": {"slug": "no spaces"}}, "invalid category slug"),
+        ({"category": {"slug": "science", "name": "x" * 101}}, "category 'name' is longer than 100 characters"),
+        ({"questions": {"text": "Q"}}, "'questions' must be a list"),
+        ({"questions": [{"text": "Q", "order": "x"}]}, "question 'order' must be a non-negative integer"),
+        ({"questions": [{"text": "Q", "choices": "A"}]}, "question 'choices' must be a list"),
+        ({"questions": [{"text": "Q", "choices": [{"text": "x" * 256}]}]}, "choice 'text' is longer than 255"),
+        ({"questions": [{"text": "Q", "choices": [{"text": "A", "is_correct": 1}]}]}, "choice 'is_correct' must be"),
+    ])
+    def test_invalid_field_values_are_import_errors(self, change, message):
+        line = json.dumps({**json.loads(record("Bad")), **change}) + "\n"
+
+        with pytest.raises(QuizImportError, match=message) as excinfo:
+            import_quizzes([record("Good"), line])
+
+        assert excinfo.value.line_number == 2
+        assert not Quiz.objects.filter(title="Bad").exists()
+
+    def test_category_name_taken_by_another_slug_is_an_import_error(self):
+        Category.objects.create(name="Science", slug="sciences")
+
+        with pytest.raises(QuizImportError, match="Line 1: category name 'Science'"):
+            import_quizzes([record("Quiz", category="science")])
+
+    def test_undecodable_line_is_an_import_error(self):
+        with pytest.raises(QuizImportError, match="Line 2: not valid UTF-8"):
+            import_quizzes([record("Good").encode(), b"\xff\n"])
+
+    def test_imported_quizzes_are_listed_and_searchable(self):
+        client = APIClient()
+        url = reverse('quiz-list', kwargs={'version': 'v1'})
+        assert client.get(url).data['results'] == []
+
+        import_quizzes([record("Volcanoes")])
+
+        assert [q['title'] for q in client.get(url).data['results']] == ["Volcanoes"]
+        assert [q['title'] for q in client.get(url, {'search': 'volcano'}).data['results']] == ["Volcanoes"]
+
+    def test_commands(self, tmp_path):
+        source = tmp_path / "in.jsonl"
+        source.write_text(record("Quiz A") + record("Quiz B", category="history"), encoding="utf-8")
+
+        call_command('import_quizzes', str(source), stdout=io.StringIO())
+        output = io.StringIO()
+        call_command('export_quizzes', '--category', 'history', stdout=output)
+
+        assert [json.loads(line)['title'] for line in output.getvalue().splitlines()] == ["Quiz B"]
+
+    def test_import_command_reports_bad_lines(self, tmp_path):
+        source = tmp_path / "bad.jsonl"
+        source.write_text("not json\n", encoding="utf-8")
+
+        with pytest.raises(CommandError, match="Line 1"):
+            call_command('import_quizzes', str(source))
+
+
+@pytest.mark.django_db
+class TestQuizAdminBulkActions:
+
+    @pytest.fixture
+    def admin_client(self, client):
+        admin = User.objects.create_superuser(email="admin@example.com", username="admin", password="pass12345")
+        client.force_login(admin)
+        return client
+
+    def test_export_action_streams_jsonl(self, admin_client):
+        import_quizzes([record("Quiz A"), record("Quiz B")])
+        quiz = Quiz.objects.get(title="Quiz B")
+
+        response = admin_client.post(reverse('admin:quizzes_quiz_changelist'), {
+            'action': 'export_jsonl', '_selected_action': [quiz.id],
+        })
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert [json.loads(line)['title'] for line in lines] == ["Quiz B"]
+
+    def test_import_action_uploads_jsonl(self, admin_client):
+        upload = io.BytesIO(record("Uploaded").encode())
+        upload.name = "quizzes.jsonl"
+
+        response = admin_client.post(reverse('admin:quizzes_quiz_import_jsonl'), {'file': upload})
+
+        assert response.status_code == 302
+        assert Quiz.objects.filter(title="Uploaded").exists()
+
+    def test_import_action_reports_invalid_values(self, admin_client):
+        line = json.dumps({**json.loads(record("Bad")), "time_limit_minutes": "abc"}) + "\n"
+        upload = io.BytesIO(line.encode("utf-8"))
+        upload.name = "quizzes.jsonl"
+
+        response = admin_client.post(reverse("admin:quizzes_quiz_import_jsonl"), {"file": upload})
+
+        assert response.status_code == 200
+        assert "Line 1: &#x27;time_limit_minutes&#x27; must be a non-negative integer" in response.content.decode()
+        assert not Quiz.objects.exists()
+
+    def test_import_form_renders(self, admin_client):
+        response = admin_client.get(reverse('admin:quizzes_quiz_import_jsonl'))
+
+        assert response.status_code == 200
+        assert b'type="file"' in response.content
@@ -0,0 +1,92 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from quizzes.models import Category, Quiz, Question, Choice
+from quizzes.cache import payload_cache_stats
+
+@pytest.mark.django_db
+class TestQuizPayloadCache:
+
+    @pytest.fixture
+    def api_client(self):
+        from rest_framework.test import APIClient
+        return APIClient()
+
+    @pytest.fixture
+    def quiz(self):
+        category = Category.objects.create(name="Science", slug="science")
+        quiz = Quiz.objects.create(title="Biology Quiz", category=category)
+        question = Question.objects.create(quiz=quiz, text="What is a cell?")
+        Choice.objects.create(question=question, text="Basic unit of life", is_correct=True)
+        Choice.objects.create(question=question, text="A car part", is_correct=False)
+        return quiz
+
+    def detail_url(self, quiz):
+        return reverse('quiz-detail', kwargs={'pk': quiz.id, 'version': 'v1'})
+
+    def test_warm_hit_skips_database(self, api_client, quiz, django_assert_num_queries):
+        """A cached payload is served without touching the database."""
+        first = api_client.get(self.detail_url(quiz))
+        assert first.status_code == status.HTTP_200_OK
+
+        with django_assert_num_queries(0):
+            second = api_client.get(self.detail_url(quiz))
+
+        assert second.content == first.content
+        assert second.json()['questions'][0]['text'] == "What is a cell?"
+        assert payload_cache_stats() == {"hits": 1, "misses": 1}
+
+    def test_choice_change_invalidates_payload(self, api_client, quiz, django_capture_on_commit_callbacks):
+        """Editing a choice bumps the quiz version and re-renders the payload."""
+        api_client.get(self.detail_url(quiz))
+
+        choice = Choice.objects.get(text="A car part")
+        with django_capture_on_commit_callbacks(execute=True):
+            choice.text = "A bicycle part"
+            choice.save()
+
+        response = api_client.get(self.detail_url(quiz))
+        texts = [c['text'] for c in response.json()['questions'][0]['choices']]
+        assert "A bicycle part" in texts
+        assert payload_cache_stats()["misses"] == 2
+
+    def test_bump_waits_for_commit(self, api_client, quiz, django_capture_on_commit_callbacks):
+        """Until the edit commits, readers keep the old payload under the old version."""
+        api_client.get(self.detail_url(quiz))
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            choice = Choice.objects.get(text="A car part")
+            choice.text = "A bicycle part"
+            choice.save()
+            response = api_client.get(self.detail_url(quiz))
+            texts = [c['text'] for c in response.json()['questions'][0]['choices']]
+            assert "A car part" in texts
+
+        assert callbacks
+        for callback in callbacks:
+            callback()
+        response = api_client.get(self.detail_url(quiz))
+        texts = [c['text'] for c in response.json()['questions'][0]['choices']]
+        assert "A bicycle part" in texts
+
+    def test_category_change_invalidates_payload(self, api_client, quiz, django_capture_on_commit_callbacks):
+        """Renaming the category re-renders quizzes that embed it."""
+        api_client.get(self.detail_url(quiz))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            quiz.category.name = "Life Science"
+            quiz.category.save()
+
+        response = api_client.get(self.detail_url(quiz))
+        assert response.json()['category']['name'] == "Life Science"
+
+    def test_deactivated_quiz_is_not_served_from_cache(self, api_client, quiz, django_capture_on_commit_callbacks):
+        """Deactivating a quiz invalidates its payload, so it 404s again."""
+        api_client.get(self.detail_url(quiz))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            quiz.is_active = False
+            quiz.save()
+
+        response = api_client.get(self.detail_url(quiz))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
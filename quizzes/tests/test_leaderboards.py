@@ -0,0 +1,151 @@
+import io
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from quizzes.leaderboards import ALL_TIME, category_board, rebuild_boards, refresh_ranks, weekly_board
+from quizzes.models import Category, LeaderboardEntry, Quiz, TakenQuiz
+
+
+@pytest.fixture
+def quiz(db):
+    category = Category.objects.create(name="Science", slug="science")
+    return Quiz.objects.create(title="Bio", category=category)
+
+
+@pytest.fixture
+def players(db, quiz):
+    """Five users whose total scores are 10, 20, ..., 50."""
+    users = []
+    for i in range(1, 6):
+        user = User.objects.create_user(email=f"p{i}@example.com", username=f"player{i}")
+        TakenQuiz.objects.create(user=user, quiz=quiz, score=10.0 * i, started_at=timezone.now())
+        users.append(user)
+    refresh_ranks()
+    return users
+
+
+def url(name, **kwargs):
+    return reverse(name, kwargs={'version': 'v1', **kwargs})
+
+
+@pytest.mark.django_db
+class TestLeaderboardMaintenance:
+
+    def test_completion_updates_every_board(self, players, quiz):
+        entries = LeaderboardEntry.objects.filter(user=players[0])
+
+        assert set(entries.values_list('board', flat=True)) == {
+            ALL_TIME, weekly_board(), category_board(quiz.category_id)
+        }
+        assert all(entry.score == 10.0 and entry.quizzes == 1 for entry in entries)
+
+    def test_scores_accumulate_and_ranks_refresh(self, players, quiz):
+        TakenQuiz.objects.create(user=players[0], quiz=quiz, score=100.0, started_at=timezone.now())
+        entry = LeaderboardEntry.objects.get(board=ALL_TIME, user=players[0])
+        assert (entry.score, entry.quizzes, entry.rank) == (110.0, 2, 5)
+
+        refresh_ranks()
+
+        ranked = LeaderboardEntry.objects.filter(board=ALL_TIME).order_by('rank')
+        assert [entry.user.username for entry in ranked] == ["player1", "player5", "player4", "player3", "player2"]
+
+    def test_only_touched_boards_and_moved_ranks_are_written(self, players, quiz):
+        other = Category.objects.create(name="Art", slug="art")
+        TakenQuiz.objects.create(
+            user=players[0], quiz=Quiz.objects.create(title="Paint", category=other), score=100.0,
+            started_at=timezone.now(),
+        )
+        LeaderboardEntry.objects.filter(board=category_board(quiz.category_id)).update(rank=None)
+
+        moved = refresh_ranks()
+
+        # player1 rises to first on the all-time, weekly and new category boards; the science board is untouched.
+        assert moved == 2 * 5 + 1
+        assert not LeaderboardEntry.objects.filter(rank_stale=True).exists()
+        assert not LeaderboardEntry.objects.filter(board=category_board(quiz.category_id), rank__isnull=False).exists()
+        assert refresh_ranks() == 0
+
+    def test_expired_weekly_boards_are_dropped(self, players):
+        old_board = weekly_board(timezone.now() - timedelta(weeks=10))
+        LeaderboardEntry.objects.create(board=old_board, user=players[0], score=1.0, quizzes=1)
+
+        refresh_ranks()
+
+        assert not LeaderboardEntry.objects.filter(board=old_board).exists()
+        assert LeaderboardEntry.objects.filter(board=weekly_board()).count() == 5
+
+    def test_rebuild_from_profiles(self, players):
+        LeaderboardEntry.objects.filter(board=ALL_TIME).delete()
+
+        rebuild_boards()
+
+        top = LeaderboardEntry.objects.get(board=ALL_TIME, rank=1)
+        assert (top.user, top.score) == (players[-1], 50.0)
+
+    def test_command(self, players):
+        LeaderboardEntry.objects.update(rank=None, rank_stale=True)
+
+        call_command('refresh_leaderboards', stdout=io.StringIO())
+
+        assert not LeaderboardEntry.objects.filter(rank__isnull=True).exists()
+
+
+@pytest.mark.django_db
+class TestLeaderboardViews:
+
+    def test_top_n_with_pagination(self, players):
+        client = APIClient()
+
+        first = client.get(url('leaderboard', period='all-time'), {'page_size': 2})
+        second = client.get(first.data['next'])
+
+        assert first.status_code == status.HTTP_200_OK
+        assert first.data['results'] == [
+            {'rank': 1, 'username': 'player5', 'score': 50.0, 'quizzes': 1},
+            {'rank': 2, 'username': 'player4', 'score': 40.0, 'quizzes': 1},
+        ]
+        assert [row['rank'] for row in second.data['results']] == [3, 4]
+
+    def test_weekly_and_category_boards(self, players):
+        client = APIClient()
+
+        weekly = client.get(url('leaderboard', period='weekly'))
+        category = client.get(url('category-leaderboard', slug='science'))
+
+        assert [row['username'] for row in weekly.data['results']][:1] == ['player5']
+        assert len(category.data['results']) == 5
+
+    def test_unknown_boards_404(self, db):
+        client = APIClient()
+
+        assert client.get(url('leaderboard', period='monthly')).status_code == status.HTTP_404_NOT_FOUND
+        assert client.get(url('category-leaderboard', slug='nope')).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_my_rank_with_neighbours(self, players):
+        client = APIClient()
+        client.force_authenticate(user=players[2])  # score 30, rank 3
+
+        response = client.get(url('leaderboard-me', period='all-time'), {'neighbours': 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert (response.data['rank'], response.data['score']) == (3, 30.0)
+        assert [row['username'] for row in response.data['entries']] == ['player4', 'player3', 'player2']
+
+    def test_my_rank_before_ranking(self, players):
+        newcomer = User.objects.create_user(email="new@example.com", username="new", password="pass12345")
+        client = APIClient()
+        client.force_authenticate(user=newcomer)
+
+        response = client.get(url('category-leaderboard-me', slug='science'))
+
+        assert response.data == {'rank': None, 'score': 0.0, 'quizzes': 0, 'entries': []}
+
+    def test_my_rank_requires_login(self, players):
+        assert APIClient().get(url('leaderboard-me', period='all-time')).status_code == status.HTTP_401_UNAUTHORIZED
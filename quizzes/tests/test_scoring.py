@@ -0,0 +1,156 @@
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from quizzes import scoring
+from quizzes.models import Category, Choice, Question, Quiz, TakenQuiz
+from quizzes.scoring import AnswerKey, get_answer_key, pack_choice_ids, unpack_choice_ids
+
+
+@pytest.fixture
+def quiz(db):
+    category = Category.objects.create(name="Geography", slug="geography")
+    quiz = Quiz.objects.create(title="Capitals", category=category)
+    for text in ("France?", "Spain?"):
+        question = Question.objects.create(quiz=quiz, text=text)
+        Choice.objects.create(question=question, text="Right", is_correct=True)
+        Choice.objects.create(question=question, text="Wrong", is_correct=False)
+    return quiz
+
+
+def choice_ids(quiz, is_correct):
+    return list(Choice.objects.filter(question__quiz=quiz, is_correct=is_correct).values_list('id', flat=True))
+
+
+@pytest.mark.django_db
+class TestAnswerKey:
+
+    def test_build(self, quiz):
+        key = AnswerKey.build(quiz.id)
+
+        assert key.correct_choice_ids == frozenset(choice_ids(quiz, True))
+        assert key.question_count == 2
+        assert set(key.choice_questions) == set(choice_ids(quiz, True) + choice_ids(quiz, False))
+
+    def test_each_question_counts_once(self, quiz):
+        key = AnswerKey.build(quiz.id)
+        first = choice_ids(quiz, True)[0]
+
+        assert key.count_correct([first, first, first]) == 1
+        assert key.score(1) == 50.0
+
+    def test_choices_of_other_quizzes_are_ignored(self, quiz):
+        other = Quiz.objects.create(title="Other")
+        question = Question.objects.create(quiz=other, text="?")
+        foreign = Choice.objects.create(question=question, text="Right", is_correct=True)
+
+        assert AnswerKey.build(quiz.id).count_correct([foreign.id, 10 ** 9]) == 0
+
+    def test_warm_key_needs_no_queries(self, quiz, django_assert_num_queries):
+        get_answer_key(quiz.id)
+
+        with django_assert_num_queries(0):
+            key = get_answer_key(quiz.id)
+        assert key.question_count == 2
+
+    def test_shared_cache_survives_a_cold_process(self, quiz, django_assert_num_queries):
+        get_answer_key(quiz.id)
+        scoring._local_keys.clear()
+
+        with django_assert_num_queries(0):
+            assert get_answer_key(quiz.id).question_count == 2
+
+    def test_choice_change_retires_the_key(self, quiz, django_capture_on_commit_callbacks):
+        wrong = Choice.objects.filter(question__quiz=quiz, is_correct=False).first()
+        assert wrong.id not in get_answer_key(quiz.id).correct_choice_ids
+
+        with django_capture_on_commit_callbacks(execute=True):
+            wrong.is_correct = True
+            wrong.save()
+
+        assert wrong.id in get_answer_key(quiz.id).correct_choice_ids
+
+    def test_new_question_retires_the_key(self, quiz, django_capture_on_commit_callbacks):
+        get_answer_key(quiz.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Question.objects.create(quiz=quiz, text="Italy?")
+
+        assert get_answer_key(quiz.id).question_count == 3
+
+    def test_packed_choice_ids_round_trip(self):
+        packed = pack_choice_ids([7, 3, 2 ** 40, 3])
+
+        assert len(packed) == 24
+        assert unpack_choice_ids(packed) == [3, 7, 2 ** 40]
+        assert unpack_choice_ids(memoryview(packed)) == [3, 7, 2 ** 40]
+        assert unpack_choice_ids(None) == []
+
+
+@pytest.mark.django_db
+class TestSubmitWithAnswerKey:
+
+    @pytest.fixture
+    def client(self):
+        user = User.objects.create_user(email="scorer@example.com", username="scorer", password="pass12345")
+        client = APIClient()
+        client.force_authenticate(user=user)
+        client.user = user
+        return client
+
+    def submit(self, client, quiz, answers):
+        attempt = TakenQuiz.objects.create(user=client.user, quiz=quiz, started_at=timezone.now())
+        return client.post(
+            reverse('quiz-submit', kwargs={'version': 'v1'}),
+            {"attempt_id": attempt.id, "answers": answers},
+            format='json',
+        )
+
+    def test_duplicate_answers_do_not_inflate_score(self, client, quiz):
+        first = choice_ids(quiz, True)[0]
+
+        response = self.submit(client, quiz, [first, first])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['correct_answers'] == 1
+        assert response.data['score'] == 50.0
+
+    def test_non_integer_answers_are_rejected(self, client, quiz):
+        response = self.submit(client, quiz, ["1", [2]])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == "answers must be a list of choice IDs"
+
+    def test_review_rebuilds_each_question(self, client, quiz):
+        right, wrong = choice_ids(quiz, True), choice_ids(quiz, False)
+        attempt_id = self.submit(client, quiz, [right[0], wrong[1]]).data['id']
+        url = reverse('attempt-review', kwargs={'version': 'v1', 'pk': attempt_id})
+
+        response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['score'] == 50.0
+        assert [
+            (q['chosen_choice_ids'], q['correct_choice_ids'], q['is_correct']) for q in response.data['questions']
+        ] == [([right[0]], [right[0]], True), ([wrong[1]], [right[1]], False)]
+
+    def test_warm_review_takes_one_query(self, client, quiz, django_assert_num_queries):
+        attempt_id = self.submit(client, quiz, choice_ids(quiz, True)).data['id']
+        url = reverse('attempt-review', kwargs={'version': 'v1', 'pk': attempt_id})
+
+        with django_assert_num_queries(1):
+            assert client.get(url).data['correct_answers'] == 2
+
+    def test_ongoing_and_foreign_attempts_cannot_be_reviewed(self, client, quiz):
+        ongoing = TakenQuiz.objects.create(user=client.user, quiz=quiz, started_at=timezone.now())
+        other = User.objects.create_user(email="other@example.com", username="other")
+        foreign = TakenQuiz.objects.create(user=other, quiz=quiz, started_at=timezone.now(), score=100.0)
+
+        def review(attempt):
+            return client.get(reverse('attempt-review', kwargs={'version': 'v1', 'pk': attempt.id}))
+
+        assert review(ongoing).status_code == status.HTTP_400_BAD_REQUEST
+        assert review(foreign).status_code == status.HTTP_404_NOT_FOUND
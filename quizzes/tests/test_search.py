@@ -0,0 +1,87 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from quizzes.models import Category, Quiz
+from quizzes.search import SQLiteSearchBackend, get_search_backend
+
+@pytest.mark.django_db
+class TestQuizSearch:
+
+    @pytest.fixture
+    def api_client(self):
+        from rest_framework.test import APIClient
+        return APIClient()
+
+    def search(self, api_client, query):
+        url = reverse('quiz-list', kwargs={'version': 'v1'})
+        response = api_client.get(url, {'search': query})
+        assert response.status_code == 200
+        return [quiz['title'] for quiz in response.data['results']]
+
+    def test_title_matches_rank_above_description_matches(self, api_client):
+        """Quizzes matching in the title come before description-only matches."""
+        Quiz.objects.create(title="Cooking basics", description="Includes a little volcano chemistry")
+        Quiz.objects.create(title="Volcanoes", description="Lava and ash")
+
+        assert self.search(api_client, "volcano") == ["Volcanoes", "Cooking basics"]
+
+    def test_matches_category_name(self, api_client):
+        """The category name is part of the searchable document."""
+        category = Category.objects.create(name="Astronomy", slug="astronomy")
+        Quiz.objects.create(title="Planets", description="Orbits", category=category)
+
+        assert self.search(api_client, "astronomy") == ["Planets"]
+
+    def test_index_follows_updates_and_deletes(self, api_client):
+        """Signals keep the index in sync with quiz and category changes."""
+        category = Category.objects.create(name="History", slug="history")
+        quiz = Quiz.objects.create(title="Romans", description="Empire", category=category)
+
+        quiz.title = "Byzantium"
+        quiz.save()
+        assert self.search(api_client, "romans") == []
+        assert self.search(api_client, "byzantium") == ["Byzantium"]
+
+        category.name = "Antiquity"
+        category.save()
+        assert self.search(api_client, "antiquity") == ["Byzantium"]
+
+        quiz.delete()
+        assert self.search(api_client, "byzantium") == []
+
+    def test_inactive_quizzes_are_excluded(self, api_client):
+        Quiz.objects.create(title="Hidden volcano", description="", is_active=False)
+        assert self.search(api_client, "volcano") == []
+
+    def test_filters_apply_before_the_result_limit(self, api_client, settings):
+        """Better-ranked matches the queryset excludes don't use up the limit."""
+        settings.QUIZ_SEARCH_MAX_RESULTS = 2
+        geology = Category.objects.create(name="Geology", slug="geology")
+        for i in range(3):
+            Quiz.objects.create(title=f"Volcano {i}", description="", is_active=False)
+            Quiz.objects.create(title=f"Volcano trivia {i}", description="")
+        Quiz.objects.create(title="Rocks", description="Some volcano facts", category=geology)
+
+        assert self.search(api_client, "volcano") == ["Volcano trivia 0", "Volcano trivia 1"]
+        url = reverse('quiz-list', kwargs={'version': 'v1'})
+        response = api_client.get(url, {'search': "volcano", 'category': "geology"})
+        assert [quiz['title'] for quiz in response.data['results']] == ["Rocks"]
+
+    def test_fts_syntax_is_escaped(self, api_client):
+        """Operators in user input are treated as plain words."""
+        Quiz.objects.create(title="Rock music", description="")
+        assert SQLiteSearchBackend.to_match_expression('rock AND "roll') == '"rock" "AND" "roll"*'
+        assert self.search(api_client, 'rock" (') == ["Rock music"]
+        assert self.search(api_client, '*') == []
+
+    def test_rebuild_command_restores_index(self):
+        quiz = Quiz.objects.create(title="Glaciers", description="Ice")
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM quizzes_quiz_fts")
+
+        backend = get_search_backend()
+        assert not backend.search(Quiz.objects.all(), "glaciers").exists()
+
+        call_command('rebuild_search_index', stdout=None)
+        assert list(backend.search(Quiz.objects.all(), "glaciers")) == [quiz]
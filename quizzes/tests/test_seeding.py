@@ -0,0 +1,98 @@
+import io
+from collections import Counter
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from accounts.models import Profile, User
+from quizzes.models import Category, Choice, Question, Quiz, TakenQuiz
+from quizzes.scoring import get_answer_key, unpack_choice_ids
+from quizzes.seeding import SeedError, insert_rows, seed_dataset
+
+
+def snapshot():
+    """The seeded attempts, by user and quiz index rather than database ID."""
+    users = {user_id: i for i, user_id in enumerate(User.objects.order_by('id').values_list('id', flat=True))}
+    quizzes = {quiz_id: i for i, quiz_id in enumerate(Quiz.objects.order_by('id').values_list('id', flat=True))}
+    return sorted(
+        (users[user_id], quizzes[quiz_id], score, duration)
+        for user_id, quiz_id, score, duration in TakenQuiz.objects.values_list('user_id', 'quiz_id', 'score', 'duration')
+    )
+
+
+@pytest.mark.django_db
+class TestSeedDataset:
+    def test_creates_requested_sizes(self):
+        counts = seed_dataset(users=30, quizzes=5, attempts=200, questions=6, choices=3, categories=2, seed=1)
+
+        assert counts == {'users': 30, 'quizzes': 5, 'attempts': 200}
+        assert User.objects.count() == 30
+        # Profiles are created alongside, since the signal does not fire.
+        assert Profile.objects.count() == 30
+        assert Question.objects.count() == 5 * 6
+        assert Choice.objects.count() == 5 * 6 * 3
+        assert Choice.objects.filter(is_correct=True).count() == 5 * 6
+        assert TakenQuiz.objects.count() == 200
+
+    def test_users_get_an_unusable_password(self):
+        seed_dataset(users=3, quizzes=0, attempts=0)
+        assert not any(user.has_usable_password() for user in User.objects.all())
+
+    def test_attempts_store_answers_matching_their_score(self):
+        seed_dataset(users=10, quizzes=3, attempts=50, questions=5, unfinished=0, seed=2)
+
+        for attempt in TakenQuiz.objects.all():
+            answer_key = get_answer_key(attempt.quiz_id)
+            choice_ids = unpack_choice_ids(attempt.choice_ids)
+            assert len(choice_ids) == 5
+            assert answer_key.count_correct(choice_ids) == attempt.correct_answers
+            assert attempt.score == answer_key.score(attempt.correct_answers)
+            assert attempt.completed_at == attempt.started_at + attempt.duration
+
+    def test_unfinished_attempts_are_unscored(self):
+        seed_dataset(users=5, quizzes=2, attempts=40, unfinished=1)
+        assert not TakenQuiz.objects.filter(score__isnull=False).exists()
+
+    def test_popularity_is_skewed(self):
+        seed_dataset(users=50, quizzes=20, attempts=2_000, questions=2, quiz_skew=1.5, seed=3)
+
+        counts = sorted(Counter(TakenQuiz.objects.values_list('quiz_id', flat=True)).values(), reverse=True)
+        assert counts[0] > 5 * 2_000 / 20
+
+    def test_same_seed_gives_same_dataset(self):
+        seed_dataset(users=20, quizzes=4, attempts=100, questions=3, seed=7)
+        first = snapshot()
+        User.objects.all().delete()
+        Quiz.objects.all().delete()
+        Category.objects.all().delete()
+
+        seed_dataset(users=20, quizzes=4, attempts=100, questions=3, seed=7)
+        assert snapshot() == first
+
+    def test_reused_seed_is_rejected(self):
+        seed_dataset(users=2, quizzes=1, attempts=0, seed=5)
+        with pytest.raises(SeedError):
+            seed_dataset(users=2, quizzes=0, attempts=0, seed=5)
+        with pytest.raises(SeedError):
+            seed_dataset(users=0, quizzes=1, attempts=0, seed=5)
+
+    def test_insert_rows_keeps_given_completed_at(self):
+        seed_dataset(users=1, quizzes=1, attempts=0, questions=1)
+        user, quiz = User.objects.get(), Quiz.objects.get()
+        started = TakenQuiz._meta.get_field('started_at').to_python("2024-01-01T10:00:00+00:00")
+
+        insert_rows(TakenQuiz, ('user_id', 'quiz_id', 'started_at', 'completed_at'), [(user.id, quiz.id, started, started)])
+        assert TakenQuiz.objects.get().completed_at == started
+
+
+@pytest.mark.django_db
+class TestSeedDatasetCommand:
+    def test_reports_counts(self):
+        out = io.StringIO()
+        call_command('seed_dataset', users=10, quizzes=2, attempts=30, questions=2, stdout=out)
+        assert "Seeded 10 users, 2 quizzes and 30 attempts." in out.getvalue()
+        assert TakenQuiz.objects.count() == 30
+
+    def test_invalid_sizes_raise_command_error(self):
+        with pytest.raises(CommandError):
+            call_command('seed_dataset', users=0, quizzes=2, attempts=30, stdout=io.StringIO())
@@ -38,6 +38,19 @@ class TestQuizzesSerializers:
         assert data['category_name'] == "Math"
         assert data['question_count'] == 2
 
+    def test_annotated_counts_skip_count_queries(self, django_assert_num_queries):
+        """Counts annotated on the queryset are read without extra queries."""
+        category = Category.objects.create(name="Art", slug="art")
+        quiz = Quiz.objects.create(title="Painters", category=category)
+        Question.objects.create(quiz=quiz, text="Q1")
+
+        category = Category.objects.with_quiz_count().get(pk=category.pk)
+        quiz = Quiz.objects.select_related('category').with_question_count().get(pk=quiz.pk)
+
+        with django_assert_num_queries(0):
+            assert CategorySerializer(category).data['quiz_count'] == 1
+            assert QuizSerializer(quiz).data['question_count'] == 1
+
     def test_question_serializer(self):
         """Test QuestionSerializer with nested choices."""
         category = Category.objects.create(name="History", slug="history")
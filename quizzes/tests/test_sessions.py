@@ -0,0 +1,178 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from quizzes.models import Choice, Question, Quiz, TakenQuiz
+from quizzes.scoring import unpack_choice_ids
+from quizzes.sessions import FLUSH_EVERY, AttemptSession
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(email="autosave@example.com", username="autosave")
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def quiz(db):
+    """A three-question quiz; returns it with its correct and wrong choice IDs."""
+    quiz = Quiz.objects.create(title="Chemistry", time_limit_minutes=10)
+    correct, wrong = [], []
+    for i in range(3):
+        question = Question.objects.create(quiz=quiz, text=f"Question {i}", order=i)
+        correct.append(Choice.objects.create(question=question, text="Right", is_correct=True).id)
+        wrong.append(Choice.objects.create(question=question, text="Wrong", is_correct=False).id)
+    return quiz, correct, wrong
+
+
+def start(client, quiz):
+    return client.post(reverse('quiz-start', kwargs={'pk': quiz.id, 'version': 'v1'})).data['attempt_id']
+
+
+def autosave(client, attempt_id, answers):
+    url = reverse('attempt-answers', kwargs={'pk': attempt_id, 'version': 'v1'})
+    return client.patch(url, {"answers": answers}, format='json')
+
+
+def submit(client, attempt_id, answers=()):
+    url = reverse('quiz-submit', kwargs={'version': 'v1'})
+    return client.post(url, {"attempt_id": attempt_id, "answers": list(answers)}, format='json')
+
+
+@pytest.mark.django_db
+class TestAutosave:
+
+    def test_submit_scores_autosaved_answers(self, client, quiz):
+        quiz, correct, wrong = quiz
+        attempt_id = start(client, quiz)
+
+        assert autosave(client, attempt_id, correct[:2]).data == {"attempt_id": attempt_id, "saved": 2}
+        response = submit(client, attempt_id)
+
+        assert response.data['correct_answers'] == 2
+        assert unpack_choice_ids(TakenQuiz.objects.get(pk=attempt_id).choice_ids) == correct[:2]
+
+    def test_later_answers_replace_earlier_ones(self, client, quiz):
+        quiz, correct, wrong = quiz
+        attempt_id = start(client, quiz)
+
+        autosave(client, attempt_id, wrong)
+        autosave(client, attempt_id, [correct[0]])
+        response = submit(client, attempt_id, [correct[1]])
+
+        assert response.data['correct_answers'] == 2
+        assert unpack_choice_ids(TakenQuiz.objects.get(pk=attempt_id).choice_ids) == [*correct[:2], wrong[2]]
+
+    def test_warm_autosave_needs_no_queries(self, client, quiz):
+        quiz, correct, wrong = quiz
+        attempt_id = start(client, quiz)
+        autosave(client, attempt_id, [wrong[0]])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = autosave(client, attempt_id, [correct[0]])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 0
+
+    def test_answers_are_flushed_to_the_database(self, client, quiz):
+        quiz, correct, wrong = quiz
+        attempt_id = start(client, quiz)
+
+        for _ in range(FLUSH_EVERY):
+            autosave(client, attempt_id, [correct[0]])
+
+        assert unpack_choice_ids(TakenQuiz.objects.get(pk=attempt_id).choice_ids) == [correct[0]]
+
+    def test_flushed_answers_survive_a_cache_loss(self, client, quiz):
+        quiz, correct, wrong = quiz
+        attempt_id = start(client, quiz)
+        for _ in range(FLUSH_EVERY):
+            autosave(client, attempt_id, [correct[0]])
+
+        cache.clear()
+        response = submit(client, attempt_id, [correct[1]])
+
+        assert response.data['correct_answers'] == 2
+
+    def test_session_is_cleared_on_submit(self, client, quiz):
+        quiz, correct, wrong = quiz
+        attempt_id = start(client, quiz)
+        autosave(client, attempt_id, correct)
+        submit(client, attempt_id)
+
+        session = AttemptSession.load(attempt_id)
+        assert session.submitted
+        assert session.answers({Choice.objects.get(pk=correct[0]).question_id}) == {}
+        assert autosave(client, attempt_id, correct).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_submitted_session_stays_cached(self, client, quiz):
+        quiz, correct, wrong = quiz
+        attempt_id = start(client, quiz)
+        submit(client, attempt_id, correct)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert AttemptSession.load(attempt_id).submitted
+        assert len(queries) == 0
+
+    def test_empty_list_clears_a_question(self, client, quiz):
+        quiz, correct, wrong = quiz
+        question_id = Choice.objects.get(pk=correct[0]).question_id
+        attempt_id = start(client, quiz)
+        # Flushed to the database as well as cached.
+        for _ in range(FLUSH_EVERY):
+            autosave(client, attempt_id, correct[:2])
+
+        response = autosave(client, attempt_id, {str(question_id): []})
+
+        assert response.data['saved'] == 1
+        assert submit(client, attempt_id).data['correct_answers'] == 1
+
+    def test_answers_by_question(self, client, quiz):
+        quiz, correct, wrong = quiz
+        questions = [Choice.objects.get(pk=choice_id).question_id for choice_id in correct]
+        attempt_id = start(client, quiz)
+
+        # Choices of other questions and unknown questions are dropped.
+        response = autosave(client, attempt_id, {
+            str(questions[0]): [correct[0]], str(questions[1]): [correct[2]], "999999": [correct[1]],
+        })
+
+        assert response.data['saved'] == 2
+        assert submit(client, attempt_id).data['correct_answers'] == 1
+
+    def test_other_users_attempts_are_not_found(self, client, quiz):
+        quiz, correct, wrong = quiz
+        other = User.objects.create_user(email="other@example.com", username="other")
+        attempt = TakenQuiz.objects.create(user=other, quiz=quiz, started_at=timezone.now())
+
+        assert autosave(client, attempt.id, correct).status_code == status.HTTP_404_NOT_FOUND
+        assert autosave(client, attempt.id + 1000, correct).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_time_limit_is_enforced(self, client, user, quiz):
+        quiz, correct, wrong = quiz
+        attempt = TakenQuiz.objects.create(user=user, quiz=quiz, started_at=timezone.now() - timedelta(minutes=11))
+
+        assert autosave(client, attempt.id, correct).status_code == status.HTTP_403_FORBIDDEN
+
+    def test_answers_must_be_choice_ids(self, client, quiz):
+        quiz, correct, wrong = quiz
+        attempt_id = start(client, quiz)
+
+        assert autosave(client, attempt_id, "1,2").status_code == status.HTTP_400_BAD_REQUEST
+        assert autosave(client, attempt_id, ["1"]).status_code == status.HTTP_400_BAD_REQUEST
+        assert autosave(client, attempt_id, {"first": [1]}).status_code == status.HTTP_400_BAD_REQUEST
+        assert autosave(client, attempt_id, {"1": 1}).status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,123 @@
+import json
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from quizzes.models import Category, Choice, Question, Quiz, TakenQuiz
+from quizzes.serializers import QuizDetailSerializer
+from quizzes.shuffle import render_quiz, shuffle_payload
+
+
+@pytest.fixture
+def quiz(db):
+    category = Category.objects.create(name="Science", slug="science")
+    quiz = Quiz.objects.create(title="Physics \"basics\" — ünits", category=category)
+    for i in range(6):
+        question = Question.objects.create(quiz=quiz, text=f"Question {i}, [really]?", order=i)
+        for j in range(4):
+            Choice.objects.create(question=question, text=f"Choice {i}.{j} {{x}}", is_correct=j == 0)
+    Question.objects.create(quiz=quiz, text="No choices yet", order=6)
+    return quiz
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(email="shuffle@example.com", username="shuffle")
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def canonical(quiz):
+    return QuizDetailSerializer(quiz).data
+
+
+def order(payload):
+    return [(q['id'], [c['id'] for c in q['choices']]) for q in json.loads(payload)['questions']]
+
+
+def detail(client, quiz, attempt_id=None):
+    url = reverse('quiz-detail', kwargs={'pk': quiz.id, 'version': 'v1'})
+    return client.get(url, {'attempt': attempt_id} if attempt_id is not None else {})
+
+
+@pytest.mark.django_db
+class TestShufflePayload:
+
+    def test_render_matches_json_renderer(self, quiz):
+        data = canonical(quiz)
+        payload, _ = render_quiz(data)
+
+        assert payload == JSONRenderer().render(data)
+
+    def test_same_seed_same_order(self, quiz):
+        payload, layout = render_quiz(canonical(quiz))
+
+        assert shuffle_payload(payload, layout, 7) == shuffle_payload(payload, layout, 7)
+        assert order(shuffle_payload(payload, layout, 7)) != order(shuffle_payload(payload, layout, 8))
+
+    def test_shuffle_only_reorders(self, quiz):
+        data = canonical(quiz)
+        payload, layout = render_quiz(data)
+        shuffled = json.loads(shuffle_payload(payload, layout, 42))
+
+        by_id = {question['id']: question for question in shuffled['questions']}
+        assert {key: value for key, value in shuffled.items() if key != 'questions'} == \
+            {key: value for key, value in json.loads(payload).items() if key != 'questions'}
+        for question in json.loads(payload)['questions']:
+            moved = by_id[question['id']]
+            assert moved['text'] == question['text']
+            assert sorted(moved['choices'], key=lambda c: c['id']) == question['choices']
+
+
+@pytest.mark.django_db
+class TestAttemptOrder:
+
+    def start(self, client, quiz):
+        return client.post(reverse('quiz-start', kwargs={'pk': quiz.id, 'version': 'v1'})).data['attempt_id']
+
+    def test_attempt_order_is_stable(self, client, quiz):
+        attempt_id = self.start(client, quiz)
+        first = detail(client, quiz, attempt_id)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert TakenQuiz.objects.get(pk=attempt_id).shuffle_seed is not None
+        assert detail(client, quiz, attempt_id).content == first.content
+        assert order(first.content) != order(detail(client, quiz).content)
+
+    def test_shuffled_hit_skips_database(self, client, quiz, django_assert_num_queries):
+        attempt_id = self.start(client, quiz)
+        detail(client, quiz, attempt_id)
+
+        with django_assert_num_queries(0):
+            detail(client, quiz, attempt_id)
+
+    def test_attempt_order_survives_a_cache_loss(self, client, quiz):
+        attempt_id = self.start(client, quiz)
+        first = detail(client, quiz, attempt_id).content
+        cache.clear()
+
+        assert detail(client, quiz, attempt_id).content == first
+
+    def test_legacy_attempts_keep_canonical_order(self, client, user, quiz):
+        attempt = TakenQuiz.objects.create(user=user, quiz=quiz, started_at=quiz.created_at)
+
+        assert detail(client, quiz, attempt.id).content == detail(client, quiz).content
+
+    def test_foreign_attempts_are_not_found(self, client, quiz):
+        other = User.objects.create_user(email="other@example.com", username="other")
+        attempt = TakenQuiz.objects.create(user=other, quiz=quiz, started_at=quiz.created_at)
+        another_quiz = Quiz.objects.create(title="Other")
+
+        assert detail(client, quiz, attempt.id).status_code == status.HTTP_404_NOT_FOUND
+        assert detail(client, another_quiz, self.start(client, quiz)).status_code == status.HTTP_404_NOT_FOUND
+        assert detail(client, quiz, "abc").status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,127 @@
+import io
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import Profile, User
+from quizzes.models import Category, Quiz, TakenQuiz, UserCategoryStat
+from quizzes.stats import reconcile_stats
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(email="stats@example.com", username="stats", password="pass12345")
+
+
+@pytest.fixture
+def quizzes(db):
+    science = Category.objects.create(name="Science", slug="science")
+    history = Category.objects.create(name="History", slug="history")
+    return {
+        "science": Quiz.objects.create(title="Bio", category=science),
+        "history": Quiz.objects.create(title="Rome", category=history),
+        "loose": Quiz.objects.create(title="Misc"),
+    }
+
+
+def complete(user, quiz, score, minutes=1):
+    return TakenQuiz.objects.create(
+        user=user, quiz=quiz, score=score, started_at=timezone.now(), duration=timedelta(minutes=minutes)
+    )
+
+
+@pytest.mark.django_db
+class TestIncrementalStats:
+
+    def test_attempts_accumulate(self, user, quizzes):
+        complete(user, quizzes["science"], 40.0, minutes=2)
+        complete(user, quizzes["history"], 90.0, minutes=3)
+        complete(user, quizzes["history"], 70.0)
+
+        profile = Profile.objects.get(user=user)
+        assert profile.quizzes_taken == 3
+        assert profile.total_score == 200.0
+        assert profile.wins == 2
+        assert profile.win_rate == pytest.approx(200 / 3)
+        assert profile.time_played == timedelta(minutes=6)
+        assert profile.best_category == "History"
+        assert UserCategoryStat.objects.get(user=user, category__slug="history").attempts == 2
+
+    def test_level_from_running_total(self, user, quizzes):
+        complete(user, quizzes["science"], 499.0)
+        assert Profile.objects.get(user=user).level == 1
+
+        complete(user, quizzes["science"], 1.0)
+        assert Profile.objects.get(user=user).level == 2
+
+    def test_uncategorised_quiz_keeps_best_category(self, user, quizzes):
+        complete(user, quizzes["science"], 60.0)
+        complete(user, quizzes["loose"], 100.0)
+
+        profile = Profile.objects.get(user=user)
+        assert profile.quizzes_taken == 2
+        assert profile.best_category == "Science"
+
+    def test_attempt_is_recorded_once(self, user, quizzes):
+        attempt = TakenQuiz.objects.create(user=user, quiz=quizzes["science"], started_at=timezone.now())
+        attempt.score = 80.0
+        attempt.save()
+        attempt.save()
+        TakenQuiz.objects.get(pk=attempt.pk).save()
+
+        assert Profile.objects.get(user=user).quizzes_taken == 1
+
+    def test_cost_does_not_grow_with_history(self, user, quizzes):
+        def queries_for_one_more():
+            attempt = TakenQuiz.objects.create(user=user, quiz=quizzes["science"], started_at=timezone.now())
+            attempt.score = 75.0
+            with CaptureQueriesContext(connection) as queries:
+                attempt.save()
+            return [query["sql"] for query in queries.captured_queries]
+
+        complete(user, quizzes["science"], 50.0)
+        first = queries_for_one_more()
+        for _ in range(30):
+            complete(user, quizzes["history"], 50.0)
+
+        assert len(queries_for_one_more()) == len(first)
+        assert not any("SUM(" in sql or "COUNT(" in sql for sql in first)
+
+
+@pytest.mark.django_db
+class TestReconcileStats:
+
+    def test_corrects_drift(self, user, quizzes):
+        complete(user, quizzes["science"], 40.0)
+        kept = complete(user, quizzes["history"], 90.0)
+        # Admin deletions and queryset updates bypass the incremental path.
+        TakenQuiz.objects.exclude(pk=kept.pk).delete()
+        Profile.objects.filter(user=user).update(level=7)
+
+        assert reconcile_stats() == 1
+
+        profile = Profile.objects.get(user=user)
+        assert (profile.quizzes_taken, profile.total_score, profile.wins, profile.level) == (1, 90.0, 1, 1)
+        assert profile.best_category == "History"
+        assert list(UserCategoryStat.objects.values_list('category__slug', 'attempts')) == [("history", 1)]
+
+    def test_consistent_profiles_are_left_alone(self, user, quizzes):
+        complete(user, quizzes["science"], 40.0)
+        complete(user, quizzes["history"], 90.0)
+        User.objects.create_user(email="idle@example.com", username="idle", password="pass12345")
+
+        assert reconcile_stats(batch_size=1) == 0
+
+    def test_command(self, user, quizzes):
+        complete(user, quizzes["science"], 40.0)
+        Profile.objects.filter(user=user).update(quizzes_taken=5)
+        output = io.StringIO()
+
+        call_command('reconcile_profile_stats', '--user', str(user.id), stdout=output)
+
+        assert "Corrected 1 drifted profiles." in output.getvalue()
+        assert Profile.objects.get(user=user).quizzes_taken == 1
@@ -0,0 +1,125 @@
+import io
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from accounts.models import Profile, User
+from quizzes.models import Quiz, TakenQuiz
+from quizzes.streaks import reset_broken_streaks
+
+
+@pytest.fixture
+def quiz(db):
+    return Quiz.objects.create(title="Bio")
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(email="streak@example.com", username="streak")
+
+
+def complete(user, quiz, moment):
+    # completed_at is auto_now_add, so move the clock instead.
+    with patch('django.utils.timezone.now', return_value=moment):
+        return TakenQuiz.objects.create(user=user, quiz=quiz, score=10.0, started_at=moment)
+
+
+def utc(day, hour=12):
+    return datetime(2026, 3, day, hour, tzinfo=dt_timezone.utc)
+
+
+def streaks(user):
+    profile = Profile.objects.get(user=user)
+    return profile.current_streak, profile.highest_streak
+
+
+@pytest.mark.django_db
+class TestStreakTracking:
+
+    def test_consecutive_days_extend_the_streak(self, user, quiz):
+        for day in (1, 2, 3):
+            complete(user, quiz, utc(day))
+
+        assert streaks(user) == (3, 3)
+        assert Profile.objects.get(user=user).last_active_day == utc(3).date()
+
+    def test_same_day_counts_once(self, user, quiz):
+        complete(user, quiz, utc(1, hour=8))
+        complete(user, quiz, utc(1, hour=20))
+
+        assert streaks(user) == (1, 1)
+
+    def test_gap_restarts_and_keeps_the_best(self, user, quiz):
+        for day in (1, 2, 3, 6):
+            complete(user, quiz, utc(day))
+
+        assert streaks(user) == (1, 3)
+
+    def test_days_are_local_to_the_user(self, user, quiz):
+        User.objects.filter(pk=user.pk).update(timezone="Asia/Baku")  # UTC+4
+        user.refresh_from_db()
+
+        # 21:00 UTC on the 1st is already the 2nd in Baku.
+        complete(user, quiz, utc(1, hour=10))
+        complete(user, quiz, utc(1, hour=21))
+
+        assert streaks(user) == (2, 2)
+
+    def test_late_recorded_attempt_keeps_the_latest_day(self, user, quiz):
+        complete(user, quiz, utc(5))
+        complete(user, quiz, utc(4))
+
+        profile = Profile.objects.get(user=user)
+        assert (profile.current_streak, profile.last_active_day) == (1, utc(5).date())
+
+    def test_unknown_timezone_falls_back_to_utc(self, user):
+        user.timezone = "Mars/Olympus"
+
+        assert user.tzinfo.key == "UTC"
+
+
+@pytest.mark.django_db
+class TestResetBrokenStreaks:
+
+    def test_resets_only_lapsed_streaks(self, quiz):
+        active = User.objects.create_user(email="a@example.com", username="active")
+        lapsed = User.objects.create_user(email="l@example.com", username="lapsed")
+        complete(active, quiz, utc(9))
+        complete(lapsed, quiz, utc(7))
+        complete(lapsed, quiz, utc(8))
+
+        assert reset_broken_streaks(now=utc(10)) == 1
+        assert streaks(active) == (1, 1)
+        assert streaks(lapsed) == (0, 2)
+
+    def test_uses_each_users_local_yesterday(self, quiz):
+        baku = User.objects.create_user(email="b@example.com", username="baku", timezone="Asia/Baku")
+        london = User.objects.create_user(email="l@example.com", username="london", timezone="Europe/London")
+        complete(baku, quiz, utc(9))
+        complete(london, quiz, utc(9))
+
+        # 21:00 UTC on the 10th is the 11th in Baku, so the 9th is too long ago there.
+        reset_broken_streaks(now=utc(10, hour=21))
+
+        assert streaks(baku) == (0, 1)
+        assert streaks(london) == (1, 1)
+
+    def test_single_update(self, quiz, django_assert_max_num_queries):
+        for i, name in enumerate(("UTC", "Asia/Baku", "America/New_York")):
+            user = User.objects.create_user(email=f"u{i}@example.com", username=f"u{i}", timezone=name)
+            complete(user, quiz, utc(1))
+
+        with django_assert_max_num_queries(2):
+            assert reset_broken_streaks(now=utc(10)) == 3
+
+    def test_command(self, user, quiz):
+        complete(user, quiz, timezone.now() - timedelta(days=5))
+        output = io.StringIO()
+
+        call_command('reset_broken_streaks', stdout=output)
+
+        assert "Reset 1 broken streaks." in output.getvalue()
+        assert streaks(user) == (0, 1)
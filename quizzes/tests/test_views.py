@@ -1,10 +1,12 @@
+from unittest.mock import patch
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
 from django.utils import timezone
 from datetime import timedelta
-from quizzes.models import Category, Quiz, Question, Choice, TakenQuiz
-from accounts.models import User
+from quizzes.models import Category, Quiz, Question, Choice, TakenQuiz, UserCategoryStat
+from accounts.models import Profile, User
 
 @pytest.mark.django_db
 class TestQuizzesViews:
@@ -125,6 +127,23 @@ class TestQuizzesViews:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "already been submitted" in response.data['error']
 
+    def test_concurrent_submits_record_stats_once(self, api_client, test_user, setup_quiz):
+        """A second submit that loaded the attempt before the first saved it is refused."""
+        quiz, correct_ids, wrong_ids = setup_quiz
+        api_client.force_authenticate(user=test_user)
+        attempt = TakenQuiz.objects.create(user=test_user, quiz=quiz, started_at=timezone.now())
+        stale = TakenQuiz.objects.select_related('quiz', 'user').get(pk=attempt.pk)
+
+        submit_url = reverse('quiz-submit', kwargs={'version': 'v1'})
+        payload = {"attempt_id": attempt.id, "answers": correct_ids}
+        assert api_client.post(submit_url, payload, format='json').status_code == status.HTTP_200_OK
+        with patch('quizzes.views.generics.get_object_or_404', return_value=stale):
+            response = api_client.post(submit_url, payload, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Profile.objects.get(user=test_user).quizzes_taken == 1
+        assert UserCategoryStat.objects.get(user=test_user).attempts == 1
+
     def test_filter_quizzes_by_category(self, api_client, test_user):
         """Test filtering quiz list by category slug."""
         cat1 = Category.objects.create(name="History", slug="history")
@@ -137,10 +156,76 @@ class TestQuizzesViews:
         # Filter by history
         response = api_client.get(f"{url}?category=history")
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
-        assert response.data[0]['title'] == "WW2"
+        assert len(response.data['results']) == 1
+        assert response.data['results'][0]['title'] == "WW2"
         
         # Filter by math
         response = api_client.get(f"{url}?category=math")
-        assert len(response.data) == 1
-        assert response.data[0]['title'] == "Algebra"
+        assert len(response.data['results']) == 1
+        assert response.data['results'][0]['title'] == "Algebra"
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+
+    @pytest.fixture
+    def api_client(self):
+        from rest_framework.test import APIClient
+        return APIClient()
+
+    @pytest.fixture
+    def quiz(self):
+        category = Category.objects.create(name="Science", slug="science")
+        quiz = Quiz.objects.create(title="Biology Quiz", category=category)
+        Question.objects.create(quiz=quiz, text="What is a cell?")
+        return quiz
+
+    @pytest.mark.parametrize('name', ['category-list', 'quiz-list', 'quiz-detail'])
+    def test_not_modified_without_queries(self, api_client, quiz, name, django_assert_num_queries):
+        """A matching If-None-Match is answered with 304 before any query runs."""
+        kwargs = {'version': 'v1', **({'pk': quiz.id} if name == 'quiz-detail' else {})}
+        url = reverse(name, kwargs=kwargs)
+
+        first = api_client.get(url)
+        assert first.status_code == status.HTTP_200_OK
+        assert first['ETag'] and first['Last-Modified']
+
+        with django_assert_num_queries(0):
+            second = api_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second['ETag'] == first['ETag']
+        assert not second.content
+
+    def test_question_change_invalidates_quiz_list(self, api_client, quiz, django_capture_on_commit_callbacks):
+        url = reverse('quiz-list', kwargs={'version': 'v1'})
+        etag = api_client.get(url)['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Question.objects.create(quiz=quiz, text="What is DNA?")
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['question_count'] == 2
+
+    def test_changes_within_one_second_move_last_modified(self, api_client, quiz, monkeypatch,
+                                                            django_capture_on_commit_callbacks):
+        url = reverse('quiz-list', kwargs={'version': 'v1'})
+        monkeypatch.setattr('core.cache._now_us', lambda: 1_700_000_000_200_000)
+        with django_capture_on_commit_callbacks(execute=True):
+            Question.objects.create(quiz=quiz, text="What is DNA?")
+        last_modified = api_client.get(url)['Last-Modified']
+
+        monkeypatch.setattr('core.cache._now_us', lambda: 1_700_000_000_700_000)
+        with django_capture_on_commit_callbacks(execute=True):
+            Question.objects.create(quiz=quiz, text="What is RNA?")
+
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['question_count'] == 3
+
+    def test_etag_depends_on_query_string(self, api_client, quiz):
+        url = reverse('quiz-list', kwargs={'version': 'v1'})
+        etag = api_client.get(url)['ETag']
+
+        response = api_client.get(url, {'category': 'science'}, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
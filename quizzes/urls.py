@@ -2,7 +2,8 @@ from django.urls import path
 from .views import (
     CategoryListView, CategoryDetailView,
     QuizListView, QuizDetailView, QuizStartView,
-    TakenQuizListView, TakenQuizCreateView
+    AttemptAnswersView, AttemptReviewView, TakenQuizListView, TakenQuizCreateView, TakenQuizBatchCreateView,
+    LeaderboardView, LeaderboardRankView
 )
 
 urlpatterns = [
@@ -18,4 +19,13 @@ urlpatterns = [
     # History & Attempts
     path('history/', TakenQuizListView.as_view(), name='quiz-history'),
     path('submit/', TakenQuizCreateView.as_view(), name='quiz-submit'),
+    path('submit/batch/', TakenQuizBatchCreateView.as_view(), name='quiz-submit-batch'),
+    path('attempts/<int:pk>/answers/', AttemptAnswersView.as_view(), name='attempt-answers'),
+    path('attempts/<int:pk>/review/', AttemptReviewView.as_view(), name='attempt-review'),
+
+    # Leaderboards (period: all-time or weekly)
+    path('leaderboards/<str:period>/', LeaderboardView.as_view(), name='leaderboard'),
+    path('leaderboards/<str:period>/me/', LeaderboardRankView.as_view(), name='leaderboard-me'),
+    path('categories/<slug:slug>/leaderboard/', LeaderboardView.as_view(), name='category-leaderboard'),
+    path('categories/<slug:slug>/leaderboard/me/', LeaderboardRankView.as_view(), name='category-leaderboard-me'),
 ]
@@ -1,28 +1,51 @@
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from quizzes.models import Category, Quiz, TakenQuiz, Choice
+from quizzes.models import Category, Quiz, TakenQuiz, LeaderboardEntry
 from quizzes.serializers import (
     CategorySerializer, QuizSerializer, QuizDetailSerializer, 
-    TakenQuizSerializer
+    TakenQuizSerializer, LeaderboardEntrySerializer
 )
+from quizzes.cache import (
+    CATALOG_VERSION, QUIZ_LIST_VERSION,
+    get_quiz_payload, get_quiz_versions, set_quiz_payload
+)
+from quizzes.leaderboards import ALL_TIME, category_board, weekly_board
+from quizzes.scoring import get_answer_key, pack_choice_ids, unpack_choice_ids
+from quizzes.search import get_search_backend
+from quizzes.sessions import AttemptSession, last_saved_at
+from quizzes.shuffle import new_seed, render_quiz, shuffle_payload
+from quizzes.signals import quiz_completed
+from quizzes.stats import record_completed_attempts
+from core.cache import get_versions
+from core.conditional import ConditionalGetMixin
+from core.fast_serializers import ValuesListMixin, ValuesSerializer
+from core.pagination import KeysetPagination
 from core.permissions import IsAdminOrReadOnly, IsOwnerOnly
 
+from django.http import HttpResponse
 from django.utils import timezone
-from django.db import models
+from django.utils.dateparse import parse_datetime
+from django.db import models, transaction
+from django.db.models import Prefetch
 
 
 # --- Category Views ---
 
-class CategoryListView(generics.ListAPIView):
-    """List all quiz categories."""
-    queryset = Category.objects.all()
+class CategoryListView(ConditionalGetMixin, ValuesListMixin, generics.ListAPIView):
+    """List all quiz categories. Supports conditional GET."""
+    queryset = Category.objects.with_quiz_count()
     serializer_class = CategorySerializer
+    values_serializer = ValuesSerializer(CategorySerializer)
     permission_classes = [IsAdminOrReadOnly]
 
+    def get_validator_versions(self):
+        return get_versions(CATALOG_VERSION).values()
+
     @swagger_auto_schema(operation_summary="List all quiz categories")
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
@@ -30,7 +53,7 @@ class CategoryListView(generics.ListAPIView):
 
 class CategoryDetailView(generics.RetrieveAPIView):
     """Get category details by slug."""
-    queryset = Category.objects.all()
+    queryset = Category.objects.with_quiz_count()
     serializer_class = CategorySerializer
     permission_classes = [IsAdminOrReadOnly]
     lookup_field = 'slug'
@@ -42,13 +65,28 @@ class CategoryDetailView(generics.RetrieveAPIView):
 
 # --- Quiz Views ---
 
-class QuizListView(generics.ListAPIView):
-    """List all active quizzes. Supports filtering by category and search by title."""
+class QuizListView(ConditionalGetMixin, ValuesListMixin, generics.ListAPIView):
+    """
+    List all active quizzes. Supports filtering by category and ranked
+    full-text search over title, description and category.
+    Newest quizzes come first; search results are ordered by relevance.
+    Supports conditional GET.
+    """
     serializer_class = QuizSerializer
+    values_serializer = ValuesSerializer(QuizSerializer)
     permission_classes = [IsAdminOrReadOnly]
+    pagination_class = KeysetPagination
+
+    def get_validator_versions(self):
+        return get_versions(CATALOG_VERSION, QUIZ_LIST_VERSION).values()
+
+    def get_keyset_ordering(self):
+        if self.request.query_params.get('search'):
+            return ('-search_rank', 'id')
+        return ('-created_at', '-id')
 
     def get_queryset(self):
-        queryset = Quiz.objects.filter(is_active=True).select_related('category')
+        queryset = Quiz.objects.filter(is_active=True).select_related('category').with_question_count()
         
         # Category Filter
         category_slug = self.request.query_params.get('category')
@@ -58,7 +96,7 @@ class QuizListView(generics.ListAPIView):
         # Search functionality
         search_query = self.request.query_params.get('search')
         if search_query:
-            queryset = queryset.filter(title__icontains=search_query)
+            queryset = get_search_backend().search(queryset, search_query)
             
         return queryset
 
@@ -74,7 +112,7 @@ class QuizListView(generics.ListAPIView):
             openapi.Parameter(
                 'search', 
                 openapi.IN_QUERY, 
-                description="Search quizzes by title", 
+                description="Full-text search over title, description and category, best matches first", 
                 type=openapi.TYPE_STRING
             )
         ]
@@ -83,24 +121,145 @@ class QuizListView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
 
 
-class QuizDetailView(generics.RetrieveAPIView):
-    """Get full quiz details. Optimized with prefetch_related."""
-    queryset = Quiz.objects.filter(is_active=True).prefetch_related('questions__choices', 'category')
+class QuizDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
+    """
+    Get full quiz details. The rendered JSON is cached per quiz and keyed by
+    content versions, so a cache hit skips the ORM and the serializer.
+    With `?attempt=<id>`, questions and choices come in that attempt's
+    order, shuffled from the same cached payload. Supports conditional GET.
+    """
+    queryset = Quiz.objects.filter(is_active=True).prefetch_related(
+        'questions__choices',
+        Prefetch('category', queryset=Category.objects.with_quiz_count()),
+    )
     serializer_class = QuizDetailSerializer
     permission_classes = [IsAdminOrReadOnly]
 
-    @swagger_auto_schema(operation_summary="Get full quiz details")
+    def get_validator_versions(self):
+        return get_quiz_versions(self.kwargs['pk'])
+
+    def get_shuffle_seed(self, request, quiz_id):
+        """The seed of the attempt named by `?attempt=`, or None for canonical order."""
+        attempt_id = request.query_params.get('attempt')
+        if attempt_id is None:
+            return None
+        try:
+            session = AttemptSession.load(int(attempt_id))
+        except ValueError:
+            session = None
+        if session is None or session.user_id != request.user.id or session.quiz_id != quiz_id:
+            raise NotFound("Attempt not found.")
+        return session.shuffle_seed
+
+    def retrieve(self, request, *args, **kwargs):
+        quiz_id = self.kwargs['pk']
+        seed = self.get_shuffle_seed(request, quiz_id)
+        # Icon URLs are absolute, so the host is part of the cached content.
+        base_url = request.build_absolute_uri('/')
+        versions = get_quiz_versions(quiz_id)
+
+        rendered = get_quiz_payload(quiz_id, versions, base_url)
+        if rendered is None:
+            serializer = self.get_serializer(self.get_object())
+            rendered = render_quiz(serializer.data)
+            set_quiz_payload(quiz_id, versions, rendered, base_url)
+
+        payload, layout = rendered
+        if seed is not None:
+            payload = shuffle_payload(payload, layout, seed)
+        return HttpResponse(payload, content_type='application/json')
+
+    @swagger_auto_schema(
+        operation_summary="Get full quiz details",
+        manual_parameters=[
+            openapi.Parameter(
+                'attempt',
+                openapi.IN_QUERY,
+                description="ID of the user's attempt; orders questions and choices for that attempt",
+                type=openapi.TYPE_INTEGER
+            )
+        ]
+    )
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
 
 
 
+def time_limit_error(elapsed_time, time_limit_minutes):
+    """A 403 response if an attempt has run past its time limit, else None."""
+    time_limit_delta = timezone.timedelta(minutes=time_limit_minutes)
+
+    # Allow 30 seconds grace period for network latency
+    if elapsed_time > (time_limit_delta + timezone.timedelta(seconds=30)):
+        return Response({
+            "error": "Time limit exceeded.",
+            "elapsed_seconds": elapsed_time.total_seconds(),
+            "limit_seconds": time_limit_delta.total_seconds()
+        }, status=status.HTTP_403_FORBIDDEN)
+    return None
+
+
+def attempt_pk(attempt_id):
+    """An attempt ID given as an int or a string of digits, as an int; else None."""
+    if type(attempt_id) is int or (isinstance(attempt_id, str) and attempt_id.isdecimal()):
+        return int(attempt_id)
+    return None
+
+
+def choice_ids_error(choice_ids):
+    """A 400 response if submitted answers are not a list of choice IDs, else None."""
+    if not isinstance(choice_ids, list):
+        return Response({"error": "answers must be a list"}, status=status.HTTP_400_BAD_REQUEST)
+    if not all(type(choice_id) is int for choice_id in choice_ids):
+        return Response({"error": "answers must be a list of choice IDs"}, status=status.HTTP_400_BAD_REQUEST)
+    return None
+
+
+def answers_by_question_error(answers):
+    """A 400 response if answers are not {question ID: [choice IDs]}, else None."""
+    if not all(str(question_id).isdigit() for question_id in answers):
+        return Response({"error": "answers must be keyed by question ID"}, status=status.HTTP_400_BAD_REQUEST)
+    for choice_ids in answers.values():
+        answers_error = choice_ids_error(choice_ids)
+        if answers_error:
+            return answers_error
+    return None
+
+
+# What scoring an attempt writes (see score_attempt).
+SCORED_FIELDS = ('score', 'correct_answers', 'total_questions', 'completed_at', 'duration', 'choice_ids')
+
+
+def score_attempt(attempt, choice_ids, completed_at):
+    """
+    Score an attempt on its autosaved answers, replaced per question by
+    `choice_ids`, without saving it. Returns the session to clear once saved.
+    """
+    # Scored against the cached answer key: no queries once it is warm.
+    answer_key = get_answer_key(attempt.quiz_id)
+    session = AttemptSession.from_attempt(attempt)
+    saved = answer_key.group_by_question(unpack_choice_ids(attempt.choice_ids))
+    answers = session.answers(answer_key.question_ids(), saved=saved)
+    answers.update(answer_key.group_by_question(choice_ids))
+    chosen = [choice_id for question_choice_ids in answers.values() for choice_id in question_choice_ids]
+    correct_count = answer_key.count_correct(chosen)
+
+    attempt.score = answer_key.score(correct_count)
+    attempt.correct_answers = correct_count
+    attempt.total_questions = answer_key.question_count
+    attempt.completed_at = completed_at
+    attempt.duration = completed_at - attempt.started_at
+    attempt.choice_ids = pack_choice_ids(chosen)
+    return session
+
+
 class QuizStartView(APIView):
     """
     Initialize a quiz attempt. Records the start time in the DB.
     """
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = 'start'
 
     @swagger_auto_schema(
         operation_summary="Start a quiz session",
@@ -113,8 +272,10 @@ class QuizStartView(APIView):
         attempt = TakenQuiz.objects.create(
             user=request.user,
             quiz=quiz,
-            started_at=timezone.now()
+            started_at=timezone.now(),
+            shuffle_seed=new_seed()
         )
+        AttemptSession.from_attempt(attempt).store()
         
         return Response({
             "message": f"Quiz '{quiz.title}' started.",
@@ -124,13 +285,96 @@ class QuizStartView(APIView):
         }, status=status.HTTP_201_CREATED)
 
 
-class TakenQuizListView(generics.ListAPIView):
-    """List current user's quiz history."""
+class AttemptAnswersView(APIView):
+    """
+    Autosave answers of an ongoing attempt. Answers are kept in the attempt's
+    session (see quizzes.sessions) and scored on submit; saving a question
+    again replaces its earlier answer.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = 'autosave'
+
+    @swagger_auto_schema(
+        operation_summary="Autosave answers of an attempt",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['answers'],
+            properties={
+                'answers': openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(type=openapi.TYPE_INTEGER),
+                    description=(
+                        "Choice IDs; each replaces the saved answer to its question. Or an object "
+                        "{question ID: [choice IDs]}, where an empty list clears the question"
+                    )
+                )
+            }
+        )
+    )
+    def patch(self, request, pk, *args, **kwargs):
+        session = AttemptSession.load(pk)
+        if session is None or session.user_id != request.user.id:
+            raise NotFound("Attempt not found.")
+        if session.submitted:
+            return Response({"error": "This attempt has already been submitted."}, status=status.HTTP_400_BAD_REQUEST)
+
+        time_error = time_limit_error(timezone.now() - session.started_at, session.time_limit_minutes)
+        if time_error:
+            return time_error
+
+        answers = request.data.get('answers', [])
+        by_question = isinstance(answers, dict)
+        answers_error = answers_by_question_error(answers) if by_question else choice_ids_error(answers)
+        if answers_error:
+            return answers_error
+
+        answer_key = get_answer_key(session.quiz_id)
+        answers = answer_key.group_answers(answers) if by_question else answer_key.group_by_question(answers)
+        session.save_answers(answers)
+        return Response({"attempt_id": session.attempt_id, "saved": len(answers)})
+
+
+class AttemptReviewView(APIView):
+    """
+    Review a submitted attempt: per question, the chosen and correct choices
+    and whether it was answered correctly. Rebuilt from the attempt's packed
+    choice IDs and the quiz's current answer key, in one query once the key
+    is warm.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(operation_summary="Review a submitted attempt")
+    def get(self, request, pk, *args, **kwargs):
+        attempt = TakenQuiz.objects.filter(pk=pk, user=request.user).values(
+            'id', 'quiz_id', 'score', 'correct_answers', 'total_questions', 'choice_ids'
+        ).first()
+        if attempt is None:
+            raise NotFound("Attempt not found.")
+        # Reviewing an ongoing attempt would reveal the answers.
+        if attempt['score'] is None:
+            return Response({"error": "This attempt has not been submitted yet."}, status=status.HTTP_400_BAD_REQUEST)
+
+        answer_key = get_answer_key(attempt['quiz_id'])
+        return Response({
+            "attempt_id": attempt['id'],
+            "quiz_id": attempt['quiz_id'],
+            "score": attempt['score'],
+            "correct_answers": attempt['correct_answers'],
+            "total_questions": attempt['total_questions'],
+            "questions": answer_key.review(unpack_choice_ids(attempt['choice_ids'])),
+        })
+
+
+class TakenQuizListView(ValuesListMixin, generics.ListAPIView):
+    """List current user's quiz history, most recent first."""
     serializer_class = TakenQuizSerializer
+    values_serializer = ValuesSerializer(TakenQuizSerializer)
     permission_classes = [permissions.IsAuthenticated, IsOwnerOnly]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-completed_at', '-id')
 
     def get_queryset(self):
-        return TakenQuiz.objects.filter(user=self.request.user).select_related('quiz')
+        return TakenQuiz.objects.filter(user=self.request.user).select_related('quiz', 'user')
 
     @swagger_auto_schema(operation_summary="List current user's quiz history")
     def get(self, request, *args, **kwargs):
@@ -143,6 +387,7 @@ class TakenQuizCreateView(generics.CreateAPIView):
     """
     serializer_class = TakenQuizSerializer
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = 'submit'
 
     @swagger_auto_schema(
         operation_summary="Submit quiz results",
@@ -162,7 +407,9 @@ class TakenQuizCreateView(generics.CreateAPIView):
         if not attempt_id:
             return Response({"error": "attempt_id is required"}, status=status.HTTP_400_BAD_REQUEST)
             
-        attempt = generics.get_object_or_404(TakenQuiz, id=attempt_id, user=request.user)
+        attempt = generics.get_object_or_404(
+            TakenQuiz.objects.select_related('quiz', 'user'), id=attempt_id, user=request.user
+        )
         
         if attempt.score is not None:
             return Response({"error": "This attempt has already been submitted."}, status=status.HTTP_400_BAD_REQUEST)
@@ -170,44 +417,29 @@ class TakenQuizCreateView(generics.CreateAPIView):
         # 1. Time Validation
         now = timezone.now()
         elapsed_time = now - attempt.started_at
-        time_limit_delta = timezone.timedelta(minutes=attempt.quiz.time_limit_minutes)
-        
-        # Allow 30 seconds grace period for network latency
-        if elapsed_time > (time_limit_delta + timezone.timedelta(seconds=30)):
-            return Response({
-                "error": "Time limit exceeded.",
-                "elapsed_seconds": elapsed_time.total_seconds(),
-                "limit_seconds": time_limit_delta.total_seconds()
-            }, status=status.HTTP_403_FORBIDDEN)
+        time_error = time_limit_error(elapsed_time, attempt.quiz.time_limit_minutes)
+        if time_error:
+            return time_error
 
         # 2. Results Calculation
         user_answers_ids = request.data.get('answers', []) # List of Choice IDs
-        if not isinstance(user_answers_ids, list):
-            return Response({"error": "answers must be a list"}, status=status.HTTP_400_BAD_REQUEST)
-
-        # Get all correct choices for this quiz
-        correct_choices_ids = Choice.objects.filter(
-            question__quiz=attempt.quiz, 
-            is_correct=True
-        ).values_list('id', flat=True)
-
-        correct_count = 0
-        for choice_id in user_answers_ids:
-            if choice_id in correct_choices_ids:
-                correct_count += 1
-
-        total_questions = attempt.quiz.questions.count()
-        if total_questions > 0:
-            score_percentage = (correct_count / total_questions) * 100
-        else:
-            score_percentage = 0
-
-        attempt.score = round(score_percentage, 2)
-        attempt.correct_answers = correct_count
-        attempt.total_questions = total_questions
-        attempt.completed_at = now
-        attempt.duration = elapsed_time
-        attempt.save()
+        answers_error = choice_ids_error(user_answers_ids)
+        if answers_error:
+            return answers_error
+
+        session = score_attempt(attempt, user_answers_ids, now)
+        with transaction.atomic():
+            # Claim the attempt: of two concurrent submits only one updates the
+            # row, so statistics are recorded once.
+            claimed = TakenQuiz.objects.filter(pk=attempt.pk, score__isnull=True).update(
+                **{field: getattr(attempt, field) for field in SCORED_FIELDS}
+            )
+            if not claimed:
+                return Response({"error": "This attempt has already been submitted."}, status=status.HTTP_400_BAD_REQUEST)
+            record_completed_attempts([attempt])
+        attempt._was_scored = True
+        session.clear()
+        quiz_completed.send(sender=TakenQuiz, attempts=[attempt])
 
         return Response({
             "id": attempt.id,
@@ -216,3 +448,216 @@ class TakenQuizCreateView(generics.CreateAPIView):
             "total_questions": attempt.total_questions,
             "message": "Results calculated and saved successfully."
         }, status=status.HTTP_200_OK)
+
+
+class TakenQuizBatchCreateView(APIView):
+    """
+    Submit many attempts at once, e.g. queued by an offline client. Each item
+    is validated and scored like a single submit; items that fail are
+    reported and the rest are still saved. Scored attempts are written with
+    one bulk_update, and each user's statistics are updated once per batch.
+
+    A client-reported completed_at is only trusted as far as the server can
+    check it: it is moved up to the attempt's last autosave, and to at most
+    `max_offline` before the submit, before the time limit is applied.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = 'batch-submit'
+    max_items = 100
+    max_offline = timezone.timedelta(hours=24)
+
+    @swagger_auto_schema(
+        operation_summary="Submit many quiz results",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['attempts'],
+            properties={
+                'attempts': openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        required=['attempt_id'],
+                        properties={
+                            'attempt_id': openapi.Schema(type=openapi.TYPE_INTEGER),
+                            'answers': openapi.Schema(
+                                type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_INTEGER)
+                            ),
+                            'completed_at': openapi.Schema(
+                                type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME,
+                                description="When the attempt was finished offline (default: now). "
+                                            "No earlier than its last autosave, or 24 hours before the submit."
+                            ),
+                        }
+                    ),
+                    description="At most 100 attempts"
+                )
+            }
+        ),
+        responses={200: openapi.Response(description="Per-attempt results, in request order")}
+    )
+    def post(self, request, *args, **kwargs):
+        items = request.data.get('attempts')
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            return Response({"error": "attempts must be a list of objects"}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > self.max_items:
+            return Response(
+                {"error": f"At most {self.max_items} attempts can be submitted at once."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        now = timezone.now()
+        ids = {attempt_pk(item.get('attempt_id')) for item in items} - {None}
+        saved_at = last_saved_at(ids)
+        with transaction.atomic():
+            attempts = TakenQuiz.objects.select_related('quiz', 'user').select_for_update(of=('self',)).filter(
+                id__in=ids, user=request.user
+            ).in_bulk()
+            results, scored, sessions = [], [], []
+            for item in items:
+                attempt_id = item.get('attempt_id')
+                pk = attempt_pk(attempt_id)
+                attempt = attempts.get(pk)
+                response, session = self.score_item(item, attempt, now, saved_at.get(pk))
+                if session is not None:
+                    scored.append(attempt)
+                    sessions.append(session)
+                results.append({"attempt_id": attempt_id, "status": response.status_code, **response.data})
+
+            TakenQuiz.objects.bulk_update(scored, SCORED_FIELDS)
+            record_completed_attempts(scored)
+
+        for attempt in scored:
+            attempt._was_scored = True
+        for session in sessions:
+            session.clear()
+        if scored:
+            quiz_completed.send(sender=TakenQuiz, attempts=scored)
+
+        return Response({"submitted": len(scored), "results": results})
+
+    def score_item(self, item, attempt, now, saved_at=None):
+        """
+        Validate and score one item like TakenQuizCreateView. `saved_at` is
+        the server time of the attempt's last autosave, if any. Returns the
+        item's response, and the attempt's session if it was scored.
+        """
+        if attempt is None:
+            return Response({"error": "Attempt not found."}, status=status.HTTP_404_NOT_FOUND), None
+        # An attempt listed twice is scored by its first item.
+        if attempt.score is not None:
+            return Response(
+                {"error": "This attempt has already been submitted."}, status=status.HTTP_400_BAD_REQUEST
+            ), None
+
+        completed_at = now
+        if item.get('completed_at') is not None:
+            completed_at = parse_datetime(str(item['completed_at']))
+            if completed_at is None or timezone.is_naive(completed_at) \
+                    or not attempt.started_at <= completed_at <= now:
+                return Response(
+                    {"error": "completed_at must be a datetime with a timezone, between the start and now"},
+                    status=status.HTTP_400_BAD_REQUEST
+                ), None
+            # The client's clock can't vouch for itself: it was still answering at its last autosave.
+            completed_at = max(completed_at, saved_at or completed_at, now - self.max_offline)
+
+        time_error = time_limit_error(completed_at - attempt.started_at, attempt.quiz.time_limit_minutes)
+        if time_error:
+            return time_error, None
+
+        choice_ids = item.get('answers', [])
+        answers_error = choice_ids_error(choice_ids)
+        if answers_error:
+            return answers_error, None
+
+        session = score_attempt(attempt, choice_ids, completed_at)
+        return Response({
+            "id": attempt.id,
+            "score": attempt.score,
+            "correct_answers": attempt.correct_answers,
+            "total_questions": attempt.total_questions,
+        }), session
+
+
+# --- Leaderboard Views ---
+
+class LeaderboardMixin:
+    """Resolve the board named by the URL: a period, or a category slug."""
+
+    def get_board(self):
+        if 'slug' in self.kwargs:
+            category_id = Category.objects.filter(slug=self.kwargs['slug']).values_list('id', flat=True).first()
+            if category_id is None:
+                raise NotFound("Category not found.")
+            return category_board(category_id)
+
+        period = self.kwargs['period']
+        if period == 'all-time':
+            return ALL_TIME
+        if period == 'weekly':
+            return weekly_board()
+        raise NotFound("Unknown leaderboard period.")
+
+
+class LeaderboardView(LeaderboardMixin, ValuesListMixin, generics.ListAPIView):
+    """
+    Ranked leaderboard, best first. Ranks come from the periodic
+    refresh_leaderboards job; users appear once they have been ranked, and
+    scores completed since the last run (about a minute) are not reflected
+    in the order yet.
+    """
+    serializer_class = LeaderboardEntrySerializer
+    values_serializer = ValuesSerializer(LeaderboardEntrySerializer)
+    permission_classes = [permissions.AllowAny]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('rank',)
+
+    def get_queryset(self):
+        return LeaderboardEntry.objects.filter(board=self.get_board(), rank__isnull=False)
+
+    @swagger_auto_schema(operation_summary="List a leaderboard")
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+class LeaderboardRankView(LeaderboardMixin, APIView):
+    """
+    The current user's rank on a leaderboard, with the entries around it. The
+    score is live, but the rank is as of the last refresh_leaderboards run.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    values_serializer = ValuesSerializer(LeaderboardEntrySerializer)
+    default_neighbours = 5
+    max_neighbours = 25
+
+    @swagger_auto_schema(
+        operation_summary="Get my leaderboard rank",
+        manual_parameters=[
+            openapi.Parameter(
+                'neighbours',
+                openapi.IN_QUERY,
+                description="Entries to include above and below the user (max 25)",
+                type=openapi.TYPE_INTEGER
+            )
+        ]
+    )
+    def get(self, request, *args, **kwargs):
+        try:
+            neighbours = int(request.query_params.get('neighbours', self.default_neighbours))
+        except ValueError:
+            return Response({"error": "neighbours must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+        neighbours = max(0, min(neighbours, self.max_neighbours))
+
+        board = self.get_board()
+        entry = LeaderboardEntry.objects.filter(board=board, user=request.user).values(
+            'rank', 'score', 'quizzes'
+        ).first() or {'rank': None, 'score': 0.0, 'quizzes': 0}
+
+        entries = []
+        if entry['rank'] is not None:
+            rows = LeaderboardEntry.objects.filter(
+                board=board, rank__gte=entry['rank'] - neighbours, rank__lte=entry['rank'] + neighbours
+            ).order_by('rank').values(*self.values_serializer.lookups)
+            entries = self.values_serializer.serialize(rows, request)
+
+        return Response({**entry, "entries": entries})
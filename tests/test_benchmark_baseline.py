@@ -0,0 +1,108 @@
+"""
+Regression checks of benchmarks.baseline.
+"""
+import json
+
+import pytest
+
+from benchmarks.baseline import best_of, calibrate, check, compare, reference_label
+
+BASELINE = {"quiz-list, 1000": {"p50": 5.0, "p95": 8.0, "p99": 12.0, "queries": 1, "alloc_kib": 70.0}}
+
+
+class TestBestOf:
+    def test_keeps_best_round_and_median_spread(self):
+        rounds = [
+            {"p50": 5.0, "p95": 9.0, "p99": 20.0},
+            {"p50": 4.0, "p95": 8.0, "p99": 12.0},
+            {"p50": 6.0, "p95": 8.5, "p99": 14.0},
+        ]
+        metrics, spread = best_of(rounds)
+        assert metrics == {"p50": 4.0, "p95": 8.0, "p99": 12.0}
+        assert spread == {"p50": 1.0, "p95": 0.5, "p99": 2.0}
+
+
+class TestCalibrate:
+    def test_steady_label_keeps_threshold_and_noise_floors(self):
+        baseline = calibrate(BASELINE, {}, threshold=0.25)["quiz-list, 1000"]
+        assert baseline["p50"] == 5.0
+        assert baseline["tolerance"] == {"p50": 0.25, "p95": 0.25, "p99": 0.25, "alloc_kib": 0.25}
+        assert baseline["floor"] == {"p50": 0.5, "p95": 1.0, "p99": 2.0, "alloc_kib": 16.0}
+
+    def test_noisy_label_gets_slack_up_to_max_tolerance(self):
+        spreads = {"quiz-list, 1000": {"p50": 1.0, "p99": 10.0}}
+        baseline = calibrate(BASELINE, spreads, threshold=0.25)["quiz-list, 1000"]
+        assert baseline["tolerance"]["p50"] == pytest.approx(0.6)
+        assert baseline["floor"]["p50"] == 3.0
+        assert baseline["tolerance"]["p99"] == 1.0
+        assert baseline["floor"]["p99"] == 30.0
+
+
+class TestCompare:
+    def test_within_threshold_passes(self):
+        results = {"quiz-list, 1000": {"p50": 6.0, "p95": 9.0, "p99": 12.0, "queries": 1, "alloc_kib": 80.0}}
+        assert compare(results, BASELINE, threshold=0.25) == []
+
+    def test_growth_past_threshold_regresses(self):
+        results = {"quiz-list, 1000": {"p50": 7.0, "p95": 8.0, "p99": 12.0, "queries": 1, "alloc_kib": 70.0}}
+        assert compare(results, BASELINE, threshold=0.25) == ["quiz-list, 1000 p50: 7.000 (baseline 5.000)"]
+
+    def test_p99_is_gated(self):
+        results = {"quiz-list, 1000": {"p99": 20.0}}
+        assert compare(results, BASELINE, threshold=0.25) == ["quiz-list, 1000 p99: 20.000 (baseline 12.000)"]
+
+    def test_growth_below_noise_floor_passes(self):
+        baseline = {"public-profile, 1000": {"p50": 0.5}}
+        assert compare({"public-profile, 1000": {"p50": 0.9}}, baseline, threshold=0.25) == []
+
+    def test_calibrated_tolerance_and_floor_apply(self):
+        baseline = calibrate(BASELINE, {"quiz-list, 1000": {"p50": 1.0}}, threshold=0.25)
+        assert compare({"quiz-list, 1000": {"p50": 7.5}}, baseline, threshold=0.25) == []
+        assert compare({"quiz-list, 1000": {"p50": 8.5}}, baseline, threshold=0.25) == [
+            "quiz-list, 1000 p50: 8.500 (baseline 5.000)",
+        ]
+
+    def test_any_extra_query_regresses(self):
+        results = {"quiz-list, 1000": {"queries": 2}}
+        assert compare(results, BASELINE, threshold=10) == ["quiz-list, 1000 queries: 2.000 (baseline 1.000)"]
+
+    def test_unknown_labels_are_skipped(self):
+        assert compare({"new-endpoint, 1000": {"p50": 100.0}}, BASELINE) == []
+
+    def test_slower_reference_scales_latency_baselines(self):
+        baseline = {**BASELINE, "reference, 1000": {"p50": 1.0}}
+        results = {"quiz-list, 1000": {"p50": 9.0, "queries": 2}, "reference, 1000": {"p50": 2.0}}
+        # Twice as slow a machine allows twice the latency, but not an extra query.
+        assert compare(results, baseline, threshold=0.25) == ["quiz-list, 1000 queries: 2.000 (baseline 1.000)"]
+
+    def test_faster_reference_does_not_tighten_baselines(self):
+        baseline = {**BASELINE, "reference, 1000": {"p50": 2.0}}
+        results = {"quiz-list, 1000": {"p50": 6.0}, "reference, 1000": {"p50": 1.0}}
+        assert compare(results, baseline, threshold=0.25) == []
+
+    def test_reference_label_follows_group(self):
+        assert reference_label("quiz-list, 1000") == "reference, 1000"
+        assert reference_label("quiz-list") == "reference"
+
+
+class TestCheck:
+    def test_stores_missing_baseline_then_compares(self, tmp_path, monkeypatch):
+        path = tmp_path / "baseline.json"
+        monkeypatch.setenv("BENCH_BASELINE", str(path))
+        monkeypatch.setenv("BENCH_THRESHOLD", "0.1")
+
+        assert check("endpoints", BASELINE) == []
+        assert json.loads(path.read_text()) == {"endpoints": calibrate(BASELINE, {}, threshold=0.1)}
+        slower = {"quiz-list, 1000": {**BASELINE["quiz-list, 1000"], "p95": 10.0}}
+        assert check("endpoints", slower) == ["quiz-list, 1000 p95: 10.000 (baseline 8.000)"]
+
+    def test_update_replaces_baseline(self, tmp_path, monkeypatch):
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"endpoints": BASELINE}))
+        monkeypatch.setenv("BENCH_BASELINE", str(path))
+        monkeypatch.setenv("BENCH_UPDATE_BASELINE", "1")
+
+        slower = {"quiz-list, 1000": {"p50": 50.0}}
+        spreads = {"quiz-list, 1000": {"p50": 5.0}}
+        assert check("endpoints", slower, spreads) == []
+        assert json.loads(path.read_text())["endpoints"] == calibrate(slower, spreads, threshold=0.25)
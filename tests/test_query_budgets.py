@@ -0,0 +1,141 @@
+"""
+Per-endpoint query budgets.
+
+Every URL in quizzes/urls.py, accounts/urls.py and activities/urls.py must have an entry in
+ENDPOINTS. Each endpoint is exercised against a catalog large enough that a
+per-row query (N+1) blows the budget.
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Achievement, User, UserAchievement
+from accounts.urls import urlpatterns as accounts_urlpatterns
+from activities.models import Activity
+from activities.urls import urlpatterns as activities_urlpatterns
+from quizzes.achievements import sync_achievements
+from quizzes.leaderboards import refresh_ranks
+from quizzes.models import Category, Choice, Question, Quiz, TakenQuiz
+from quizzes.urls import urlpatterns as quizzes_urlpatterns
+
+ROWS = 6
+PASSWORD = "strong_password_123"
+
+
+@pytest.fixture
+def catalog(db):
+    """Seed ROWS categories, quizzes, questions, choices, attempts, badges, ranked players and activities."""
+    user = User.objects.create_user(email="budget@example.com", username="budget", password=PASSWORD)
+    sync_achievements()
+    categories = [Category.objects.create(name=f"Category {i}", slug=f"category-{i}") for i in range(ROWS)]
+    quizzes = [
+        Quiz.objects.create(title=f"Quiz {i}", description="", category=categories[i % ROWS])
+        for i in range(ROWS)
+    ]
+    for quiz in quizzes:
+        for q in range(ROWS):
+            question = Question.objects.create(quiz=quiz, text=f"Question {q}", order=q)
+            Choice.objects.create(question=question, text="Right", is_correct=True)
+            Choice.objects.create(question=question, text="Wrong", is_correct=False)
+        scored = TakenQuiz.objects.create(user=user, quiz=quiz, started_at=timezone.now(), score=50.0)
+    for i in range(ROWS):
+        achievement = Achievement.objects.create(name=f"Badge {i}", description="", badge_type="rare")
+        UserAchievement.objects.create(user=user, achievement=achievement)
+
+    for i in range(ROWS):
+        player = User.objects.create_user(email=f"player{i}@example.com", username=f"player{i}")
+        TakenQuiz.objects.create(user=player, quiz=quizzes[i], started_at=timezone.now(), score=10.0 * i)
+        Activity.objects.create(user=player, activity_type=Activity.ActivityType.LEVEL_UP, description="Level 2")
+        Activity.objects.create(user=user, activity_type=Activity.ActivityType.LEVEL_UP, description="Level 2")
+    refresh_ranks()
+
+    attempt = TakenQuiz.objects.create(user=user, quiz=quizzes[0], started_at=timezone.now())
+    return {
+        "user": user,
+        "quiz": quizzes[0],
+        "category": categories[0],
+        "attempt": attempt,
+        "scored": scored,
+        "refresh": str(RefreshToken.for_user(user)),
+    }
+
+
+def url(name, **kwargs):
+    return reverse(name, kwargs={"version": "v1", **kwargs})
+
+
+def authenticated(client, catalog):
+    client.force_authenticate(user=catalog["user"])
+    return client
+
+
+# name -> (max queries, request callable)
+ENDPOINTS = {
+    "category-list": (1, lambda client, catalog: client.get(url("category-list"))),
+    "category-detail": (1, lambda client, catalog: client.get(
+        url("category-detail", slug=catalog["category"].slug))),
+    "quiz-list": (1, lambda client, catalog: client.get(url("quiz-list"))),
+    "quiz-detail": (4, lambda client, catalog: client.get(url("quiz-detail", pk=catalog["quiz"].id))),
+    "quiz-start": (2, lambda client, catalog: authenticated(client, catalog).post(
+        url("quiz-start", pk=catalog["quiz"].id))),
+    "quiz-history": (1, lambda client, catalog: authenticated(client, catalog).get(url("quiz-history"))),
+    # Cold answer key (2 queries), O(1) incremental profile and leaderboard stats,
+    # and achievement rules: progress, existing awards, and the code map when cold.
+    # The claiming UPDATE and the statistics share one transaction (a savepoint here).
+    "quiz-submit": (15, lambda client, catalog: authenticated(client, catalog).post(
+        url("quiz-submit"), {"attempt_id": catalog["attempt"].id, "answers": []}, format="json")),
+    # As quiz-submit; the count does not grow with the batch.
+    "quiz-submit-batch": (15, lambda client, catalog: authenticated(client, catalog).post(
+        url("quiz-submit-batch"), {"attempts": [
+            {"attempt_id": catalog["attempt"].id, "answers": []}, {"attempt_id": 0, "answers": []},
+        ]}, format="json")),
+    # Cold session (1 query, re-stored in the cache) and cold answer key (2 queries).
+    "attempt-answers": (3, lambda client, catalog: authenticated(client, catalog).patch(
+        url("attempt-answers", pk=catalog["attempt"].id), {"answers": []}, format="json")),
+    # The attempt, then the cold answer key (2 queries).
+    "attempt-review": (3, lambda client, catalog: authenticated(client, catalog).get(
+        url("attempt-review", pk=catalog["scored"].id))),
+    "register": (6, lambda client, catalog: client.post(url("register"), {
+        "username": "newcomer", "email": "newcomer@example.com",
+        "password": PASSWORD, "password_confirm": PASSWORD})),
+    "login": (2, lambda client, catalog: client.post(url("login"), {
+        "email": catalog["user"].email, "password": PASSWORD})),
+    "token_refresh": (2, lambda client, catalog: client.post(url("token_refresh"), {
+        "refresh": catalog["refresh"]})),
+    "my-profile": (2, lambda client, catalog: authenticated(client, catalog).get(url("my-profile"))),
+    "public-profile": (2, lambda client, catalog: client.get(
+        url("public-profile", username=catalog["user"].username))),
+    "achievement-list": (1, lambda client, catalog: client.get(url("achievement-list"))),
+    "leaderboard": (1, lambda client, catalog: client.get(url("leaderboard", period="all-time"))),
+    "leaderboard-me": (2, lambda client, catalog: authenticated(client, catalog).get(
+        url("leaderboard-me", period="weekly"))),
+    "category-leaderboard": (2, lambda client, catalog: client.get(
+        url("category-leaderboard", slug=catalog["category"].slug))),
+    "category-leaderboard-me": (3, lambda client, catalog: authenticated(client, catalog).get(
+        url("category-leaderboard-me", slug=catalog["category"].slug))),
+    "activity-feed": (1, lambda client, catalog: client.get(url("activity-feed"))),
+    "my-activity-feed": (1, lambda client, catalog: authenticated(client, catalog).get(url("my-activity-feed"))),
+}
+
+
+def test_every_endpoint_has_a_budget():
+    """New URLs must declare a query budget here."""
+    names = {pattern.name for pattern in quizzes_urlpatterns + accounts_urlpatterns + activities_urlpatterns}
+    assert names == set(ENDPOINTS)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", sorted(ENDPOINTS))
+def test_endpoint_query_budget(name, catalog):
+    budget, call = ENDPOINTS[name]
+    client = APIClient()
+
+    with CaptureQueriesContext(connection) as queries:
+        response = call(client, catalog)
+
+    assert response.status_code < 400, response.content
+    assert len(queries) <= budget, "\n".join(q["sql"] for q in queries.captured_queries)
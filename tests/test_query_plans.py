@@ -0,0 +1,136 @@
+"""
+Query plans of the hot queries.
+
+Each query mirrors one issued by quizzes/views.py, quizzes/signals.py and the
+jobs they feed, and must be answered from the named index. The plans come
+from EXPLAIN on a seeded dataset, after ANALYZE. Postgres is told to avoid
+sequential scans, because on a small test table one is cheaper anyway; the
+test asserts that the index can serve the query, not that the planner
+prefers it at this size.
+
+Paged list endpoints are checked on the page query their view actually
+issues, which must also not read, sort or group every matching row before
+its LIMIT.
+"""
+import pytest
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from quizzes.models import Category, Choice, Question, Quiz, TakenQuiz
+
+USERS = 50
+QUIZZES = 20
+
+
+@pytest.fixture
+def dataset(db):
+    categories = Category.objects.bulk_create(Category(name=f"Category {i}", slug=f"category-{i}") for i in range(4))
+    quizzes = Quiz.objects.bulk_create(
+        Quiz(title=f"Quiz {i}", description="", category=categories[i % 4], is_active=i % 5 != 0)
+        for i in range(QUIZZES)
+    )
+    questions = Question.objects.bulk_create(
+        Question(quiz=quiz, text=f"Question {q}", order=q) for quiz in quizzes for q in range(5)
+    )
+    Choice.objects.bulk_create(
+        Choice(question=question, text=f"Choice {c}", is_correct=c == 0) for question in questions for c in range(4)
+    )
+    users = User.objects.bulk_create(User(email=f"u{i}@example.com", username=f"user{i}") for i in range(USERS))
+    now = timezone.now()
+    TakenQuiz.objects.bulk_create(
+        TakenQuiz(
+            user=user, quiz=quizzes[(i + u) % QUIZZES], started_at=now,
+            # Every fifth attempt is still ongoing.
+            score=None if i % 5 == 0 else float(i * 10 % 101),
+        )
+        for u, user in enumerate(users) for i in range(20)
+    )
+
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    return {"user": users[0], "users": users[:10], "quiz": quizzes[1], "category": categories[1]}
+
+
+def plan(queryset):
+    return queryset.explain()
+
+
+def plan_sql(sql):
+    """The plan of raw SQL, as captured from a request."""
+    prefix = "EXPLAIN QUERY PLAN " if connection.vendor == 'sqlite' else "EXPLAIN "
+    with connection.cursor() as cursor:
+        cursor.execute(prefix + sql)
+        return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+
+
+# Plan steps that mean every matching row is read and sorted or grouped before the LIMIT.
+FULL_PASS_STEPS = {
+    'sqlite': ("TEMP B-TREE",),
+    'postgresql': ("Sort", "HashAggregate", "GroupAggregate"),
+}
+
+
+# name -> (index, queryset builder)
+QUERIES = {
+    # TakenQuizListView: a user's history, newest first.
+    "history": ("takenquiz_user_history_idx", lambda data: TakenQuiz.objects.filter(
+        user=data["user"]).order_by('-completed_at', '-id')[:20]),
+    # QuizDetailView's prefetch and the answer key's question count.
+    "quiz questions": ("question_quiz_order_idx", lambda data: Question.objects.filter(
+        quiz_id__in=[data["quiz"].id]).order_by('order')),
+    # quizzes.stats.reconcile_stats, after the profile stats signal drifts.
+    "scored attempts per user": ("takenquiz_user_scored_idx", lambda data: TakenQuiz.objects.filter(
+        user_id__in=[user.id for user in data["users"]], score__isnull=False,
+    ).order_by().values('user_id').annotate(count=Count('id'))),
+    # quizzes.achievements.backfill_achievements: users with a perfect score.
+    "perfect scores": ("takenquiz_user_scored_idx", lambda data: TakenQuiz.objects.filter(
+        user_id__in=[user.id for user in data["users"]], score__gte=100.0,
+    ).order_by().values_list('user_id', flat=True).distinct()),
+    # quizzes.analysis.analyze_quiz: a quiz's scored attempts.
+    "scored attempts per quiz": ("takenquiz_quiz_scored_idx", lambda data: TakenQuiz.objects.filter(
+        quiz=data["quiz"], score__isnull=False, choice_ids__isnull=False,
+    ).values_list('choice_ids', flat=True)),
+}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('name', QUERIES)
+def test_query_uses_index(dataset, name):
+    index, build = QUERIES[name]
+    explained = plan(build(dataset))
+
+    assert index in explained, f"{name} does not use {index}:\n{explained}"
+
+
+# name -> (index, URL builder): paged list endpoints, checked on the page query the view issues.
+VIEW_QUERIES = {
+    # QuizListView: active quizzes, newest first.
+    "quiz list": ("quiz_active_created_idx", lambda data: reverse('quiz-list', kwargs={'version': 'v1'})),
+    # QuizListView with ?category=.
+    "quiz list by category": ("quiz_category_active_idx", lambda data: (
+        reverse('quiz-list', kwargs={'version': 'v1'}) + f"?category={data['category'].slug}"
+    )),
+}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('name', VIEW_QUERIES)
+def test_view_page_query_is_an_index_range_scan(dataset, name):
+    index, build = VIEW_QUERIES[name]
+    with CaptureQueriesContext(connection) as queries:
+        response = APIClient().get(build(dataset))
+    assert response.status_code == 200
+    page_queries = [query['sql'] for query in queries if 'LIMIT' in query['sql'].upper()]
+    assert len(page_queries) == 1
+    explained = plan_sql(page_queries[0])
+
+    assert index in explained, f"{name} does not use {index}:\n{explained}"
+    for step in FULL_PASS_STEPS.get(connection.vendor, ()):
+        assert step not in explained, f"{name} reads every matching row ({step}):\n{explained}"
@@ -0,0 +1,107 @@
+"""
+Parity of the `.values()` fast path with the DRF serializers it replaces.
+
+Each case renders the same rows through `Serializer(many=True)` and through
+`ValuesSerializer` and compares the JSON bytes.
+"""
+from datetime import timedelta
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory
+
+from accounts.models import Achievement, User
+from accounts.serializers import AchievementSerializer, UserAchievementSerializer
+from core.fast_serializers import ValuesSerializer
+from quizzes.models import Category, Question, Quiz, TakenQuiz
+from quizzes.serializers import CategorySerializer, QuizSerializer, TakenQuizSerializer
+
+
+def render_both(serializer_class, queryset):
+    request = APIRequestFactory().get('/')
+    slow = serializer_class(queryset, many=True, context={'request': request}).data
+    fast_serializer = ValuesSerializer(serializer_class)
+    fast = fast_serializer.serialize(queryset.values(*fast_serializer.lookups), request)
+    return JSONRenderer().render(slow), JSONRenderer().render(fast)
+
+
+@pytest.fixture
+def rows(db):
+    user = User.objects.create_user(email="fast@example.com", username="fäst", password="pass12345")
+    science = Category.objects.create(name="Science 🔬", slug="science", icon="category_icons/atom.png")
+    Category.objects.create(name="Empty", slug="empty", description="No icon")
+    quiz = Quiz.objects.create(title="Física", description="ünïcode", category=science)
+    orphan = Quiz.objects.create(title="No category", description="")
+    Question.objects.create(quiz=quiz, text="Q1", order=1)
+
+    started = timezone.now().replace(microsecond=123456)
+    TakenQuiz.objects.create(
+        user=user, quiz=quiz, started_at=started, score=87.5, total_questions=1, correct_answers=1,
+        completed_at=started + timedelta(seconds=90, microseconds=7), duration=timedelta(seconds=90),
+    )
+    TakenQuiz.objects.create(user=user, quiz=orphan, started_at=started)
+    Achievement.objects.create(name="First", description="", badge_type="rare", icon="badges/first.png")
+    return user
+
+
+@pytest.mark.django_db
+class TestValuesSerializerParity:
+    def test_category_serializer(self, rows):
+        slow, fast = render_both(CategorySerializer, Category.objects.with_quiz_count().order_by('id'))
+        assert fast == slow
+
+    def test_quiz_serializer(self, rows):
+        slow, fast = render_both(
+            QuizSerializer, Quiz.objects.select_related('category').with_question_count().order_by('id')
+        )
+        assert fast == slow
+
+    def test_taken_quiz_serializer(self, rows):
+        slow, fast = render_both(TakenQuizSerializer, TakenQuiz.objects.select_related('quiz', 'user'))
+        assert fast == slow
+
+    def test_achievement_serializer(self, rows):
+        slow, fast = render_both(AchievementSerializer, Achievement.objects.order_by('id'))
+        assert fast == slow
+
+    def test_nested_serializers_are_rejected(self):
+        with pytest.raises(ImproperlyConfigured):
+            ValuesSerializer(UserAchievementSerializer).lookups
+
+    def test_method_fields_are_rejected(self):
+        class MethodSerializer(serializers.ModelSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Category
+                fields = ('id', 'label')
+
+        with pytest.raises(ImproperlyConfigured):
+            ValuesSerializer(MethodSerializer).lookups
+
+
+@pytest.mark.django_db
+class TestValuesListViews:
+    def test_quiz_list_pages_from_values_rows(self, rows):
+        Quiz.objects.bulk_create(Quiz(title=f"Extra {i}", description="") for i in range(3))
+        client = APIClient()
+        url = reverse('quiz-list', kwargs={'version': 'v1'})
+
+        first = client.get(url, {'page_size': 2})
+        second = client.get(first.data['next'])
+
+        assert first.status_code == 200
+        assert len(first.data['results']) == 2
+        titles = [item['title'] for item in first.data['results'] + second.data['results']]
+        assert titles == list(Quiz.objects.order_by('-created_at', '-id').values_list('title', flat=True)[:4])
+
+    def test_search_results_keep_rank_order(self, rows):
+        response = APIClient().get(reverse('quiz-list', kwargs={'version': 'v1'}), {'search': 'física'})
+
+        assert response.status_code == 200
+        assert [item['title'] for item in response.data['results']] == ["Física"]
+        assert 'search_rank' not in response.data['results'][0]